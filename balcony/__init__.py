@@ -21,16 +21,28 @@ sys.path.append(os.path.dirname(os.path.realpath(__file__)))
 # TODO: Fix this import mess
 try:
     from .aws import BalconyAWS
+    from .async_aws import AsyncBalconyAWS
+    from .accounts import MultiAccountBalconyAWS
     from .config import get_rich_console, get_logger
     from .nodes import ServiceNode, ResourceNode
     from .reader import ServiceReader
+    from .async_reader import AsyncServiceReader
+    from .response_cache import ResponseCache
+    from .rate_limiter import RateLimiterRegistry, AdaptiveRateLimiter
     from .relations import RelationMap
+    from .pattern_matcher import PatternMatcher
     from .errors import Error
 except ImportError:
     # print('ImportError: balcony/__init__.py')
     from aws import BalconyAWS
+    from async_aws import AsyncBalconyAWS
+    from accounts import MultiAccountBalconyAWS
     from config import get_rich_console, get_logger
     from nodes import ServiceNode, ResourceNode
     from reader import ServiceReader
+    from async_reader import AsyncServiceReader
+    from response_cache import ResponseCache
+    from rate_limiter import RateLimiterRegistry, AdaptiveRateLimiter
     from relations import RelationMap
+    from pattern_matcher import PatternMatcher
     from errors import Error
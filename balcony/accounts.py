@@ -0,0 +1,282 @@
+from config import get_logger
+from aws import BalconyAWS
+from reader import REFRESH_POLICY_ALL
+from utils import _create_boto_session
+from rate_limiter import RateLimiterRegistry
+
+from botocore.credentials import DeferredRefreshableCredentials
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Union, Dict, Callable
+import boto3
+import botocore.session
+import threading
+
+logger = get_logger(__name__)
+
+
+def is_role_arn(account: str) -> bool:
+    """Checks if the account is given as an IAM Role ARN, otherwise it's an AWS profile name."""
+    return account.startswith("arn:") and ":role/" in account
+
+
+class MultiAccountBalconyAWS:
+    """Reads multiple AWS accounts concurrently, given as IAM Role ARNs to assume or AWS profile names.
+
+    Service models, ResourceNodes and RelationMaps don't depend on the account, so they're created
+    once and shared by the `BalconyAWS` objects of all accounts. Assumed role credentials are cached
+    and refreshed before they expire.
+
+    ```python title="Reading the IAM Roles of multiple accounts"
+    mbaws = MultiAccountBalconyAWS(
+        [
+            "arn:aws:iam::111111111111:role/OrganizationAccountAccessRole",
+            "arn:aws:iam::222222222222:role/OrganizationAccountAccessRole",
+            "my-profile",
+        ],
+        max_workers=8,
+    )
+    roles_by_account = mbaws.read_resource_node('iam', 'Role', follow_pagination=True)
+    ```
+    """
+
+    def __init__(
+        self,
+        accounts: List[str],
+        boto3_session: Optional[boto3.session.Session] = None,
+        max_workers: Optional[int] = 8,
+        role_session_name: Optional[str] = "balcony",
+        external_id: Optional[str] = None,
+        region_name: Optional[str] = None,
+        **balcony_aws_kwargs,
+    ):
+        """Initializes this object with the accounts to read.
+
+        Args:
+            accounts (List[str]): IAM Role ARNs to assume, or AWS profile names.
+            boto3_session (Optional[boto3.session.Session], optional): Session to assume the roles with. If not given,
+                                                                        default Session will be used.
+            max_workers (Optional[int], optional): Number of accounts read concurrently. Defaults to 8.
+            role_session_name (Optional[str], optional): RoleSessionName of the assumed roles. Defaults to "balcony".
+            external_id (Optional[str], optional): ExternalId of the assumed roles. Defaults to None.
+            region_name (Optional[str], optional): Region of the accounts. Defaults to the region of the `boto3_session`.
+            **balcony_aws_kwargs: Passed to each `BalconyAWS`, e.g. `merge_pages` or `response_cache`.
+        """
+        self.accounts = list(dict.fromkeys(accounts))
+        self.boto3_session = boto3_session
+        if boto3_session is None:
+            self.boto3_session = _create_boto_session()
+        self.max_workers = max_workers if max_workers and max_workers > 1 else 1
+        self.role_session_name = role_session_name
+        self.external_id = external_id
+        self.region_name = region_name or self.boto3_session.region_name
+        self.balcony_aws_kwargs = balcony_aws_kwargs
+
+        # ServiceNodes of this object are the models shared by all accounts, they don't make api calls
+        self.shared_balcony_aws = BalconyAWS(self.boto3_session, **balcony_aws_kwargs)
+        # Stores the created BalconyAWS objects by their accounts
+        self._balcony_aws_map: Dict[str, BalconyAWS] = {}
+        self._balcony_aws_lock = threading.Lock()
+
+    def _assume_role_credentials(self, role_arn: str) -> DeferredRefreshableCredentials:
+        """Creates the credentials of the role. The role is assumed on first use, and again before the credentials expire.
+
+        Args:
+            role_arn (str): ARN of the IAM Role
+
+        Returns:
+            DeferredRefreshableCredentials: botocore credentials
+        """
+        sts_client = self.boto3_session.client("sts")
+
+        def _assume_role() -> Dict:
+            assume_role_kwargs = {
+                "RoleArn": role_arn,
+                "RoleSessionName": self.role_session_name,
+            }
+            if self.external_id:
+                assume_role_kwargs["ExternalId"] = self.external_id
+            logger.debug(f"Assuming the role [bold]{role_arn}[/]")
+            credentials = sts_client.assume_role(**assume_role_kwargs)["Credentials"]
+            return {
+                "access_key": credentials["AccessKeyId"],
+                "secret_key": credentials["SecretAccessKey"],
+                "token": credentials["SessionToken"],
+                "expiry_time": credentials["Expiration"].isoformat(),
+            }
+
+        return DeferredRefreshableCredentials(
+            refresh_using=_assume_role, method="sts-assume-role"
+        )
+
+    def _create_session(self, account: str) -> boto3.session.Session:
+        """Creates the boto3 session of the account. botocore's data loader is shared with the `boto3_session`,
+        so the service models are loaded from the disk only once.
+
+        Args:
+            account (str): IAM Role ARN or AWS profile name
+
+        Returns:
+            boto3.session.Session: boto3 session of the account
+        """
+        if is_role_arn(account):
+            botocore_session = botocore.session.Session()
+            botocore_session._credentials = self._assume_role_credentials(account)
+            session = boto3.session.Session(
+                botocore_session=botocore_session, region_name=self.region_name
+            )
+        else:
+            session = boto3.session.Session(
+                profile_name=account, region_name=self.region_name
+            )
+        session._session.register_component(
+            "data_loader", self.boto3_session._session.get_component("data_loader")
+        )
+        return session
+
+    def get_balcony_aws(self, account: str) -> BalconyAWS:
+        """Gets or creates the BalconyAWS of the account.
+
+        Args:
+            account (str): IAM Role ARN or AWS profile name
+
+        Returns:
+            BalconyAWS: BalconyAWS object of the account
+        """
+        with self._balcony_aws_lock:
+            if account not in self._balcony_aws_map:
+                balcony_aws_kwargs = dict(self.balcony_aws_kwargs)
+                rate_limiters = balcony_aws_kwargs.get("rate_limiters")
+                if rate_limiters is not None:
+                    # accounts are throttled separately, each one gets its own limiters
+                    balcony_aws_kwargs["rate_limiters"] = RateLimiterRegistry(
+                        **rate_limiters.rate_limiter_kwargs
+                    )
+                self._balcony_aws_map[account] = BalconyAWS(
+                    self._create_session(account),
+                    shared_from=self.shared_balcony_aws,
+                    **balcony_aws_kwargs,
+                )
+            return self._balcony_aws_map[account]
+
+    def _read_accounts(
+        self, read_func: Callable[[BalconyAWS], Union[dict, bool]]
+    ) -> Dict[str, Union[dict, bool]]:
+        """Calls `read_func` with the BalconyAWS of each account concurrently.
+        Accounts that fail, e.g. the role can't be assumed, have `False` as their data.
+
+        Args:
+            read_func (Callable[[BalconyAWS], Union[dict, bool]]): Reads the data with the given BalconyAWS
+
+        Returns:
+            Dict[str, Union[dict, bool]]: account to read data mapping
+        """
+
+        def _read_account(account: str) -> Union[dict, bool]:
+            try:
+                return read_func(self.get_balcony_aws(account))
+            except Exception as e:
+                logger.debug(f"[red]Failed to read the account[/] [bold]{account}[/]: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            read_data = list(executor.map(_read_account, self.accounts))
+        return dict(zip(self.accounts, read_data))
+
+    def read_operation(
+        self,
+        service_name: str,
+        resource_node_name: str,
+        operation_name: str,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        pipeline: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+        regions: Optional[List[str]] = None,
+    ) -> Dict[str, Union[dict, bool]]:
+        """Reads the operation in all accounts, see `BalconyAWS.read_operation`.
+
+        Returns:
+            Dict[str, Union[dict, bool]]: account to read Operation data mapping
+        """
+        return self._read_accounts(
+            lambda balcony_aws: balcony_aws.read_operation(
+                service_name,
+                resource_node_name,
+                operation_name,
+                match_patterns,
+                refresh,
+                follow_pagination=follow_pagination,
+                max_workers=max_workers,
+                pipeline=pipeline,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
+                regions=regions,
+            )
+        )
+
+    def read_resource_node(
+        self,
+        service_name: str,
+        resource_node_name: str,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        pipeline: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+        regions: Optional[List[str]] = None,
+    ) -> Dict[str, Union[dict, bool]]:
+        """Reads the ResourceNode in all accounts, see `BalconyAWS.read_resource_node`.
+
+        Returns:
+            Dict[str, Union[dict, bool]]: account to read ResourceNode data mapping
+        """
+        return self._read_accounts(
+            lambda balcony_aws: balcony_aws.read_resource_node(
+                service_name,
+                resource_node_name,
+                match_patterns,
+                refresh=refresh,
+                follow_pagination=follow_pagination,
+                max_workers=max_workers,
+                pipeline=pipeline,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
+                regions=regions,
+            )
+        )
+
+    def read_service(
+        self,
+        service_name: str,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        pipeline: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+        regions: Optional[List[str]] = None,
+    ) -> Dict[str, Union[dict, bool]]:
+        """Reads all ResourceNodes of the service in all accounts, see `BalconyAWS.read_service`.
+
+        Returns:
+            Dict[str, Union[dict, bool]]: account to read data mapping
+        """
+        return self._read_accounts(
+            lambda balcony_aws: balcony_aws.read_service(
+                service_name,
+                match_patterns,
+                refresh=refresh,
+                follow_pagination=follow_pagination,
+                max_workers=max_workers,
+                pipeline=pipeline,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
+                regions=regions,
+            )
+        )
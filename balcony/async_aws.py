@@ -0,0 +1,177 @@
+from aws import BalconyAWS
+from async_reader import AsyncServiceReader
+from reader import REFRESH_POLICY_ALL
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Union, Dict
+import asyncio
+import boto3
+
+
+class AsyncBalconyAWS:
+    """asyncio interface of `BalconyAWS`.
+
+    Relations of the operations are followed on the event loop, so many reads can be awaited
+    concurrently. boto3 is blocking, the api calls run on a thread pool and at most
+    `max_concurrency` of them are in-flight at a time.
+
+    ```python title="Reading IAM Roles and S3 Buckets concurrently"
+    import asyncio
+    from balcony import AsyncBalconyAWS
+
+    async def main():
+        baws = AsyncBalconyAWS(max_concurrency=32)
+        roles, buckets = await asyncio.gather(
+            baws.read_resource_node('iam', 'Role', follow_pagination=True),
+            baws.read_resource_node('s3', 'Bucket'),
+        )
+        baws.close()
+
+    asyncio.run(main())
+    ```
+
+    The read data is shared with the underlying `BalconyAWS` object, `AsyncBalconyAWS.balcony_aws`.
+    """
+
+    def __init__(
+        self,
+        boto3_session: Optional[boto3.session.Session] = None,
+        max_concurrency: Optional[int] = 16,
+        **balcony_aws_kwargs,
+    ):
+        """Initializes this object with an optional `boto3.session.Session` object.
+
+        Args:
+            boto3_session (Optional[boto3.session.Session], optional): Custom boto3 Session object. If not given,
+                                                                        default Session will be used.
+            max_concurrency (Optional[int], optional): Maximum number of in-flight api calls. Defaults to 16.
+            **balcony_aws_kwargs: Passed to `BalconyAWS`, e.g. `merge_pages`, `response_cache` or `rate_limiters`.
+        """
+        self.balcony_aws = BalconyAWS(boto3_session, **balcony_aws_kwargs)
+        self.max_concurrency = max_concurrency if max_concurrency and max_concurrency > 1 else 1
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="balcony-async"
+        )
+        # Stores the created AsyncServiceReaders by their service names
+        self._async_service_readers: Dict[str, AsyncServiceReader] = {}
+        # semaphores are tied to the event loop they're used on
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+            # in-flight reads of the previous loop can't be awaited on this one
+            for async_service_reader in self._async_service_readers.values():
+                async_service_reader.semaphore = self._semaphore
+                async_service_reader._in_flight_reads.clear()
+        return self._semaphore
+
+    async def get_async_service_reader(self, service_name: str) -> Union[AsyncServiceReader, None]:
+        """Gets or creates the AsyncServiceReader of the ServiceNode.
+
+        Args:
+            service_name (str): Name of the AWS Service.
+
+        Returns:
+            Union[AsyncServiceReader, None]: AsyncServiceReader of the service, or None.
+        """
+        semaphore = self._get_semaphore()
+        async_service_reader = self._async_service_readers.get(service_name)
+        if async_service_reader is None:
+            # creating a ServiceNode loads the botocore models, it's blocking
+            loop = asyncio.get_running_loop()
+            service_reader = await loop.run_in_executor(
+                self.executor, self.balcony_aws.get_service_reader, service_name
+            )
+            if not service_reader:
+                return None
+            async_service_reader = self._async_service_readers.setdefault(
+                service_name, AsyncServiceReader(service_reader, self.executor, semaphore)
+            )
+        return async_service_reader
+
+    async def read_operation(
+        self,
+        service_name: str,
+        resource_node_name: str,
+        operation_name: str,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+    ) -> Union[dict, bool]:
+        """Call the AWS API operation for the given `service_name`, `resource_node_name` and `operation_name` values.
+
+        Args:
+            service_name (str): AWS Service name.
+            resource_node_name (str): AWS ResourceNode name
+            operation_name (str): AWS Read opeartion name
+            match_patterns (Optional[List[str]], optional): UNIX style patterns for generated required_parameters. Defaults to None.
+            refresh (Optional[bool], optional): Force to re-read instead of returning the data from cache.. Defaults to False.
+            follow_pagination (bool, optional): Follow pagination tokens. If not only set True, one page call will be made.
+            refresh_policy (Optional[str], optional): Which related operations are re-read with `refresh`:
+                                                      "all", "target" or "stale". Defaults to "all".
+            refresh_max_age (Optional[int], optional): With the "stale" policy, related operations read in the last
+                                                       `refresh_max_age` seconds are not re-read. Defaults to 0.
+
+        Returns:
+            Union[dict,bool]: Read Operation data, or False.
+        """
+        async_service_reader = await self.get_async_service_reader(service_name)
+        if async_service_reader:
+            return await async_service_reader.read_operation(
+                resource_node_name,
+                operation_name,
+                match_patterns,
+                refresh,
+                follow_pagination=follow_pagination,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
+            )
+        return False
+
+    async def read_resource_node(
+        self,
+        service_name: str,
+        resource_node_name: str,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+    ) -> Union[dict, bool]:
+        """Reads all available Read operations of the given ResourceNode concurrently.
+
+        Args:
+            service_name (str): Name of the AWS Service
+            resource_node_name (str): Name of the AWS Resource Node
+            match_patterns (Optional[List[str]], optional): UNIX style patterns for generated required_parameters. Defaults to None.
+            refresh (bool, optional): Force to re-read instead of returning the data from cache.. Defaults to False.
+            follow_pagination (bool, optional): Follow the pagination tokens if the output is truncated. Defaults to False.
+            refresh_policy (Optional[str], optional): Which related operations are re-read with `refresh`:
+                                                      "all", "target" or "stale". Defaults to "all".
+            refresh_max_age (Optional[int], optional): With the "stale" policy, related operations read in the last
+                                                       `refresh_max_age` seconds are not re-read. Defaults to 0.
+
+        Returns:
+            Union[dict,bool]: Read ResourceNode data or False
+        """
+        async_service_reader = await self.get_async_service_reader(service_name)
+        if async_service_reader:
+            return await async_service_reader.read_resource_node(
+                resource_node_name,
+                match_patterns,
+                refresh=refresh,
+                follow_pagination=follow_pagination,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
+            )
+        return False
+
+    def close(self) -> None:
+        """Shuts down the thread pool of the api calls."""
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,397 @@
+from config import get_logger
+from errors import Error
+from reader import (
+    ServiceReader,
+    api_parameters_match_pattern,
+    READ_STATE_FAILED,
+    REFRESH_POLICY_ALL,
+)
+from utils import inform_about_developing_custom_resource_nodes
+import asyncio
+import contextvars
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from typing import List, Dict, Tuple, Optional, Union, Callable
+
+logger = get_logger(__name__)
+
+# keys of the reads on the current await chain, the relations are read in the context of the operation reading them
+_read_chain: contextvars.ContextVar = contextvars.ContextVar("balcony_async_read_chain", default=())
+
+
+class AsyncServiceReader:
+    """Reads the operations of a ServiceNode on an asyncio event loop.
+
+    Relations are followed with coroutines, so independent relations and api calls run concurrently.
+    Blocking boto3 calls run on the given executor, and at most `max_concurrency` of them are in-flight.
+
+    Read data, read-states, response cache and rate limiting are shared with the ServiceNodes `ServiceReader`,
+    so relations, YAML and custom ResourceNodes behave exactly like the synchronous reads.
+    """
+
+    def __init__(
+        self,
+        service_reader: ServiceReader,
+        executor: Executor,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Initializes the reader.
+
+        Args:
+            service_reader (ServiceReader): ServiceReader that saves the read data
+            executor (Executor): Executor to run the blocking calls on
+            semaphore (asyncio.Semaphore): Bounds the number of in-flight api calls
+        """
+        self.service_reader = service_reader
+        self.service_node = service_reader.service_node
+        self.executor = executor
+        self.semaphore = semaphore
+        # reads of the same operation wait for the first one
+        self._in_flight_reads: Dict[Tuple, asyncio.Future] = {}
+        # in-flight read key -> its await chain, including itself
+        self._in_flight_chains: Dict[Tuple, Tuple] = {}
+        # in-flight read key -> keys of the other in-flight reads it waits for
+        self._awaited_reads: Dict[Tuple, set] = {}
+
+    def _get_read_dependencies(self, key: Tuple) -> set:
+        """Finds the in-flight reads the read of `key` is waiting for, directly or through its relations."""
+        dependencies = set()
+        keys_to_visit = [key]
+        while keys_to_visit:
+            current_key = keys_to_visit.pop()
+            waited_keys = set(self._awaited_reads.get(current_key, ()))
+            # relations started by the read
+            waited_keys.update(
+                in_flight_key
+                for in_flight_key, chain in self._in_flight_chains.items()
+                if len(chain) > 1 and chain[-2] == current_key
+            )
+            for waited_key in waited_keys - dependencies:
+                dependencies.add(waited_key)
+                keys_to_visit.append(waited_key)
+        return dependencies
+
+    def _cyclic_relations_error(self, resource_node_name: str, operation_name: str) -> Error:
+        logger.debug(
+            f"[red]Cyclic relations found[/] for [green]{resource_node_name}[/].[blue]{operation_name}[/]"
+        )
+        return Error(
+            "cyclic relations",
+            {
+                "service": self.service_node.name,
+                "resource_node": resource_node_name,
+                "operation_name": operation_name,
+            },
+        )
+
+    async def _run_blocking(self, func: Callable, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def call_operation(
+        self,
+        resource_node: "ResourceNode",
+        operation_name: str,
+        api_parameter: Dict,
+        follow_pagination: Optional[bool] = False,
+    ) -> Union[dict, bool]:
+        """Calls the operation with `api_parameter` on the executor, see `ServiceReader.call_operation`.
+
+        Args:
+            resource_node (ResourceNode): Operations Resource Node
+            operation_name (str): Name of the operation
+            api_parameter (Dict): dictionary to call the operation with
+            follow_pagination (Optional[bool], optional): Follow the pagination tokens. Defaults to False.
+
+        Returns:
+            Union[dict, bool]: `False` or response got from AWS API
+        """
+        async with self.semaphore:
+            return await self._run_blocking(
+                self.service_reader.call_operation,
+                resource_node,
+                operation_name,
+                api_parameter,
+                follow_pagination,
+            )
+
+    async def read_operation(
+        self,
+        resource_node_name: str,
+        operation_name: str,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+    ) -> Tuple[Union[List, bool], Union[Error, None]]:
+        """Reads the given operation, see `ServiceReader.read_operation`.
+
+        Args:
+            resource_node_name (str): Name of the Resource Node
+            operation_name (str): Name of the Operation
+            match_patterns (List[str], optional): UNIX style patterns to filter matching generated parameters. Defaults to None.
+            refresh (bool, optional): Get the cached data or force re-reading the operation. Defaults to False.
+            follow_pagination (bool, optional): Follow pagination tokens. Defaults to False.
+            refresh_policy (str, optional): Which relations are re-read with `refresh`. Defaults to `REFRESH_POLICY_ALL`.
+            refresh_max_age (int, optional): Seconds the relations are fresh for `REFRESH_POLICY_STALE`. Defaults to 0.
+
+        Returns:
+            Tuple[Union[List, bool], Union[Error, None]]: Operations data, False or a (False, Error) tuple.
+        """
+        key = (
+            resource_node_name,
+            operation_name,
+            tuple(match_patterns or ()),
+            bool(follow_pagination),
+        )
+        read_chain = _read_chain.get()
+        if key in read_chain:
+            # reading itself through its relations would wait for its own result
+            return False, self._cyclic_relations_error(resource_node_name, operation_name)
+        in_flight_read = self._in_flight_reads.get(key)
+        if in_flight_read is not None:
+            if read_chain and self._get_read_dependencies(key).intersection(read_chain):
+                # the in-flight read is waiting for a read on this chain
+                return False, self._cyclic_relations_error(resource_node_name, operation_name)
+            if not read_chain:
+                return await asyncio.shield(in_flight_read)
+            awaited_reads = self._awaited_reads.setdefault(read_chain[-1], set())
+            awaited_reads.add(key)
+            try:
+                return await asyncio.shield(in_flight_read)
+            finally:
+                awaited_reads.discard(key)
+
+        in_flight_read = asyncio.get_running_loop().create_future()
+        self._in_flight_reads[key] = in_flight_read
+        self._in_flight_chains[key] = read_chain + (key,)
+        read_chain_token = _read_chain.set(read_chain + (key,))
+        try:
+            result = await self._read_operation(
+                resource_node_name,
+                operation_name,
+                match_patterns=match_patterns,
+                refresh=refresh,
+                follow_pagination=follow_pagination,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
+            )
+            result = self.service_reader.set_operation_read_state(
+                resource_node_name, operation_name, result, match_patterns
+            )
+            in_flight_read.set_result(result)
+            return result
+        except BaseException as e:
+            in_flight_read.set_exception(e)
+            # the exception is raised here, waiting reads get it from the future
+            in_flight_read.exception()
+            raise
+        finally:
+            _read_chain.reset(read_chain_token)
+            self._in_flight_reads.pop(key, None)
+            self._in_flight_chains.pop(key, None)
+            self._awaited_reads.pop(key, None)
+
+    async def _read_operation(
+        self,
+        resource_node_name: str,
+        operation_name: str,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+    ) -> Tuple[Union[List, bool], Union[Error, None]]:
+        service_reader = self.service_reader
+        operation_markup = (
+            f"[bold][green]{self.service_node.name}[/].[blue]{operation_name}[/][/]"
+        )
+        logger.debug(f"[underline][bold]Reading[/] {operation_markup}[/] asynchronously")
+
+        resource_node = self.service_node.get_resource_node_by_name(resource_node_name)
+        if not resource_node:
+            logger.debug(
+                f"Failed to find the Resource Node while reading the {operation_markup}."
+            )
+            return None
+
+        if service_reader.bulk_read and not match_patterns:
+            bulk_read = await self._run_blocking(
+                service_reader.read_in_bulk, resource_node.name, operation_name, refresh
+            )
+            if bulk_read:
+                refresh = False
+
+        if refresh == True:  # noqa
+            await self._run_blocking(
+                service_reader.clear_operations_data, resource_node_name, operation_name
+            )
+        else:
+            read_state = service_reader.get_read_state(resource_node_name, operation_name)
+            already_existing_data = service_reader.search_operation_data(
+                resource_node.name, operation_name
+            )
+            if read_state and read_state.state == READ_STATE_FAILED:
+                return False, read_state.error
+            if read_state or already_existing_data:
+                logger.debug(
+                    f"[green]{resource_node.name}[/].[blue]{operation_name}[/] is already read. Returning already available data."
+                )
+                return already_existing_data or []
+
+        # relations may be generated for the first time, it's blocking
+        relations_of_operation, relations_error = await self._run_blocking(
+            resource_node.get_operations_relations, operation_name
+        )
+        if relations_error is not None:
+            logger.debug(f"[red]Error: {relations_error}: {operation_markup}")
+            inform_about_developing_custom_resource_nodes()
+            return False, relations_error
+
+        if relations_of_operation == True:  # noqa
+            # True means no required parameters, so no relations
+            generated_api_parameters, generation_error = await self._run_blocking(
+                resource_node.generate_api_parameters_from_operation_data,
+                operation_name,
+                [],
+                {},
+            )
+            if generation_error is not None:
+                logger.debug(
+                    f"Failed to generate api parameters for {operation_markup}. Error: {generation_error}"
+                )
+                inform_about_developing_custom_resource_nodes()
+                return False, generation_error
+            # server-side filters replace the patterns they're translated from
+            generated_api_parameters, match_patterns = service_reader.add_server_side_filters(
+                resource_node, operation_name, generated_api_parameters, match_patterns
+            )
+        else:
+            # independent relations are read concurrently
+            related_reads = [
+                self.read_operation(
+                    rel.resource_node_name,
+                    rel.operation_name,
+                    refresh=service_reader.should_refresh_relation(
+                        rel.resource_node_name,
+                        rel.operation_name,
+                        refresh,
+                        refresh_policy,
+                        refresh_max_age,
+                    ),
+                    follow_pagination=follow_pagination,
+                    refresh_policy=refresh_policy,
+                    refresh_max_age=refresh_max_age,
+                )
+                for rel in relations_of_operation
+            ]
+            all_related_operations_data = {}
+            for rel, rel_operation_data in zip(
+                relations_of_operation, await asyncio.gather(*related_reads)
+            ):
+                rel_error = None
+                if isinstance(rel_operation_data, tuple):
+                    # failed reads return a (value, error) tuple
+                    rel_operation_data, rel_error = rel_operation_data
+                if not rel_operation_data and service_reader.is_operation_read_empty(
+                    rel.resource_node_name, rel.operation_name
+                ):
+                    logger.debug(
+                        f"There are no related resources in [blue]{rel.resource_node_name}.{rel.operation_name}[/] to read {operation_markup}."
+                    )
+                    return []
+                if not rel_operation_data:
+                    logger.debug(
+                        f"[red]Failed to read related operation[/]: {rel.resource_node_name}.{rel.operation_name}"
+                    )
+                    inform_about_developing_custom_resource_nodes()
+                    if rel_error is not None:
+                        # e.g. cyclic relations
+                        return False, rel_error
+                    return False
+                all_related_operations_data.update({rel.operation_name: rel_operation_data})
+
+            if resource_node.is_operation_derived(operation_name):
+                # the responses are already in the related operations data
+                return await self._run_blocking(
+                    service_reader.save_derived_responses,
+                    resource_node,
+                    operation_name,
+                    all_related_operations_data,
+                    match_patterns,
+                )
+
+            generated_api_parameters, generation_error = await self._run_blocking(
+                resource_node.generate_api_parameters_from_operation_data,
+                operation_name,
+                relations_of_operation,
+                all_related_operations_data,
+            )
+            if generation_error is not None:
+                logger.debug(
+                    f"Failed to generate api parameters for {operation_markup}: {generation_error}"
+                )
+                inform_about_developing_custom_resource_nodes()
+                return False, generation_error
+
+        if isinstance(generated_api_parameters, Iterable):
+            api_parameters_for_operation = service_reader.deduplicate_api_parameters(
+                api_parameters_match_pattern(generated_api_parameters, match_patterns)
+            )
+            logger.debug(
+                f"Calling {operation_markup} for {len(api_parameters_for_operation)} api parameters."
+            )
+            await asyncio.gather(
+                *[
+                    self.call_operation(
+                        resource_node, operation_name, api_parameter, follow_pagination
+                    )
+                    for api_parameter in api_parameters_for_operation
+                ]
+            )
+
+        logger.debug(f"[underline][bold]Done Reading[/] {operation_markup}[/]")
+        return service_reader.search_operation_data(resource_node_name, operation_name) or []
+
+    async def read_resource_node(
+        self,
+        resource_node_name: str,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+    ) -> Union[Dict, bool]:
+        """Reads all operations of the ResourceNode concurrently.
+
+        Args:
+            resource_node_name (str): Name of the Resource Node
+            match_patterns (List[str], optional): UNIX style patterns to filter the generated parameters. Defaults to None.
+            refresh (Optional[bool], optional): Use the cached data or always make new calls. Defaults to False.
+            follow_pagination (Optional[bool], optional): Follow pagination if the output is truncated. Defaults to False.
+            refresh_policy (str, optional): Which relations are re-read with `refresh`. Defaults to `REFRESH_POLICY_ALL`.
+            refresh_max_age (int, optional): Seconds the relations are fresh for `REFRESH_POLICY_STALE`. Defaults to 0.
+
+        Returns:
+            Union[Dict, bool]: Data read if successful, or False.
+        """
+        resource_node = self.service_node.get_resource_node_by_name(resource_node_name)
+        if not resource_node:
+            return False
+
+        await asyncio.gather(
+            *[
+                self.read_operation(
+                    resource_node.name,
+                    operation_name,
+                    match_patterns=match_patterns,
+                    refresh=refresh,
+                    follow_pagination=follow_pagination,
+                    refresh_policy=refresh_policy,
+                    refresh_max_age=refresh_max_age,
+                )
+                for operation_name in resource_node.operation_names
+            ]
+        )
+        return self.service_reader.search_resource_node_data(resource_node.name)
@@ -1,9 +1,15 @@
-from utils import get_all_available_services, _create_boto_session
+from config import GLOBAL_SERVICES, GLOBAL_REGION_NAME
+from utils import get_all_available_services, get_enabled_regions, _create_boto_session
 from nodes import ServiceNode
-from reader import ServiceReader
+from reader import ServiceReader, REFRESH_POLICY_ALL
+from response_cache import ResponseCache
+from rate_limiter import RateLimiterRegistry
+from scanner import scan_services
 
-from typing import Optional, List, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Union, Generator, Dict, Callable
 import boto3
+import threading
 
 
 class BalconyAWS:
@@ -33,22 +39,65 @@ class BalconyAWS:
     roles = baws.read_resource_node('iam', 'Role', follow_pagination=True)
     ```
 
+    A BalconyAWS object can be shared by multiple threads. Concurrent reads of the same operation
+    wait for the first one instead of calling the AWS APIs again.
+
+    ```python title="Reading EC2 Instances of multiple regions concurrently"
+    baws = BalconyAWS()
+    instances_by_region = baws.read_resource_node('ec2', 'Instances', regions=['us-east-1', 'eu-west-1'])
+    ```
     """
 
-    def __init__(self, boto3_session: Optional[boto3.session.Session] = None):
+    def __init__(
+        self,
+        boto3_session: Optional[boto3.session.Session] = None,
+        merge_pages: Optional[bool] = False,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limiters: Optional[RateLimiterRegistry] = None,
+        shared_from: Optional["BalconyAWS"] = None,
+        bulk_read: Optional[bool] = False,
+        lean_client: Optional[bool] = False,
+        raw_timestamps: Optional[bool] = False,
+        base64_blobs: Optional[bool] = False,
+    ):
         """Initializes this object with an optional `boto3.session.Session` object.
         If it's not provided, default boto3 session is created from the shell credentials.
 
         Args:
             boto3_session (Optional[boto3.session.Session], optional): Custom boto3 Session object. If not given,
                                                                         default Session will be used.
+            merge_pages (Optional[bool], optional): Store the pages of an api call as one merged response. Defaults to False.
+            response_cache (Optional[ResponseCache], optional): Persistent response cache shared by the ServiceReaders. Defaults to None.
+            rate_limiters (Optional[RateLimiterRegistry], optional): Adaptive rate limiters shared by the ServiceNodes.
+                                                                     Defaults to None, the api calls are not limited.
+            shared_from (Optional[BalconyAWS], optional): Share the ServiceNode models, ResourceNodes and RelationMaps
+                                                          of another BalconyAWS, e.g. of another account. Defaults to None.
+            bulk_read (Optional[bool], optional): Read the operations with the bulk api calls of the service if it has
+                                                  a `BulkReader`, e.g. iam `GetAccountAuthorizationDetails`. Defaults to False.
+            lean_client (Optional[bool], optional): Create the clients without the parameter validation and the builtin
+                                                    event handlers the generated api calls don't need. Defaults to False.
+            raw_timestamps (Optional[bool], optional): Keep the timestamps of the responses as strings instead of
+                                                       `datetime` objects. Defaults to False.
+            base64_blobs (Optional[bool], optional): Keep the blobs of the responses as base64 strings instead of
+                                                     `bytes`. Defaults to False.
         """
         self.boto3_session = boto3_session
+        self.merge_pages = merge_pages
+        self.response_cache = response_cache
+        self.rate_limiters = rate_limiters
+        self.shared_from = shared_from
+        self.bulk_read = bulk_read
+        self.lean_client = lean_client
+        self.raw_timestamps = raw_timestamps
+        self.base64_blobs = base64_blobs
         if boto3_session is None:
             self.boto3_session = _create_boto_session()
 
         # Stores the created ServiceNodes by their names
         self._service_nodes_map = {}
+        # Stores the ServiceNodes of the other regions by their (service name, region name)
+        self._regional_service_nodes_map = {}
+        self._service_nodes_lock = threading.Lock()
 
     def _create_service_node(self, service_name: str) -> None:
         """Creates the ServiceNode with the `self.boto3_session`
@@ -56,35 +105,115 @@ class BalconyAWS:
         Args:
             service_name (str): Name of the AWS Service
         """
-        service_node = ServiceNode(service_name, self.boto3_session)
+        if self.shared_from is not None:
+            # only the client and the reader are created for this session
+            shared_service_node = self.shared_from.get_service_node(service_name)
+            service_node = shared_service_node.for_session(
+                self.boto3_session, rate_limiters=self.rate_limiters
+            )
+            service_node.merge_pages = self.merge_pages
+            service_node.response_cache = self.response_cache
+            service_node.bulk_read = self.bulk_read
+        else:
+            service_node = ServiceNode(
+                service_name,
+                self.boto3_session,
+                merge_pages=self.merge_pages,
+                response_cache=self.response_cache,
+                rate_limiters=self.rate_limiters,
+                bulk_read=self.bulk_read,
+                lean_client=self.lean_client,
+                raw_timestamps=self.raw_timestamps,
+                base64_blobs=self.base64_blobs,
+            )
         self._service_nodes_map[service_name] = service_node
 
-    def get_service_node(self, service_name: str) -> ServiceNode:
+    def get_service_node(self, service_name: str, region_name: Optional[str] = None) -> ServiceNode:
         """Gets or creates the ServiceNode.
 
         Args:
             service_name (str): Name of the AWS Service.
+            region_name (Optional[str], optional): Region of the ServiceNode. Defaults to the region of the `boto3_session`.
 
         Returns:
             ServiceNode: ServiceNode object representing an AWS Service
         """
-        if service_name not in self._service_nodes_map:
-            self._create_service_node(service_name)
-        return self._service_nodes_map.get(service_name)
+        with self._service_nodes_lock:
+            if service_name not in self._service_nodes_map:
+                self._create_service_node(service_name)
+            service_node = self._service_nodes_map.get(service_name)
+            # global services like iam have a partition-wide region name, e.g. aws-global
+            default_region_names = (self.boto3_session.region_name, service_node.get_region_name())
+            if not region_name or region_name in default_region_names:
+                return service_node
+
+            key = (service_name, region_name)
+            if key not in self._regional_service_nodes_map:
+                # shares the service model, ResourceNodes and RelationMap of the default region
+                self._regional_service_nodes_map[key] = service_node.for_region(region_name)
+            return self._regional_service_nodes_map[key]
 
-    def get_service_reader(self, service_name: str) -> ServiceReader:
+    def get_service_reader(self, service_name: str, region_name: Optional[str] = None) -> ServiceReader:
         """Gets the ServiceReader obj from the ServiceNode obj.
 
         Args:
             service_name (str): Name of the AWS Service.
+            region_name (Optional[str], optional): Region of the ServiceNode. Defaults to the region of the `boto3_session`.
 
         Returns:
             ServiceReader: ServiceReader object with the read capabilities, tied to a ServiceNode.
         """
-        service_node = self.get_service_node(service_name)
+        service_node = self.get_service_node(service_name, region_name)
         if service_node:
             return service_node.get_service_reader()
 
+    def get_regions(self, service_name: str, regions: List[str]) -> List[str]:
+        """Resolves the regions to read the service in. `all` is expanded to the enabled regions of the service.
+
+        Args:
+            service_name (str): Name of the AWS Service.
+            regions (List[str]): Region names, or `["all"]`
+
+        Returns:
+            List[str]: Unique region names
+        """
+        resolved_regions = []
+        for region_name in regions:
+            if region_name == "all":
+                region_names = get_enabled_regions(self.boto3_session, service_name)
+            else:
+                region_names = [region_name]
+            for name in region_names:
+                if name not in resolved_regions:
+                    resolved_regions.append(name)
+        return resolved_regions
+
+    def _read_regions(
+        self, service_name: str, regions: List[str], read_func: Callable[[ServiceReader], Union[dict, bool]]
+    ) -> Dict[str, Union[dict, bool]]:
+        """Calls `read_func` with the ServiceReader of each region concurrently.
+        Global services are read once, their data is tagged with the `GLOBAL_REGION_NAME`.
+
+        Args:
+            service_name (str): Name of the AWS Service.
+            regions (List[str]): Region names, or `["all"]`
+            read_func (Callable[[ServiceReader], Union[dict, bool]]): Reads the data with the given ServiceReader
+
+        Returns:
+            Dict[str, Union[dict, bool]]: region name to read data mapping
+        """
+        if service_name in GLOBAL_SERVICES:
+            return {GLOBAL_REGION_NAME: read_func(self.get_service_reader(service_name))}
+
+        region_names = self.get_regions(service_name, regions)
+        if not region_names:
+            return {}
+        # ServiceNodes are created beforehand, so the shared parts are generated only once
+        service_readers = [self.get_service_reader(service_name, region_name) for region_name in region_names]
+        with ThreadPoolExecutor(max_workers=len(region_names)) as executor:
+            read_data = list(executor.map(read_func, service_readers))
+        return dict(zip(region_names, read_data))
+
     def read_operation(
         self,
         service_name: str,
@@ -93,6 +222,11 @@ class BalconyAWS:
         match_patterns: Optional[List[str]] = None,
         refresh: Optional[bool] = False,
         follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        pipeline: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+        regions: Optional[List[str]] = None,
     ) -> Union[dict, bool]:
         """Call the AWS API operation for the given `service_name`, `resource_node_name` and `operation_name` values.
 
@@ -103,22 +237,90 @@ class BalconyAWS:
             match_patterns (Optional[List[str]], optional): UNIX style patterns for generated required_parameters. Defaults to None.
             refresh (Optional[bool], optional): Force to re-read instead of returning the data from cache.. Defaults to False.
             follow_pagination (bool, optional): Follow pagination tokens. If not only set True, one page call will be made.
+            max_workers (Optional[int], optional): Number of concurrent calls made for the generated api parameters. Defaults to 1.
+            pipeline (Optional[bool], optional): Dispatch the dependent calls as soon as the related pages arrive. Defaults to False.
+            refresh_policy (Optional[str], optional): Which related operations are re-read with `refresh`:
+                                                      "all", "target" or "stale". Defaults to "all".
+            refresh_max_age (Optional[int], optional): With the "stale" policy, related operations read in the last
+                                                       `refresh_max_age` seconds are not re-read. Defaults to 0.
+            regions (Optional[List[str]], optional): Read the given regions concurrently and return the data by region name.
+                                                     `["all"]` reads all enabled regions, global services are read once. Defaults to None.
 
         Returns:
             Union[dict,bool]: Read Operation data, or False.
         """
-        service_reader = self.get_service_reader(service_name)
-        if service_reader:
-            data = service_reader.read_operation(
+
+        def _read(service_reader: ServiceReader) -> Union[dict, bool]:
+            return service_reader.read_operation(
                 resource_node_name,
                 operation_name,
                 match_patterns,
                 refresh,
                 follow_pagination=follow_pagination,
+                max_workers=max_workers,
+                pipeline=pipeline,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
             )
-            return data
+
+        if regions:
+            return self._read_regions(service_name, regions, _read)
+        service_reader = self.get_service_reader(service_name)
+        if service_reader:
+            return _read(service_reader)
         return False
 
+    def iter_operation_pages(
+        self,
+        service_name: str,
+        resource_node_name: str,
+        operation_name: str,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+    ) -> Generator[dict, None, None]:
+        """Yields the response pages of the AWS API operation as they're fetched, without keeping them in memory.
+
+        ```python title="Streaming all EC2 Instances"
+        baws = BalconyAWS()
+        for page in baws.iter_operation_pages('ec2', 'Instances', 'DescribeInstances', follow_pagination=True):
+            for reservation in page['Reservations']:
+                print(reservation['Instances'])
+        ```
+
+        Args:
+            service_name (str): AWS Service name.
+            resource_node_name (str): AWS ResourceNode name
+            operation_name (str): AWS Read opeartion name
+            match_patterns (Optional[List[str]], optional): UNIX style patterns for generated required_parameters. Defaults to None.
+            refresh (Optional[bool], optional): Force to re-read the operation and its related operations. Defaults to False.
+            follow_pagination (bool, optional): Follow pagination tokens. If not only set True, one page call will be made.
+            max_workers (Optional[int], optional): Number of concurrent calls. Pages of the concurrent calls are yielded
+                                                    in the order they arrive. Defaults to 1.
+            refresh_policy (Optional[str], optional): Which related operations are re-read with `refresh`:
+                                                      "all", "target" or "stale". Defaults to "all".
+            refresh_max_age (Optional[int], optional): With the "stale" policy, related operations read in the last
+                                                       `refresh_max_age` seconds are not re-read. Defaults to 0.
+
+        Yields:
+            dict: Response pages of the operation
+        """
+        service_reader = self.get_service_reader(service_name)
+        if service_reader:
+            yield from service_reader.iter_operation_pages(
+                resource_node_name,
+                operation_name,
+                match_patterns,
+                refresh=refresh,
+                follow_pagination=follow_pagination,
+                max_workers=max_workers,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
+            )
+
     def read_resource_node(
         self,
         service_name: str,
@@ -126,6 +328,11 @@ class BalconyAWS:
         match_patterns: Optional[List[str]] = None,
         refresh: Optional[bool] = False,
         follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        pipeline: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+        regions: Optional[List[str]] = None,
     ) -> Union[dict, bool]:
         """Reads all available Read operations of the given ResourceNode.
 
@@ -135,21 +342,136 @@ class BalconyAWS:
             match_patterns (Optional[List[str]], optional): UNIX style patterns for generated required_parameters. Defaults to None.
             refresh (bool, optional): Force to re-read instead of returning the data from cache.. Defaults to False.
             follow_pagination (bool, optional): Follow the pagination tokens if the output is truncated. Defaults to False.
+            max_workers (Optional[int], optional): Number of concurrent operations and calls made for the
+                                                    generated api parameters. Defaults to 1.
+            pipeline (Optional[bool], optional): Dispatch the dependent calls as soon as the related pages arrive. Defaults to False.
+            refresh_policy (Optional[str], optional): Which related operations are re-read with `refresh`:
+                                                      "all", "target" or "stale". Defaults to "all".
+            refresh_max_age (Optional[int], optional): With the "stale" policy, related operations read in the last
+                                                       `refresh_max_age` seconds are not re-read. Defaults to 0.
+            regions (Optional[List[str]], optional): Read the given regions concurrently and return the data by region name.
+                                                     `["all"]` reads all enabled regions, global services are read once. Defaults to None.
 
         Returns:
             Union[dict,bool]: Read ResourceNode data or False
         """
+
+        def _read(service_reader: ServiceReader) -> Union[dict, bool]:
+            return service_reader.read_resource_node(
+                resource_node_name,
+                match_patterns,
+                refresh=refresh,
+                follow_pagination=follow_pagination,
+                max_workers=max_workers,
+                pipeline=pipeline,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
+            )
+
+        if regions:
+            return self._read_regions(service_name, regions, _read)
         service_reader = self.get_service_reader(service_name)
         if service_reader:
-            data = service_reader.read_resource_node(
-                resource_node_name,
+            return _read(service_reader)
+        return False
+
+    def read_service(
+        self,
+        service_name: str,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        pipeline: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+        regions: Optional[List[str]] = None,
+    ) -> Union[dict, bool]:
+        """Reads all ResourceNodes of the given AWS Service using their dependency graph.
+
+        Args:
+            service_name (str): Name of the AWS Service
+            match_patterns (Optional[List[str]], optional): UNIX style patterns for generated required_parameters. Defaults to None.
+            refresh (bool, optional): Force to re-read instead of returning the data from cache.. Defaults to False.
+            follow_pagination (bool, optional): Follow the pagination tokens if the output is truncated. Defaults to False.
+            max_workers (Optional[int], optional): Number of concurrent operations and calls. Defaults to 1.
+            pipeline (Optional[bool], optional): Dispatch the dependent calls as soon as the related pages arrive. Defaults to False.
+            refresh_policy (Optional[str], optional): Which related operations are re-read with `refresh`:
+                                                      "all", "target" or "stale". Defaults to "all".
+            refresh_max_age (Optional[int], optional): With the "stale" policy, related operations read in the last
+                                                       `refresh_max_age` seconds are not re-read. Defaults to 0.
+            regions (Optional[List[str]], optional): Read the given regions concurrently and return the data by region name.
+                                                     `["all"]` reads all enabled regions, global services are read once. Defaults to None.
+
+        Returns:
+            Union[dict,bool]: Read data of all ResourceNodes or False
+        """
+
+        def _read(service_reader: ServiceReader) -> Union[dict, bool]:
+            data, _errors = service_reader.read_service(
                 match_patterns,
                 refresh=refresh,
                 follow_pagination=follow_pagination,
+                max_workers=max_workers,
+                pipeline=pipeline,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
             )
             return data
+
+        if regions:
+            return self._read_regions(service_name, regions, _read)
+        service_reader = self.get_service_reader(service_name)
+        if service_reader:
+            return _read(service_reader)
         return False
 
+    def scan(
+        self,
+        service_names: Optional[List[str]] = None,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 8,
+        max_processes: Optional[int] = None,
+        pipeline: Optional[bool] = False,
+    ) -> Dict[str, Dict]:
+        """Reads every ResourceNode of the given services. Services are distributed across a process pool,
+        and the operations of a service are read with `max_workers` threads in its process.
+
+        Errors are added to the data of each service by `ResourceNode.Operation` under the `__errors__` key.
+
+        ```python title="Scanning EC2 and Lambda"
+        baws = BalconyAWS()
+        scanned_data = baws.scan(['ec2', 'lambda'], follow_pagination=True)
+        print(scanned_data['ec2']['__errors__'])
+        ```
+
+        Args:
+            service_names (Optional[List[str]], optional): Names of the AWS Services. Defaults to all available services.
+            match_patterns (Optional[List[str]], optional): UNIX style patterns for generated required_parameters. Defaults to None.
+            refresh (Optional[bool], optional): Force to re-read instead of returning the data from cache. Defaults to False.
+            follow_pagination (Optional[bool], optional): Follow the pagination tokens if the output is truncated. Defaults to False.
+            max_workers (Optional[int], optional): Number of concurrent operations and calls in each process. Defaults to 8.
+            max_processes (Optional[int], optional): Number of processes. Defaults to the number of CPUs.
+            pipeline (Optional[bool], optional): Dispatch the dependent calls as soon as the related pages arrive. Defaults to False.
+
+        Returns:
+            Dict[str, Dict]: service name to read data mapping
+        """
+        if service_names is None:
+            service_names = self.get_available_service_names()
+        return scan_services(
+            self,
+            list(dict.fromkeys(service_names)),
+            max_processes=max_processes,
+            match_patterns=match_patterns,
+            refresh=refresh,
+            follow_pagination=follow_pagination,
+            max_workers=max_workers,
+            pipeline=pipeline,
+        )
+
     def get_available_service_names(self) -> List[str]:
         """Lists available AWS service namese
 
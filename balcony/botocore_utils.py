@@ -1,15 +1,156 @@
 from utils import icompare_two_camel_case_words
 from config import get_rich_console
 
-from typing import List, Union
+from typing import List, Union, Dict, Optional
 from botocore.model import Shape, DenormalizedStructureBuilder, OperationModel
+from botocore.client import BaseClient, Config
+from botocore.parsers import ResponseParserFactory
+from botocore import handlers
 from rich.markup import escape
 import re
+import jmespath
 from collections import namedtuple
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from rich.tree import Tree
 
 ShapeAndTargetPath = namedtuple("ShapeAndTargetPath", ["shape", "target_path"])
 
+
+def _as_list(value: Union[str, List[str], None]) -> List[str]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+@dataclass
+class PaginationConfig:
+    """Pagination definition of an operation, normalized from botocore's `paginators-1.json` models
+    or from a `{"parameter_name": "", "output_key": ""}` pagination token mapping.
+
+    `output_tokens` and `more_results` are JMESPath expressions evaluated on the response,
+    e.g. `DistributionList.NextMarker`.
+    """
+
+    input_tokens: List[str]
+    output_tokens: List[str]
+    more_results: Optional[str] = None
+    result_keys: List[str] = field(default_factory=list)
+    limit_key: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self._output_token_expressions = [
+            jmespath.compile(output_token) for output_token in self.output_tokens
+        ]
+        self._more_results_expression = (
+            jmespath.compile(self.more_results) if self.more_results else None
+        )
+
+    @classmethod
+    def from_paginator_model(cls, paginator: Dict) -> "PaginationConfig":
+        """Creates the PaginationConfig from a botocore paginator definition.
+
+        Args:
+            paginator (Dict): e.g. `{"input_token": "Marker", "output_token": "Marker", "limit_key": "MaxItems", "more_results": "IsTruncated", "result_key": "Roles"}`
+
+        Returns:
+            PaginationConfig: Normalized pagination definition
+        """
+        return cls(
+            input_tokens=_as_list(paginator.get("input_token")),
+            output_tokens=_as_list(paginator.get("output_token")),
+            more_results=paginator.get("more_results"),
+            result_keys=_as_list(paginator.get("result_key")),
+            limit_key=paginator.get("limit_key"),
+        )
+
+    @classmethod
+    def from_token_mapping(cls, token_mapping: Dict[str, str]) -> "PaginationConfig":
+        """Creates the PaginationConfig from a pagination token mapping.
+
+        Args:
+            token_mapping (Dict[str, str]): e.g. `{"parameter_name":"nextToken", "output_key": "NextToken"}`
+
+        Returns:
+            PaginationConfig: Normalized pagination definition
+        """
+        return cls(
+            input_tokens=[token_mapping.get("parameter_name")],
+            output_tokens=[token_mapping.get("output_key")],
+        )
+
+    def get_next_page_tokens(self, response: Dict) -> Union[Dict, bool]:
+        """Finds the pagination tokens to request the next page with.
+
+        Args:
+            response (Dict): Response page of the operation
+
+        Returns:
+            Union[Dict, bool]: input token to value mapping, or False if this is the last page.
+        """
+        if self._more_results_expression is not None:
+            if not self._more_results_expression.search(response):
+                return False
+        next_page_tokens = {
+            input_token: output_token_expression.search(response)
+            for input_token, output_token_expression in zip(
+                self.input_tokens, self._output_token_expressions
+            )
+        }
+        if not any(next_page_tokens.values()):
+            return False
+        return next_page_tokens
+
+    def merge_pages(self, pages: List[Dict]) -> Dict:
+        """Merges the response pages of a single api call into one response.
+        Lists under the `result_keys` are concatenated, the other fields are taken from the last page,
+        so the merged response doesn't have the pagination tokens. If there are no `result_keys`,
+        top level lists are concatenated.
+
+        Args:
+            pages (List[Dict]): Response pages in the order they're fetched
+
+        Returns:
+            Dict: Merged response with the `__args__` of the first page
+        """
+        merged_page = dict(pages[-1])
+        if "__args__" in pages[0]:
+            merged_page["__args__"] = pages[0]["__args__"]
+        if len(pages) == 1:
+            return merged_page
+
+        result_key_paths = [result_key.split(".") for result_key in self.result_keys]
+        if not result_key_paths:
+            result_key_paths = [
+                [key]
+                for key, value in merged_page.items()
+                if key != "__args__" and isinstance(value, list)
+            ]
+
+        for result_key_path in result_key_paths:
+            merged_results = []
+            for page in pages:
+                page_results = page
+                for key in result_key_path:
+                    page_results = (
+                        page_results.get(key) if isinstance(page_results, dict) else None
+                    )
+                if isinstance(page_results, list):
+                    merged_results.extend(page_results)
+
+            # copy the containers on the path, pages are not modified
+            container = merged_page
+            for key in result_key_path[:-1]:
+                child = container.get(key)
+                if not isinstance(child, dict):
+                    child = {}
+                container[key] = dict(child)
+                container = container[key]
+            container[result_key_path[-1]] = merged_results
+        return merged_page
+
 UNWANTED_SHAPE_NAMES = ("String", "DateTime", "Name", "Id", "Arn", "__string")
 UNWANTED_SHAPE_NAMES_LOWERED = [_.lower() for _ in UNWANTED_SHAPE_NAMES]
 SHAPE_SCALAR_TYPES = DenormalizedStructureBuilder.SCALAR_TYPES
@@ -134,6 +275,38 @@ def get_max_results_value_from_shape(input_shape: Shape) -> int:
     return False
 
 
+# documented max lengths of the list parameters that don't have the `max` metadata in their shapes
+KNOWN_LIST_PARAMETER_MAX_LENGTHS = {
+    ("ecs", "DescribeServices", "services"): 10,
+    ("ecs", "DescribeTasks", "tasks"): 100,
+    ("ecs", "DescribeClusters", "clusters"): 100,
+    ("ecs", "DescribeContainerInstances", "containerInstances"): 100,
+    ("elbv2", "DescribeTags", "ResourceArns"): 20,
+}
+
+
+def get_list_parameter_max_length(
+    service_name: str, operation_name: str, parameter_name: str, parameter_shape: Shape
+) -> Union[int, bool]:
+    """Finds how many items a list-typed parameter accepts, from its shapes `max` metadata or the documented limits.
+
+    Args:
+        service_name (str): Name of the AWS service
+        operation_name (str): Name of the operation
+        parameter_name (str): Name of the parameter, member of the operations input shape
+        parameter_shape (Shape): List shape of the parameter
+
+    Returns:
+        Union[int, bool]: Max length, or False if it's unknown.
+    """
+    max_length = parameter_shape.metadata.get("max", False)
+    if max_length:
+        return max_length
+    return KNOWN_LIST_PARAMETER_MAX_LENGTHS.get(
+        (service_name, operation_name, parameter_name), False
+    )
+
+
 def get_input_shape(operation_model: OperationModel) -> Shape:
     """Get the input shape of the operation model
 
@@ -422,3 +595,71 @@ def get_required_parameter_shapes_from_operation_model(
                 required_member_shapes.append(input_member)
 
     return required_member_shapes
+
+
+# api parameters are generated from the operation models, so botocore doesn't need to validate them again
+LEAN_CLIENT_CONFIG = Config(parameter_validation=False)
+
+# builtin botocore handlers that only validate the parameters, or are only needed by the write operations
+LEAN_CLIENT_UNNEEDED_HANDLERS = (
+    ("before-parameter-build", handlers.generate_idempotent_uuid),
+    ("before-parameter-build", handlers._handle_request_validation_mode_member),
+    ("before-parameter-build.s3", handlers.validate_bucket_name),
+    ("before-call", handlers.add_recursion_detection_header),
+    ("before-call.s3", handlers.add_expect_header),
+    ("request-created", handlers.add_retry_headers),
+)
+
+
+def remove_unneeded_client_handlers(client: BaseClient) -> None:
+    """Unregisters the `LEAN_CLIENT_UNNEEDED_HANDLERS` from the event system of the client.
+    Other clients of the session are not affected.
+
+    Args:
+        client (BaseClient): botocore client
+    """
+    for event_name, handler in LEAN_CLIENT_UNNEEDED_HANDLERS:
+        client.meta.events.unregister(event_name, handler)
+
+
+def parse_timestamp_as_string(value: Union[str, int, float]) -> str:
+    """Keeps the timestamps of the responses as they're sent, instead of parsing them to `datetime` objects.
+    Epoch timestamps of the json protocols are formatted as ISO 8601 strings.
+
+    Args:
+        value (Union[str, int, float]): Timestamp in the response
+
+    Returns:
+        str: Timestamp string
+    """
+    if isinstance(value, str):
+        return value
+    return datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
+
+
+def keep_blob_as_base64(value: str) -> str:
+    """Keeps the blobs of the responses as base64 strings, instead of decoding them to `bytes`."""
+    return value
+
+
+def set_client_response_parsing(
+    client: BaseClient, raw_timestamps: bool = False, base64_blobs: bool = False
+) -> None:
+    """Configures how the responses of the client are parsed. Other clients of the session are not affected.
+
+    Args:
+        client (BaseClient): botocore client
+        raw_timestamps (bool, optional): Keep the timestamps as strings. Defaults to False.
+        base64_blobs (bool, optional): Keep the blobs as base64 strings. Defaults to False.
+    """
+    parser_defaults = {}
+    if raw_timestamps:
+        parser_defaults["timestamp_parser"] = parse_timestamp_as_string
+    if base64_blobs:
+        parser_defaults["blob_parser"] = keep_blob_as_base64
+    if not parser_defaults:
+        return
+    response_parser_factory = ResponseParserFactory()
+    response_parser_factory.set_parser_defaults(**parser_defaults)
+    # responses are parsed by the endpoint of the client
+    client._endpoint._response_parser_factory = response_parser_factory
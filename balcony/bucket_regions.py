@@ -0,0 +1,58 @@
+from config import get_logger
+from typing import Dict, Union
+import threading
+
+logger = get_logger(__name__)
+
+# s3 operations that are not made for a single bucket, or that resolve the region of the bucket
+S3_NON_BUCKET_OPERATIONS = ("ListBuckets", "ListDirectoryBuckets", "HeadBucket", "CreateBucket")
+
+
+def get_bucket_region_from_response(response: dict) -> Union[str, None]:
+    """Finds the region of the bucket in a `HeadBucket` response. Failed calls, e.g. redirects or AccessDenied,
+    still have the region in their `x-amz-bucket-region` header.
+
+    Args:
+        response (dict): `HeadBucket` response, or the response of its `ClientError`
+
+    Returns:
+        Union[str, None]: Region of the bucket, or None if it's not in the response
+    """
+    if response.get("BucketRegion"):
+        return response["BucketRegion"]
+    http_headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+    return http_headers.get("x-amz-bucket-region")
+
+
+class BucketRegionCache:
+    """Caches the regions of the S3 buckets, so per-bucket api calls are made with the client of the bucket's region
+    instead of being redirected. Regions are learned from the `BucketRegion` of the `ListBuckets` responses,
+    or resolved with a `HeadBucket` call.
+    """
+
+    def __init__(self) -> None:
+        # bucket name -> region name
+        self._bucket_regions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, bucket_name: str) -> Union[str, None]:
+        with self._lock:
+            return self._bucket_regions.get(bucket_name)
+
+    def set(self, bucket_name: str, region_name: str) -> None:
+        with self._lock:
+            self._bucket_regions[bucket_name] = region_name
+
+    def add_response(self, operation_name: str, response: dict) -> None:
+        """Learns the regions of the buckets from a `ListBuckets` response, others are ignored.
+
+        Args:
+            operation_name (str): Name of the called operation
+            response (dict): boto API response
+        """
+        if operation_name != "ListBuckets":
+            return
+        with self._lock:
+            for bucket in response.get("Buckets", []):
+                if bucket.get("Name") and bucket.get("BucketRegion"):
+                    self._bucket_regions[bucket["Name"]] = bucket["BucketRegion"]
@@ -0,0 +1,71 @@
+from config import get_logger
+from abc import ABC, abstractmethod
+from typing import List, Dict, Tuple, Union
+
+logger = get_logger(__name__)
+
+# service name -> BulkReader subclass
+_bulk_reader_registry = {}
+
+
+class BulkReader(ABC):
+    """Reads the data of many operations of a service with a few bulk api calls,
+    e.g. iam `GetAccountAuthorizationDetails` instead of a `GetRolePolicy` call for each inline policy.
+
+    Subclasses are registered with their `service_name`, and used by the `ServiceReader` if its `bulk_read` is enabled.
+    Returned pages must have the same structure as the pages of the operations they replace, including their `__args__`.
+
+    ```python title="Defining a BulkReader"
+    class MyBulkReader(BulkReader, service_name="myservice"):
+        operation_keys = [("Thing", "ListThings"), ("Thing", "GetThing")]
+
+        def read(self, service_reader, refresh=False):
+            ...
+            return {("Thing", "ListThings"): [...], ("Thing", "GetThing"): [...]}
+    ```
+    """
+
+    # (resource_node_name, operation_name) of the operations the bulk reader satisfies
+    operation_keys: List[Tuple[str, str]] = []
+
+    def __init_subclass__(cls, service_name=None, **kwargs) -> None:
+        """Registers the subclasses of BulkReader by their `service_name`.
+
+        Args:
+            service_name (str, optional): Name of the AWS service. Defaults to None.
+        """
+        super().__init_subclass__(**kwargs)
+        if service_name:
+            _bulk_reader_registry[service_name] = cls
+        else:
+            logger.debug(f'{cls.__name__} invalid! You must define "service_name"')
+
+    @abstractmethod
+    def read(
+        self, service_reader: "ServiceReader", refresh: bool = False
+    ) -> Union[Dict[Tuple[str, str], List[dict]], bool]:
+        """Makes the bulk api calls with the `service_reader` and reshapes their output.
+
+        Args:
+            service_reader (ServiceReader): ServiceReader of the service
+            refresh (bool, optional): Re-make the bulk api calls instead of using their read data. Defaults to False.
+
+        Returns:
+            Union[Dict[Tuple[str, str], List[dict]], bool]: (resource_node_name, operation_name) to pages mapping,
+                                                             or False if the bulk calls failed.
+        """
+
+
+def find_bulk_reader(service_name: str) -> Union[BulkReader, None]:
+    """Finds the registered BulkReader of the service.
+
+    Args:
+        service_name (str): Name of the AWS service
+
+    Returns:
+        Union[BulkReader, None]: BulkReader object, or None if the service has none.
+    """
+    bulk_reader_cls = _bulk_reader_registry.get(service_name)
+    if bulk_reader_cls is None:
+        return None
+    return bulk_reader_cls()
@@ -12,12 +12,20 @@ from config import (
     get_rich_console,
     set_log_level_at_runtime,
     clear_relations_cache,
-    BALCONY_RELATIONS_DIR
+    BALCONY_RELATIONS_DIR,
+    BALCONY_RESPONSE_CACHE_PATH,
+    DEFAULT_RESPONSE_CACHE_TTL,
 )
 
 # required for loading custom resource nodes into registry
 from custom_nodes import *  # noqa
 from aws import BalconyAWS
+from accounts import MultiAccountBalconyAWS
+from response_cache import ResponseCache
+from rate_limiter import RateLimiterRegistry, DEFAULT_INITIAL_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+from reader import REFRESH_POLICIES, REFRESH_POLICY_ALL
+from pushdown import translate_selector_to_api_filters
+from page_selector import PageSelector
 from rich.text import Text
 import typer
 import jmespath
@@ -53,6 +61,26 @@ def _main_app_callback(
         set_log_level_at_runtime(logging.DEBUG)
 
 
+def _configure_response_cache(cache: bool, cache_ttl: int) -> None:
+    """Sets the persistent response cache of the ServiceNodes that'll be created."""
+    if not cache:
+        balcony_aws.response_cache = None
+    else:
+        balcony_aws.response_cache = ResponseCache(ttl=cache_ttl)
+
+
+def _configure_rate_limiters(rate_limit: bool, concurrency: int) -> None:
+    """Sets the adaptive rate limiters of the ServiceNodes that'll be created. Their concurrency limits
+    are not lower than the requested concurrency."""
+    if not rate_limit:
+        balcony_aws.rate_limiters = None
+    else:
+        balcony_aws.rate_limiters = RateLimiterRegistry(
+            initial_concurrency=max(DEFAULT_INITIAL_CONCURRENCY, concurrency),
+            max_concurrency=max(DEFAULT_MAX_CONCURRENCY, concurrency),
+        )
+
+
 def save_dict_to_output_file(output_filepath: str, data: Dict):
     with open(output_filepath, "w") as f:
         json.dump(data, f, indent=2, default=str)
@@ -240,7 +268,7 @@ def aws_main_command(  # noqa
         None,
         "--pattern",
         show_default=False,
-        help='UNIX pattern matching for generated parameters. Should be quoted. e.g. (--pattern "*prod-*")',
+        help='UNIX pattern matching for generated parameters, prefix with "!" to exclude. Should be quoted. e.g. (--pattern "*prod-*" --pattern "!*-test")',
     ),
     jmespath_selector: Optional[str] = typer.Option(
         None,
@@ -279,9 +307,103 @@ def aws_main_command(  # noqa
         show_default=False,
         help="Output JSON file name. If not provided, will print to console.",
     ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        min=1,
+        help="Number of concurrent API calls made for the generated parameters of an operation.",
+    ),
+    pipeline: bool = typer.Option(
+        False,
+        "--pipeline",
+        help="Start calling the dependent operations as soon as the first related page arrives. Use with --paginate.",
+    ),
+    merge_pages: bool = typer.Option(
+        False,
+        "--merge-pages",
+        help="Merge the pages of each API call into one response. Use with --paginate.",
+    ),
+    bulk_read: bool = typer.Option(
+        False,
+        "--bulk-read",
+        help="Read the operations with the bulk API calls of the service when available, e.g. iam GetAccountAuthorizationDetails.",
+    ),
+    rate_limit: bool = typer.Option(
+        False,
+        "--rate-limit",
+        help="Pace the API calls of each service endpoint, and slow down when they're throttled.",
+    ),
+    lean_client: bool = typer.Option(
+        False,
+        "--lean-client",
+        help="Skip botocore's parameter validation and the event handlers the generated read-only API calls don't need.",
+    ),
+    raw_timestamps: bool = typer.Option(
+        False,
+        "--raw-timestamps",
+        help="Keep the timestamps of the responses as strings instead of parsing them.",
+    ),
+    base64_blobs: bool = typer.Option(
+        False,
+        "--base64-blobs",
+        help="Keep the binary fields of the responses as base64 strings instead of decoding them.",
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse the API responses cached by the previous runs, and cache the new ones.",
+    ),
+    cache_ttl: int = typer.Option(
+        DEFAULT_RESPONSE_CACHE_TTL,
+        "--cache-ttl",
+        min=0,
+        help="Seconds the cached API responses are reused. Use with --cache.",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Re-read the operations instead of using the cached API responses.",
+    ),
+    refresh_policy: str = typer.Option(
+        REFRESH_POLICY_ALL,
+        "--refresh-policy",
+        help=f"Which related operations are re-read with --refresh: {', '.join(REFRESH_POLICIES)}.",
+    ),
+    refresh_max_age: int = typer.Option(
+        0,
+        "--refresh-max-age",
+        min=0,
+        help="Seconds the related operations are fresh for the 'stale' --refresh-policy.",
+    ),
+    regions: Optional[List[str]] = typer.Option(
+        None,
+        "--regions",
+        show_default=False,
+        help='Read the given regions concurrently, output is keyed by region. Use "all" for all enabled regions. e.g. (--regions us-east-1 --regions eu-west-1)',
+    ),
+    accounts: Optional[List[str]] = typer.Option(
+        None,
+        "--accounts",
+        show_default=False,
+        help="IAM Role ARNs to assume or AWS profile names to read concurrently, output is keyed by account.",
+    ),
+    account_concurrency: int = typer.Option(
+        8,
+        "--account-concurrency",
+        min=1,
+        help="Number of accounts read concurrently with --accounts.",
+    ),
 ):
     if debug:
         set_log_level_at_runtime(logging.DEBUG)
+    _configure_response_cache(cache, cache_ttl)
+    _configure_rate_limiters(rate_limit, concurrency)
+
+    if refresh_policy not in REFRESH_POLICIES:
+        console.print(
+            f"[red bold]Error: Given refresh policy '{refresh_policy}' is not supported. Try: {' or '.join(REFRESH_POLICIES)}"
+        )
+        raise typer.Exit(code=-1)
 
     if list_contents:
         _list_service_or_resource(service, resource_node, screen_pager=screen)
@@ -313,21 +435,42 @@ def aws_main_command(  # noqa
         raise typer.Exit(code=-1)
 
     elif service and resource_node:
+        # clients are created with the ServiceNode
+        balcony_aws.lean_client = lean_client
+        balcony_aws.raw_timestamps = raw_timestamps
+        balcony_aws.base64_blobs = base64_blobs
         service_node = balcony_aws.get_service_node(service)
+        # regional ServiceNodes are created with the merge_pages of the default one
+        service_node.merge_pages = merge_pages
+        service_node.bulk_read = bulk_read
         service_reader = service_node.get_service_reader()
-
-        is_operation_selected = operation is not None
-        read_data = None
-        if not is_operation_selected:
-            # read all operations in given resource node
-            read_data = service_reader.read_resource_node(
-                resource_node,
-                match_patterns=patterns,
-                follow_pagination=follow_pagination,
+        service_reader.merge_pages = merge_pages
+        service_reader.bulk_read = bulk_read
+        if jmespath_selector:
+            # the selector is applied after reading, its filters are also pushed down to the api calls if possible
+            service_node.api_filters = translate_selector_to_api_filters(service, jmespath_selector)
+
+        # both have the same read interface
+        reader_aws = balcony_aws
+        if accounts:
+            reader_aws = MultiAccountBalconyAWS(
+                accounts,
+                balcony_aws.boto3_session,
+                max_workers=account_concurrency,
+                merge_pages=merge_pages,
+                bulk_read=bulk_read,
+                lean_client=lean_client,
+                raw_timestamps=raw_timestamps,
+                base64_blobs=base64_blobs,
+                response_cache=balcony_aws.response_cache,
+                rate_limiters=balcony_aws.rate_limiters,
             )
+            reader_aws.shared_balcony_aws.get_service_node(service).api_filters = service_node.api_filters
 
-        else:  # Operation is selected
-            resource_node_obj = service_node.get_resource_node_by_name(resource_node)
+        resource_node_obj = service_node.get_resource_node_by_name(resource_node)
+        is_operation_selected = operation is not None
+        operation_name = None
+        if is_operation_selected:
             types_to_op_names = resource_node_obj.get_operation_types_and_names()
             supported_operation_types = list(types_to_op_names.keys())
             operation_name = types_to_op_names.get(operation, False)
@@ -337,20 +480,77 @@ def aws_main_command(  # noqa
                 )
                 raise typer.Exit(code=-1)
 
-            read_data = service_reader.read_operation(
+        # selectors that can be applied page by page don't need all the raw pages in memory.
+        # selected operations are searched as their list of pages, ResourceNodes as {operation_name: pages}
+        page_selector = PageSelector(jmespath_selector, operation_name=operation_name) if jmespath_selector else None
+        streamed_operation_name = None
+        # --pipeline reads are for latency, they dispatch the calls while the related operation is paginating
+        if page_selector and page_selector.is_incremental and not (regions or accounts or merge_pages or pipeline):
+            if resource_node_obj and page_selector.operation_name in resource_node_obj.get_operation_names():
+                streamed_operation_name = page_selector.operation_name
+
+        read_data = None
+        if streamed_operation_name:
+            logger.debug(
+                f"Using jmespath selector: {jmespath_selector} on each page of [bold blue]{streamed_operation_name}[/]."
+            )
+            read_data = page_selector.search_pages(
+                service_reader.iter_operation_pages(
+                    resource_node,
+                    streamed_operation_name,
+                    match_patterns=patterns,
+                    refresh=refresh,
+                    follow_pagination=follow_pagination,
+                    max_workers=concurrency,
+                    refresh_policy=refresh_policy,
+                    refresh_max_age=refresh_max_age,
+                )
+            )
+
+        elif not is_operation_selected:
+            # read all operations in given resource node
+            read_data = reader_aws.read_resource_node(
+                service,
+                resource_node,
+                match_patterns=patterns,
+                refresh=refresh,
+                follow_pagination=follow_pagination,
+                max_workers=concurrency,
+                pipeline=pipeline,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
+                regions=regions,
+            )
+
+        else:  # Operation is selected
+            read_data = reader_aws.read_operation(
+                service,
                 resource_node,
                 operation_name,
                 match_patterns=patterns,
-                refresh=False,
+                refresh=refresh,
                 follow_pagination=follow_pagination,
+                max_workers=concurrency,
+                pipeline=pipeline,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
+                regions=regions,
             )
 
-        if jmespath_selector:
+        logger.debug(f"Read stats of {service_markup}: {service_reader.get_read_stats()}")
+
+        if jmespath_selector and not streamed_operation_name:
 
             logger.debug(
                 f"Using jmespath selector: {jmespath_selector} to query the returned data."
             )
-            read_data = jmespath.search(jmespath_selector, read_data, options=jmespath_options)
+            if not (regions or accounts):
+                # failed reads have no pages, the same as the streamed ones
+                if is_operation_selected and not isinstance(read_data, list):
+                    read_data = []
+                elif not is_operation_selected and not read_data:
+                    read_data = {name: [] for name in resource_node_obj.get_operation_names()}
+            read_data = page_selector.search(read_data)
 
         if formatter:
             if read_data:
@@ -390,6 +590,138 @@ def aws_main_command(  # noqa
         raise typer.Exit(code=0)
 
 
+@app.command(
+    "scan",
+    help="Read every Resource Node of the given AWS Services, or of all services. Services are read on a process pool.",
+)
+def scan_command(
+    services: Optional[List[str]] = typer.Argument(
+        None,
+        show_default=False,
+        help="Names of the AWS Services. All available services are scanned if not given.",
+        autocompletion=_complete_service_name,
+    ),
+    patterns: Optional[List[str]] = typer.Option(
+        None,
+        "--pattern",
+        show_default=False,
+        help='UNIX pattern matching for generated parameters, prefix with "!" to exclude. Should be quoted. e.g. (--pattern "*prod-*" --pattern "!*-test")',
+    ),
+    jmespath_selector: Optional[str] = typer.Option(
+        None,
+        "--jmespath-selector",
+        "-js",
+        show_default=False,
+        help="JMESPath query selector to filter resulted data. Visit for tutorial: https://jmespath.org/tutorial.html",
+    ),
+    debug: bool = typer.Option(False, "--debug", "-d", help="Enable debug messages."),
+    follow_pagination: bool = typer.Option(
+        False,
+        "--paginate",
+        "-p",
+        help="Paginate through the output if the output is truncated, otherwise will only read one page.",
+    ),
+    output_file: str = typer.Option(
+        None,
+        "--output",
+        "-o",
+        show_default=False,
+        help="Output JSON file name. If not provided, will print to console.",
+    ),
+    concurrency: int = typer.Option(
+        8,
+        "--concurrency",
+        min=1,
+        help="Number of concurrent operations and API calls in each process.",
+    ),
+    processes: int = typer.Option(
+        None,
+        "--processes",
+        min=1,
+        show_default="number of CPUs",
+        help="Number of processes the services are distributed across.",
+    ),
+    merge_pages: bool = typer.Option(
+        False,
+        "--merge-pages",
+        help="Merge the pages of each API call into one response. Use with --paginate.",
+    ),
+    bulk_read: bool = typer.Option(
+        False,
+        "--bulk-read",
+        help="Read the operations with the bulk API calls of the service when available, e.g. iam GetAccountAuthorizationDetails.",
+    ),
+    rate_limit: bool = typer.Option(
+        False,
+        "--rate-limit",
+        help="Pace the API calls of each service endpoint, and slow down when they're throttled.",
+    ),
+    lean_client: bool = typer.Option(
+        False,
+        "--lean-client",
+        help="Skip botocore's parameter validation and the event handlers the generated read-only API calls don't need.",
+    ),
+    raw_timestamps: bool = typer.Option(
+        False,
+        "--raw-timestamps",
+        help="Keep the timestamps of the responses as strings instead of parsing them.",
+    ),
+    base64_blobs: bool = typer.Option(
+        False,
+        "--base64-blobs",
+        help="Keep the binary fields of the responses as base64 strings instead of decoding them.",
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse the API responses cached by the previous runs, and cache the new ones.",
+    ),
+    cache_ttl: int = typer.Option(
+        DEFAULT_RESPONSE_CACHE_TTL,
+        "--cache-ttl",
+        min=0,
+        help="Seconds the cached API responses are reused. Use with --cache.",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Re-read the operations instead of using the cached API responses.",
+    ),
+):
+    if debug:
+        set_log_level_at_runtime(logging.DEBUG)
+    _configure_response_cache(cache, cache_ttl)
+    _configure_rate_limiters(rate_limit, concurrency)
+    balcony_aws.merge_pages = merge_pages
+    balcony_aws.bulk_read = bulk_read
+    balcony_aws.lean_client = lean_client
+    balcony_aws.raw_timestamps = raw_timestamps
+    balcony_aws.base64_blobs = base64_blobs
+
+    read_data = balcony_aws.scan(
+        services or None,
+        match_patterns=patterns,
+        refresh=refresh,
+        follow_pagination=follow_pagination,
+        max_workers=concurrency,
+        max_processes=processes,
+    )
+
+    if jmespath_selector:
+        logger.debug(
+            f"Using jmespath selector: {jmespath_selector} to query the returned data."
+        )
+        read_data = jmespath.search(jmespath_selector, read_data, options=jmespath_options)
+
+    if output_file:
+        output_filepath = Path(output_file).resolve()
+        logger.info(f"Saving output to: {output_filepath}")
+        save_dict_to_output_file(output_filepath, read_data)
+    else:
+        console.print_json(data=read_data, default=str)
+    raise typer.Exit(code=0)
+
+
 @app.command(
     "terraform-import-support-matrix",
     # no_args_is_help=True,
@@ -469,10 +801,22 @@ def terraform_import_command(
     screen: bool = typer.Option(
         False, "--screen", "-s", help="Open the data on a separate paginator on shell."
     ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse the API responses cached by the previous runs, and cache the new ones.",
+    ),
+    cache_ttl: int = typer.Option(
+        DEFAULT_RESPONSE_CACHE_TTL,
+        "--cache-ttl",
+        min=0,
+        help="Seconds the cached API responses are reused. Use with --cache.",
+    ),
 ):
     # set debug level if enabled
     if debug:
         set_log_level_at_runtime(logging.DEBUG)
+    _configure_response_cache(cache, cache_ttl)
 
     # warn user if pagination is not set
     if not follow_pagination:
@@ -619,7 +963,10 @@ def wizard_the_terraform_import_configurer(
     return
 
 
-@app.command("clear-cache", help=f"Clear relations json cache, located at: {BALCONY_RELATIONS_DIR}")
+@app.command(
+    "clear-cache",
+    help=f"Clear relations json cache, located at: {BALCONY_RELATIONS_DIR} and the API response cache, located at: {BALCONY_RESPONSE_CACHE_PATH}",
+)
 def clear_cache_command(
     # service: Optional[str] = typer.Argument(None, show_default='all',
     # help='Name of the Service to clear relation caches of', autocompletion=_complete_service_name),
@@ -628,6 +975,8 @@ def clear_cache_command(
     deleted_service_caches = clear_relations_cache()
     for deleted_service in deleted_service_caches:
         logger.info(f"[green]Deleted[/] {deleted_service}")
+    deleted_response_count = ResponseCache().clear()
+    logger.info(f"[green]Deleted[/] {deleted_response_count} cached API responses from {BALCONY_RESPONSE_CACHE_PATH}")
 
 @app.command(
     "export-aws-api-operations",
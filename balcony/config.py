@@ -48,6 +48,33 @@ BALCONY_RELATIONS_DIR = os.getenv(
 # create the relations directory if not exists
 Path(BALCONY_RELATIONS_DIR).mkdir(parents=True, exist_ok=True)
 
+# Defaults to ~/.balcony/response-cache.sqlite3
+BALCONY_RESPONSE_CACHE_PATH = os.getenv(
+    "BALCONY_RESPONSE_CACHE_PATH",
+    os.path.join(BALCONY_CONFIG_DIR, "response-cache.sqlite3"),
+)
+
+# seconds a cached response is considered fresh
+DEFAULT_RESPONSE_CACHE_TTL = 300
+
+# services whose resources are not bound to a region, they're read once in multi-region reads
+GLOBAL_SERVICES = [
+    "iam",
+    "organizations",
+    "route53",
+    "route53domains",
+    "cloudfront",
+    "globalaccelerator",
+    "shield",
+    "waf",
+    "budgets",
+    "ce",
+    "s3",
+]
+
+# region key of the global services in the multi-region results
+GLOBAL_REGION_NAME = "global"
+
 LOG_LEVEL = "INFO"
 
 # YamlResourceNode customization parameters
@@ -16,5 +16,4 @@ from .lambda_functions import *
 from .ssm import *
 from .ses import *
 from .iam import *
-from .s3 import *
-from .sqs import *
\ No newline at end of file
+from .s3 import *
\ No newline at end of file
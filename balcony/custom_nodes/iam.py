@@ -1,4 +1,5 @@
 from nodes import ResourceNode
+from bulk_readers import BulkReader
 from config import get_logger
 from relations import Relation
 import jmespath
@@ -177,3 +178,193 @@ class GroupPolicy(ResourceNode, service_name="iam", name="GroupPolicy"):
         return super().generate_api_parameters_from_operation_data(
             operation_name, relations_of_operation, related_operations_data
         )
+
+
+class IamAuthorizationDetailsBulkReader(BulkReader, service_name="iam"):
+    """Reads the inline and attached policies, tags, groups and instance profiles of the Roles, Users and Groups,
+    and the customer managed Policies from the paginated `GetAccountAuthorizationDetails` output, instead of
+    calling the operations for every principal.
+
+    `ListRoles`, `GetRole`, `ListUsers`, `GetUser`, `GetGroup` and `GetPolicy` are read with their own api calls,
+    `GetAccountAuthorizationDetails` lacks some of their fields, e.g. `Description` and `MaxSessionDuration`
+    of the Roles, `PasswordLastUsed` of the Users and `Tags` of the Policies.
+    """
+
+    operation_name = "GetAccountAuthorizationDetails"
+    api_parameter = {
+        "Filter": ["User", "Role", "Group", "LocalManagedPolicy"],
+        "MaxItems": 1000,
+    }
+    operation_keys = [
+        ("RolePolicy", "ListRolePolicies"),
+        ("RolePolicy", "GetRolePolicy"),
+        ("AttachedRolePolicies", "ListAttachedRolePolicies"),
+        ("InstanceProfilesForRole", "ListInstanceProfilesForRole"),
+        ("RoleTags", "ListRoleTags"),
+        ("UserPolicy", "ListUserPolicies"),
+        ("UserPolicy", "GetUserPolicy"),
+        ("AttachedUserPolicies", "ListAttachedUserPolicies"),
+        ("GroupsForUser", "ListGroupsForUser"),
+        ("UserTags", "ListUserTags"),
+        ("Group", "ListGroups"),
+        ("GroupPolicy", "ListGroupPolicies"),
+        ("GroupPolicy", "GetGroupPolicy"),
+        ("AttachedGroupPolicies", "ListAttachedGroupPolicies"),
+        # ListPolicies is restricted to the customer managed policies in iam.yaml
+        ("Policy", "ListPolicies"),
+        ("PolicyVersion", "ListPolicyVersions"),
+        ("PolicyVersion", "GetPolicyVersion"),
+    ]
+
+    def _read_authorization_details(self, service_reader, refresh):
+        resource_node = service_reader.service_node.find_resource_node_by_operation_name(
+            self.operation_name
+        )
+        if not resource_node:
+            return False
+        if refresh:
+            service_reader.clear_operations_data(resource_node.name, self.operation_name)
+        service_reader.call_operation(
+            resource_node, self.operation_name, self.api_parameter, follow_pagination=True
+        )
+        read_state = service_reader.get_read_state(
+            resource_node.name, self.operation_name, self.api_parameter
+        )
+        if not read_state or read_state.error is not None:
+            return False
+        pages = service_reader.search_operation_data(resource_node.name, self.operation_name) or []
+        # later pages have the pagination token in their __args__
+        return [
+            page
+            for page in pages
+            if {k: v for k, v in page.get("__args__", {}).items() if k != "Marker"}
+            == self.api_parameter
+        ]
+
+    def read(self, service_reader, refresh=False):
+        pages = self._read_authorization_details(service_reader, refresh)
+        if pages is False:
+            logger.debug(f"Failed to read [blue]{self.operation_name}[/], bulk read is skipped.")
+            return False
+
+        details = {"RoleDetailList": [], "UserDetailList": [], "GroupDetailList": [], "Policies": []}
+        for page in pages:
+            for key in details:
+                details[key].extend(page.get(key, []))
+
+        data = {key: [] for key in self.operation_keys}
+        # operation name -> pagination parameters its generated api parameters have, e.g. MaxItems
+        pagination_parameters = {}
+
+        def _without(item, *keys):
+            return {k: v for k, v in item.items() if k not in keys}
+
+        def _add_page(resource_node_name, operation_name, page, args):
+            """Adds the page with the `__args__` the operation would be called with."""
+            if operation_name not in pagination_parameters:
+                resource_node = service_reader.service_node.get_resource_node_by_name(resource_node_name)
+                api_parameters = resource_node.complement_api_parameters_list(
+                    operation_name, [], [], [dict(args)]
+                )
+                pagination_parameters[operation_name] = (
+                    {k: v for k, v in api_parameters[0].items() if k not in args}
+                    if api_parameters
+                    else {}
+                )
+            page["__args__"] = {**args, **pagination_parameters[operation_name]}
+            data[(resource_node_name, operation_name)].append(page)
+
+        def _add_principal_pages(kind, principal, name_key, policy_list_key):
+            """Adds the pages of the inline and attached policies of a Role, User or Group."""
+            name = principal[name_key]
+            args = {name_key: name}
+            inline_policies = principal.get(policy_list_key, [])
+            _add_page(
+                f"{kind}Policy",
+                f"List{kind}Policies",
+                {"PolicyNames": [p["PolicyName"] for p in inline_policies], "IsTruncated": False},
+                args,
+            )
+            for inline_policy in inline_policies:
+                _add_page(
+                    f"{kind}Policy",
+                    f"Get{kind}Policy",
+                    {
+                        name_key: name,
+                        "PolicyName": inline_policy["PolicyName"],
+                        "PolicyDocument": inline_policy["PolicyDocument"],
+                    },
+                    {**args, "PolicyName": inline_policy["PolicyName"]},
+                )
+            _add_page(
+                f"Attached{kind}Policies",
+                f"ListAttached{kind}Policies",
+                {"AttachedPolicies": principal.get("AttachedManagedPolicies", []), "IsTruncated": False},
+                args,
+            )
+
+        for role_detail in details["RoleDetailList"]:
+            args = {"RoleName": role_detail["RoleName"]}
+            _add_principal_pages("Role", role_detail, "RoleName", "RolePolicyList")
+            _add_page(
+                "InstanceProfilesForRole",
+                "ListInstanceProfilesForRole",
+                {"InstanceProfiles": role_detail.get("InstanceProfileList", []), "IsTruncated": False},
+                args,
+            )
+            _add_page(
+                "RoleTags",
+                "ListRoleTags",
+                {"Tags": role_detail.get("Tags", []), "IsTruncated": False},
+                args,
+            )
+
+        groups_by_name = {}
+        for group_detail in details["GroupDetailList"]:
+            groups_by_name[group_detail["GroupName"]] = _without(
+                group_detail, "GroupPolicyList", "AttachedManagedPolicies"
+            )
+            _add_principal_pages("Group", group_detail, "GroupName", "GroupPolicyList")
+        _add_page("Group", "ListGroups", {"Groups": list(groups_by_name.values()), "IsTruncated": False}, {})
+
+        for user_detail in details["UserDetailList"]:
+            args = {"UserName": user_detail["UserName"]}
+            _add_principal_pages("User", user_detail, "UserName", "UserPolicyList")
+            user_groups = [
+                groups_by_name[group_name]
+                for group_name in user_detail.get("GroupList", [])
+                if group_name in groups_by_name
+            ]
+            _add_page("GroupsForUser", "ListGroupsForUser", {"Groups": user_groups, "IsTruncated": False}, args)
+            _add_page(
+                "UserTags",
+                "ListUserTags",
+                {"Tags": user_detail.get("Tags", []), "IsTruncated": False},
+                args,
+            )
+
+        policies = []
+        for policy_detail in details["Policies"]:
+            # ListPolicies doesn't return the descriptions
+            policies.append(_without(policy_detail, "PolicyVersionList", "Description"))
+            args = {"PolicyArn": policy_detail["Arn"]}
+            versions = policy_detail.get("PolicyVersionList", [])
+            _add_page(
+                "PolicyVersion",
+                "ListPolicyVersions",
+                {"Versions": [_without(version, "Document") for version in versions], "IsTruncated": False},
+                args,
+            )
+            # iam.yaml reads only the first listed version of each policy
+            if versions:
+                _add_page(
+                    "PolicyVersion",
+                    "GetPolicyVersion",
+                    {"PolicyVersion": versions[0]},
+                    {**args, "VersionId": versions[0]["VersionId"]},
+                )
+        # api parameters of ListPolicies are overridden in iam.yaml, they're not complemented
+        data[("Policy", "ListPolicies")].append(
+            {"Policies": policies, "IsTruncated": False, "__args__": {"Scope": "Local"}}
+        )
+        return data
@@ -12,3 +12,9 @@ class Error(Exception):
         # error_log = self.create_error_log()
         # if error_log:
         #     logger.debug(error_log)
+
+    def json(self) -> Dict:
+        return {
+            "message": self.message,
+            "context": self.context,
+        }
@@ -3,6 +3,7 @@ from botocore_utils import (
     get_shape_name,
 )
 from utils import (
+    canonicalize_api_parameter,
     camel_case_split,
     compare_nouns,
     icompare_two_token_lists,
@@ -15,6 +16,7 @@ from botocore_utils import (
     get_input_shape,
     annotate_shape_and_its_members_with_target_path,
     get_max_results_value_from_shape,
+    get_list_parameter_max_length,
     find_key_in_dict_keys,
     generate_rich_tree_from_shape,
     icompare_two_camel_case_words,
@@ -22,8 +24,14 @@ from botocore_utils import (
     READ_ONLY_VERBS,
     IDENTIFIER_NAMES,
     cleanhtml,
+    PaginationConfig,
+    LEAN_CLIENT_CONFIG,
+    remove_unneeded_client_handlers,
+    set_client_response_parsing,
 )
 from relations import RelationMap, Relation
+from rate_limiter import AdaptiveRateLimiter
+from bucket_regions import BucketRegionCache
 from reader import ServiceReader
 from registries import ResourceNodeRegistry
 from config import get_logger, get_rich_console
@@ -33,11 +41,15 @@ from typing import List, Dict, Tuple, Union
 from botocore.utils import ArgumentGenerator
 from botocore.hooks import EventAliaser
 from botocore.model import OperationModel, ServiceModel
+from botocore.paginate import PaginatorModel
+from botocore.exceptions import DataNotFoundError
 from rich.text import Text
 from rich.panel import Panel
 from rich.console import Group
 from rich.padding import Padding
+from jinja2 import Environment
 import jmespath
+import threading
 from aws_jmespath_utils import jmespath_options
 
 logger = get_logger(__name__)
@@ -61,6 +73,7 @@ class ResourceNode:
         self.name = name
         self.operation_names = operation_names
         self._operation_models = {}
+        self._pagination_configs = {}
 
     def __init_subclass__(cls, service_name=None, name=None, **kwargs) -> None:
         """Initializes the custom subclasses of ResourceNode to ResourceNodeRegistry.
@@ -406,6 +419,20 @@ class ResourceNode:
             for api_param in api_params:
                 api_param.update({max_results_key: max_results_value})
 
+        # handle the paginators limit key if it's not MaxResults, e.g. MaxItems
+        pagination_config = self.get_pagination_config(operation_name)
+        limit_key = pagination_config.limit_key if pagination_config else None
+        if (
+            limit_key
+            and limit_key != max_results_key
+            and input_shape
+            and limit_key in input_shape.members
+        ):
+            limit_value = input_shape.members[limit_key].metadata.get("max", False)
+            if limit_value:
+                for api_param in api_params:
+                    api_param.setdefault(limit_key, limit_value)
+
         # sometimes MaxResults can be seen as non required parameter, but in fact is
         if not required_parameter_names:
             return api_params
@@ -418,7 +445,85 @@ class ResourceNode:
             inform_about_developing_custom_resource_nodes()
             return False
 
-        return api_params
+        return self.batch_api_parameters(operation_name, api_params)
+
+    def get_batched_parameter(self, operation_name: str) -> Tuple[Union[str, bool], Union[int, bool]]:
+        """Finds the required list-typed parameter of the operation that identifiers can be batched into,
+        e.g. `Names` of ssm `GetParameters`.
+
+        Args:
+            operation_name (str): Name of the operation
+
+        Returns:
+            Tuple[Union[str, bool], Union[int, bool]]: (parameter name, max length) or (False, False)
+        """
+        operation_model = self.get_operation_model(operation_name)
+        input_shape = get_input_shape(operation_model)
+        if not input_shape:
+            return False, False
+        list_parameter_names = [
+            parameter_name
+            for parameter_name in self.get_required_parameter_names_from_operation_model(operation_model)
+            if input_shape.members[parameter_name].type_name == "list"
+        ]
+        # identifiers of multiple lists can't be combined
+        if len(list_parameter_names) != 1:
+            return False, False
+        parameter_name = list_parameter_names[0]
+        max_length = get_list_parameter_max_length(
+            self.service_node.name,
+            operation_name,
+            parameter_name,
+            input_shape.members[parameter_name],
+        )
+        if not max_length:
+            return False, False
+        return parameter_name, max_length
+
+    def batch_api_parameters(self, operation_name: str, api_parameters: List[Dict]) -> List[Dict]:
+        """Packs the identifiers of the required list-typed parameter into max-size batches.
+        API parameters that only differ in that parameter are combined, so one call is made per batch
+        instead of one call per identifier.
+
+        Args:
+            operation_name (str): Name of the operation
+            api_parameters (List[Dict]): Generated API parameters
+
+        Returns:
+            List[Dict]: Batched API parameters
+        """
+        parameter_name, max_length = self.get_batched_parameter(operation_name)
+        if not parameter_name or not api_parameters:
+            return api_parameters
+
+        batched_api_parameters = []
+        # the other parameters -> (api parameter without the batched parameter, identifiers)
+        identifiers_by_other_parameters = {}
+        for api_parameter in api_parameters:
+            if not isinstance(api_parameter, dict) or api_parameter.get(parameter_name) is None:
+                batched_api_parameters.append(api_parameter)
+                continue
+            other_parameters = {k: v for k, v in api_parameter.items() if k != parameter_name}
+            _, identifiers = identifiers_by_other_parameters.setdefault(
+                canonicalize_api_parameter(other_parameters), (other_parameters, {})
+            )
+            values = api_parameter[parameter_name]
+            if not isinstance(values, list):
+                values = [values]
+            for value in values:
+                # dicts keep the order, and identifiers may be unhashable, e.g. elbv2 Targets
+                identifiers.setdefault(canonicalize_api_parameter({"_": value}), value)
+
+        for other_parameters, identifiers in identifiers_by_other_parameters.values():
+            identifier_list = list(identifiers.values())
+            for i in range(0, len(identifier_list), max_length):
+                batched_api_parameters.append(
+                    {**other_parameters, parameter_name: identifier_list[i : i + max_length]}
+                )
+        logger.debug(
+            f"Batched {len(api_parameters)} api parameters of [blue]{operation_name}[/] into {len(batched_api_parameters)} calls by [bold]{parameter_name}[/]."
+        )
+        return batched_api_parameters
 
     # NOTE: +overrideable
     def generate_api_parameters_from_operation_data(
@@ -464,6 +569,9 @@ class ResourceNode:
         ) = self._generate_raw_api_parameters_from_operation_data(
             operation_name, relations_of_operation, related_operations_data
         )
+        if raw_api_parameters_list == []:
+            # the related operations have no resources, so there's nothing to read. it's not an error
+            return [], None
         if raw_param_error is not None:
             # failed to generate raw api parameters list
             return False, raw_param_error
@@ -487,6 +595,41 @@ class ResourceNode:
 
         return api_parameters_list, None
 
+    # NOTE: +overrideable
+    def is_operation_derived(self, operation_name: str) -> bool:
+        """Checks if the operations responses are derived from its related operations data, instead of calling AWS.
+
+        Args:
+            operation_name (str): Name of the operation
+
+        Returns:
+            bool: True if `derive_operation_responses` is used for the operation
+        """
+        return False
+
+    # NOTE: +overrideable
+    def derive_operation_responses(
+        self, operation_name: str, related_operations_data: Union[List, Dict]
+    ) -> Tuple[Union[List[Dict], bool], Union[Error, None]]:
+        """Derives the responses of the operation from its related operations data, e.g. the `sqs GetQueueUrl`
+        responses from the `ListQueues` output. Each response must have the `__args__` it would be called with.
+
+        Args:
+            operation_name (str): Name of the operation
+            related_operations_data (Union[List, Dict]): All related operations data
+
+        Returns:
+            Tuple[Union[List[Dict], bool], Union[Error, None]]: (value, error) tuple.
+        """
+        return False, Error(
+            "operation is not derived",
+            {
+                "service": self.service_node.name,
+                "resource_node": self.name,
+                "operation_name": operation_name,
+            },
+        )
+
     def print_operation(self, operation_name: str) -> None:
         operation_panel = self._rich_operation_details_panel(operation_name)
         console.print(operation_panel)
@@ -656,6 +799,41 @@ class ResourceNode:
             }
         return False
 
+    def get_pagination_config(
+        self, operation_name: str
+    ) -> Union[PaginationConfig, bool]:
+        """Finds how the operation paginates its output. botocore's paginator definitions are used if the operation has one,
+        otherwise `get_pagination_token_output_to_parameter_name_mapping` is used. Found configs are memoized.
+
+        Args:
+            operation_name (str): Name of the operation in the resource_node.
+
+        Returns:
+            Union[PaginationConfig, bool]: False or the PaginationConfig of the operation
+        """
+        if operation_name in self._pagination_configs:
+            return self._pagination_configs[operation_name]
+
+        pagination_config = False
+        paginator_model = self.service_node.get_paginator_model()
+        if paginator_model:
+            try:
+                paginator = paginator_model.get_paginator(operation_name)
+                pagination_config = PaginationConfig.from_paginator_model(paginator)
+            except ValueError:
+                # operation doesn't have a paginator definition
+                pass
+
+        if not pagination_config:
+            token_mapping = self.get_pagination_token_output_to_parameter_name_mapping(
+                operation_name
+            )
+            if token_mapping:
+                pagination_config = PaginationConfig.from_token_mapping(token_mapping)
+
+        self._pagination_configs[operation_name] = pagination_config
+        return pagination_config
+
     def get_required_parameter_names_from_operation_model(self, operation_model):
         input_shape = get_input_shape(operation_model)
         if not input_shape:
@@ -796,6 +974,29 @@ class YamlResourceNode(ResourceNode):
             operation_name
         )
 
+    def get_pagination_config(
+        self, operation_name: str
+    ) -> Union[PaginationConfig, bool]:
+        """`pagination_token_mapping` in the yaml_config takes precedence over botocore's paginator definitions.
+
+        Args:
+            operation_name (str): AWS Operation name.
+
+        Returns:
+            Union[PaginationConfig, bool]: False or the PaginationConfig of the operation
+        """
+        if operation_name in self._pagination_configs:
+            return self._pagination_configs[operation_name]
+        for operation in self.yaml_config.operations:
+            if operation_name == operation.operation_name:
+                if operation.pagination_token_mapping:
+                    pagination_config = PaginationConfig.from_token_mapping(
+                        operation.pagination_token_mapping
+                    )
+                    self._pagination_configs[operation_name] = pagination_config
+                    return pagination_config
+        return super().get_pagination_config(operation_name)
+
     # NOTE: +overrideable
     def get_operations_relations(
         self, operation_name: str
@@ -948,28 +1149,275 @@ class YamlResourceNode(ResourceNode):
         )
 
 
+    def _find_derive_config(self, operation_name: str) -> Union["YamlDeriveOperation", None]:
+        for operation in self.yaml_config.operations or []:
+            if operation_name == operation.operation_name and operation.derive:
+                return operation.derive
+        return None
+
+    def is_operation_derived(self, operation_name: str) -> bool:
+        """Checks if the `derive` option is defined in the `yaml_config` for the selected operation.
+
+        Args:
+            operation_name (str): AWS Operation name
+
+        Returns:
+            bool: True if the operation is derived
+        """
+        if self._find_derive_config(operation_name):
+            return True
+        return super().is_operation_derived(operation_name)
+
+    def derive_operation_responses(
+        self, operation_name: str, related_operations_data: Union[List, Dict]
+    ) -> Tuple[Union[List[Dict], bool], Union[Error, None]]:
+        """Derives the responses with the `derive` option in the `yaml_config` for the selected operation.
+
+        ```yaml title="Example yaml_config def. for derive"
+        # sqs GetQueueUrl answers are already in the ListQueues output
+        derive:
+          selector: "ListQueues[].QueueUrls[]"    # jmespath, each item is a response
+          output: "{QueueUrl: @}"                 # jmespath searched on the item
+          api_parameters:                         # jinja2 templates rendered with the item
+            QueueName: "{{ item.split('/')[-1] }}"
+        ```
+
+        Args:
+            operation_name (str): AWS Operation name
+            related_operations_data (Union[List, Dict]): Related operations are called beforehand and this is their data.
+
+        Returns:
+            Tuple[Union[List[Dict], bool], Union[Error, None]]: (value, error) tuple.
+        """
+        derive_config = self._find_derive_config(operation_name)
+        if not derive_config:
+            return super().derive_operation_responses(operation_name, related_operations_data)
+
+        try:
+            items = jmespath.search(
+                derive_config.selector, related_operations_data, options=jmespath_options
+            )
+            api_parameter_templates = {
+                parameter_name: Environment().from_string(template)
+                for parameter_name, template in derive_config.api_parameters.items()
+            }
+            derived_responses = []
+            for item in items or []:
+                response = jmespath.search(derive_config.output, item, options=jmespath_options)
+                if not isinstance(response, dict):
+                    continue
+                response["__args__"] = {
+                    parameter_name: template.render(item=item).strip()
+                    for parameter_name, template in api_parameter_templates.items()
+                }
+                derived_responses.append(response)
+        except Exception as e:
+            return False, Error(
+                "failed to derive the operation responses",
+                {
+                    "service": self.service_node.name,
+                    "resource_node": self.name,
+                    "operation_name": operation_name,
+                    "exception": str(e),
+                },
+            )
+        return derived_responses, None
+
+
 class ServiceNode:
-    def __init__(self, name, session):
+    def __init__(
+        self,
+        name,
+        session,
+        merge_pages=False,
+        response_cache=None,
+        rate_limiters=None,
+        region_name=None,
+        bulk_read=False,
+        lean_client=False,
+        raw_timestamps=False,
+        base64_blobs=False,
+    ):
         self.name = name
         self.session = session
-        self.client = self.session.client(self.name)
+        self.merge_pages = merge_pages
+        self.bulk_read = bulk_read
+        self.lean_client = lean_client
+        self.raw_timestamps = raw_timestamps
+        self.base64_blobs = base64_blobs
+        self.response_cache = response_cache
+        self.rate_limiters = rate_limiters
+        # guards the lazily created attributes when used from multiple threads
+        self._lock = threading.RLock()
+        self.client = self._create_client(region_name)
+        # clients of the other regions, e.g. for the s3 buckets in other regions
+        self._regional_clients = {}
+        # per-bucket s3 calls are routed to the client of the bucket's region
+        self.bucket_regions = BucketRegionCache() if self.name == "s3" else None
+        # operation name -> native filter api parameters, e.g. ec2 Filters translated from a jmespath selector
+        self.api_filters = {}
         self.resource_nodes = None
         self._relation_map = None
         self._reader = None
         self._read_operation_name_to_tokens_map = None
+        self._paginator_model = None
+
+    def _create_client(self, region_name=None):
+        """Creates the client of the service. Lean clients skip the parameter validation and
+        the builtin event handlers that the generated read-only api calls don't need."""
+        if not self.lean_client:
+            client = self.session.client(self.name, region_name=region_name)
+        else:
+            client = self.session.client(
+                self.name, region_name=region_name, config=LEAN_CLIENT_CONFIG
+            )
+            remove_unneeded_client_handlers(client)
+        set_client_response_parsing(
+            client, raw_timestamps=self.raw_timestamps, base64_blobs=self.base64_blobs
+        )
+        rate_limiter = self.get_rate_limiter(client.meta.region_name)
+        if rate_limiter:
+            # botocore retries the throttled calls, the limiter adapts to its attempts
+            client.meta.events.register("needs-retry", rate_limiter.on_needs_retry)
+        return client
+
+    def get_response_format(self) -> str:
+        """Returns the name of the response parsing options, responses of different formats are cached separately.
+
+        Returns:
+            str: e.g. `raw-timestamps,base64-blobs`, or an empty string for the default parsing.
+        """
+        response_format = []
+        if self.raw_timestamps:
+            response_format.append("raw-timestamps")
+        if self.base64_blobs:
+            response_format.append("base64-blobs")
+        return ",".join(response_format)
 
     def get_client(self):
         return self.client
 
+    def get_region_name(self) -> str:
+        return self.client.meta.region_name
+
+    def get_regional_client(self, region_name: str):
+        """Gets or creates a client of the service in `region_name`, using the same session.
+
+        Args:
+            region_name (str): Name of the AWS region
+
+        Returns:
+            botocore.client.BaseClient: client of the region
+        """
+        if not region_name or region_name == self.get_region_name():
+            return self.client
+        with self._lock:
+            if region_name not in self._regional_clients:
+                self._regional_clients[region_name] = self._create_client(region_name)
+            return self._regional_clients[region_name]
+
+    def for_region(self, region_name: str) -> "ServiceNode":
+        """Creates a ServiceNode that reads the service in `region_name`.
+
+        Service model, ResourceNodes and the RelationMap don't depend on the region, so they're
+        shared with the current ServiceNode. Only the client and the ServiceReader are separate.
+
+        Args:
+            region_name (str): Name of the AWS region
+
+        Returns:
+            ServiceNode: ServiceNode of the region
+        """
+        service_node = self.for_session(
+            self.session, region_name=region_name, rate_limiters=self.rate_limiters
+        )
+        # regions of the buckets don't depend on the region of the client
+        service_node.bucket_regions = self.bucket_regions
+        return service_node
+
+    def for_session(
+        self, session, region_name=None, rate_limiters=None
+    ) -> "ServiceNode":
+        """Creates a ServiceNode that reads the service with another boto3 session, e.g. of another account.
+
+        Service model, ResourceNodes and the RelationMap don't depend on the account or the region, so they're
+        shared with the current ServiceNode. Only the client and the ServiceReader are separate.
+
+        Args:
+            session (boto3.session.Session): boto3 session to create the client with
+            region_name (str, optional): Name of the AWS region. Defaults to the region of the `session`.
+            rate_limiters (RateLimiterRegistry, optional): Rate limiters of the session. Defaults to None.
+
+        Returns:
+            ServiceNode: ServiceNode of the session
+        """
+        service_node = ServiceNode(
+            self.name,
+            session,
+            merge_pages=self.merge_pages,
+            response_cache=self.response_cache,
+            rate_limiters=rate_limiters,
+            region_name=region_name,
+            bulk_read=self.bulk_read,
+            lean_client=self.lean_client,
+            raw_timestamps=self.raw_timestamps,
+            base64_blobs=self.base64_blobs,
+        )
+        service_node.resource_nodes = self.get_resource_nodes()
+        service_node._relation_map = self.get_relation_map()
+        service_node._read_operation_name_to_tokens_map = (
+            self.get_read_operation_name_to_tokens_map()
+        )
+        service_node._paginator_model = self.get_paginator_model()
+        service_node.api_filters = self.api_filters
+        return service_node
+
+    def get_rate_limiter(self, region_name: str = None) -> Union[AdaptiveRateLimiter, None]:
+        """Returns the rate limiter of the services endpoint from the shared `rate_limiters` registry.
+
+        Args:
+            region_name (str, optional): Region of the endpoint. Defaults to the region of the client.
+
+        Returns:
+            Union[AdaptiveRateLimiter, None]: Rate limiter, or None if the calls are not limited.
+        """
+        if not self.rate_limiters:
+            return None
+        return self.rate_limiters.get_rate_limiter(
+            self.name, region_name or self.get_region_name()
+        )
+
+    def get_paginator_model(self) -> Union[PaginatorModel, bool]:
+        """Returns/loads botocore's paginator definitions(`paginators-1.json`) of the service.
+
+        Returns:
+            Union[PaginatorModel, bool]: PaginatorModel or False if the service has no paginators.
+        """
+        with self._lock:
+            if self._paginator_model is None:
+                try:
+                    self._paginator_model = self.session._session.get_paginator_model(
+                        self.name, self.get_service_model().api_version
+                    )
+                except DataNotFoundError:
+                    self._paginator_model = False
+            return self._paginator_model
+
     def get_service_reader(self) -> ServiceReader:
         """Returns/creates the ServiceReader for the current ServiceNode
 
         Returns:
             ServiceReader: ServiceReader object for current ServiceNode
         """
-        if not self._reader:
-            self._reader = ServiceReader(self)
-        return self._reader
+        with self._lock:
+            if not self._reader:
+                self._reader = ServiceReader(
+                    self,
+                    merge_pages=self.merge_pages,
+                    response_cache=self.response_cache,
+                    bulk_read=self.bulk_read,
+                )
+            return self._reader
 
     def print_resource_node(self, resource_node_name: str) -> None:
         # TODO: check if resource node exists
@@ -1044,10 +1492,10 @@ class ServiceNode:
         Returns:
             RelationMap: RelationMap object for the current ServiceNode
         """
-        if self._relation_map is not None:
+        with self._lock:
+            if self._relation_map is None:
+                self._relation_map = RelationMap(self)
             return self._relation_map
-        self._relation_map = RelationMap(self)
-        return self._relation_map
 
     def get_resource_nodes(self) -> List[ResourceNode]:
         """Gets the available `ResourceNode`s of the current ServiceNode
@@ -1055,9 +1503,10 @@ class ServiceNode:
         Returns:
             List[ResourceNode]: List of `ResourceNode`s available in the ServiceNode
         """
-        if self.resource_nodes is None:
-            self.resource_nodes = self._generate_resource_nodes()
-        return self.resource_nodes
+        with self._lock:
+            if self.resource_nodes is None:
+                self.resource_nodes = self._generate_resource_nodes()
+            return self.resource_nodes
 
     def create_resource_node(self, **kwargs: Dict) -> ResourceNode:
         """Creates the ResourceNode object with the given `kwargs`.
@@ -0,0 +1,121 @@
+from config import get_logger
+from typing import Dict, Iterable, List, Optional, Union
+import jmespath
+from aws_jmespath_utils import jmespath_options
+
+logger = get_logger(__name__)
+
+
+def _get_distributive_operation_name(node: Dict, input_is_list: bool = False) -> Union[str, bool, None]:
+    """Walks the left-most path of the parsed selector, where it's applied to the whole list of pages.
+
+    Returns:
+        Union[str, bool, None]: Operation name at the root of the selector, True for the right side of a pipe,
+                                or None if the selector is not distributive.
+    """
+    node_type = node["type"]
+    if node_type == "field":
+        # the operation name, e.g. DescribeInstances
+        return None if input_is_list else node["value"]
+    if node_type in ("identity", "current"):
+        return True if input_is_list else None
+    if node_type == "flatten":
+        return _get_distributive_operation_name(node["children"][0], input_is_list)
+    if node_type in ("projection", "filter_projection"):
+        # the right side and the filter condition are applied to the elements one by one
+        return _get_distributive_operation_name(node["children"][0], input_is_list)
+    if node_type == "pipe":
+        left, right = node["children"]
+        operation_name = _get_distributive_operation_name(left, input_is_list)
+        if operation_name is None or _get_distributive_operation_name(right, True) is None:
+            return None
+        return operation_name
+    # indexes, slices, functions, multiselects... need the whole result
+    return None
+
+
+class PageSelector:
+    """Applies a JMESPath selector to the response pages of an operation one by one, as they're fetched.
+
+    Selectors made of projections, flattens and filters on the operation's pages give the same result when they're
+    applied to each page and the results are concatenated. So the raw pages don't have to be kept in memory.
+    Other selectors, e.g. with indexes or functions, must be applied to the whole result.
+
+    The pages are searched in the shape of the read data they replace:
+
+    - Without `operation_name`, the selector is applied to the ResourceNode's `{operation_name: pages}` data, like
+      `DescribeInstances[].Reservations[].Instances[].InstanceId`. Each page is searched as `{operation_name: [page]}`.
+    - With `operation_name`, e.g. when an operation is selected, the selector is applied to the list of the
+      operation's pages, like `[].Reservations[].Instances[].InstanceId`. Each page is searched as `[page]`.
+
+    ```python title="Selecting the instance ids page by page"
+    page_selector = PageSelector("[].Reservations[].Instances[].InstanceId", operation_name="DescribeInstances")
+    if page_selector.is_incremental:
+        pages = service_reader.iter_operation_pages("Instances", "DescribeInstances", follow_pagination=True)
+        instance_ids = page_selector.search_pages(pages)
+    ```
+    """
+
+    def __init__(
+        self,
+        jmespath_selector: str,
+        operation_name: Optional[str] = None,
+        options: Optional[jmespath.Options] = jmespath_options,
+    ) -> None:
+        """Compiles the selector once.
+
+        Args:
+            jmespath_selector (str): JMESPath selector of the read data
+            operation_name (Optional[str], optional): Operation whose list of pages the selector is applied to.
+                                                      Defaults to None, the selector is applied to the
+                                                      `{operation_name: pages}` data of a ResourceNode.
+            options (Optional[jmespath.Options], optional): JMESPath options. Defaults to `jmespath_options`.
+        """
+        self.jmespath_selector = jmespath_selector
+        self.options = options
+        self.expression = jmespath.compile(jmespath_selector)
+        self.is_operation_pages = operation_name is not None
+        if self.is_operation_pages:
+            # e.g. [].Reservations[], [*].Reservations or [?State.Name == 'running']
+            is_distributive = _get_distributive_operation_name(self.expression.parsed, input_is_list=True) is True
+            self.operation_name = operation_name if is_distributive else None
+        else:
+            operation_name = _get_distributive_operation_name(self.expression.parsed)
+            self.operation_name = operation_name if isinstance(operation_name, str) else None
+
+    @property
+    def is_incremental(self) -> bool:
+        """True if the selector can be applied to the pages one by one."""
+        return self.operation_name is not None
+
+    def _wrap_pages(self, pages: List[dict]) -> Union[List, Dict]:
+        """Puts the pages in the shape of the read data the selector is applied to."""
+        if self.is_operation_pages:
+            return pages
+        return {self.operation_name: pages}
+
+    def search(self, read_data: Union[List, Dict]) -> Union[List, Dict, None]:
+        """Applies the selector to the whole read data."""
+        return self.expression.search(read_data, options=self.options)
+
+    def search_pages(self, pages: Iterable[dict]) -> Union[List, None]:
+        """Applies the selector to each page of the operation, and concatenates the results.
+        Pages are dropped after they're searched.
+
+        Args:
+            pages (Iterable[dict]): Response pages of the `operation_name`
+
+        Returns:
+            Union[List, None]: Selected data, the same as `search` gives for all of the pages.
+        """
+        selected_data = []
+        page_count = 0
+        for page in pages:
+            page_count += 1
+            page_result = self.expression.search(self._wrap_pages([page]), options=self.options)
+            if page_result:
+                selected_data.extend(page_result)
+        logger.debug(f"Applied the selector to {page_count} pages of [bold blue]{self.operation_name}[/] one by one.")
+        if page_count == 0:
+            return self.search(self._wrap_pages([]))
+        return selected_data
@@ -0,0 +1,126 @@
+from utils import canonicalize_api_parameter
+from typing import List, Dict, Optional, Union
+import fnmatch  # unix like pattern matching
+import re
+
+# patterns starting with this prefix exclude the matching values
+EXCLUDE_PATTERN_PREFIX = "!"
+
+
+def _compile_patterns(patterns: List[str]) -> Union[re.Pattern, None]:
+    """Translates the UNIX style patterns to a single regex alternation."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns))
+
+
+class PatternMatcher:
+    """Matches values against multiple UNIX style patterns at once. Patterns are compiled to one regex,
+    and each value is matched only once. Patterns starting with `!` exclude the matching values.
+
+    ```python title="Filtering the generated api parameters"
+    pattern_matcher = PatternMatcher(["*prod-*", "!*-test"])
+    pattern_matcher.matches("app-prod-eu")  # True
+    pattern_matcher.matches("app-prod-test")  # False
+    pattern_matcher.filter_api_parameters([{"RoleName": "app-prod-eu"}, {"RoleName": "app-dev"}])
+    # [{"RoleName": "app-prod-eu"}]
+    ```
+    """
+
+    def __init__(self, patterns: Optional[List[str]] = None) -> None:
+        """Compiles the include and exclude patterns.
+
+        Args:
+            patterns (Optional[List[str]], optional): UNIX style patterns, prefixed with `!` to exclude. Defaults to None.
+        """
+        self.patterns = list(patterns or [])
+        self.include_patterns = [p for p in self.patterns if not p.startswith(EXCLUDE_PATTERN_PREFIX)]
+        self.exclude_patterns = [
+            p[len(EXCLUDE_PATTERN_PREFIX):] for p in self.patterns if p.startswith(EXCLUDE_PATTERN_PREFIX)
+        ]
+        self._include_regex = _compile_patterns(self.include_patterns)
+        self._exclude_regex = _compile_patterns(self.exclude_patterns)
+        # value -> (is included, is excluded)
+        self._match_cache: Dict[str, tuple] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def _match(self, value: str) -> tuple:
+        cached_match = self._match_cache.get(value)
+        if cached_match is None:
+            cached_match = (
+                self._include_regex is None or self._include_regex.match(value) is not None,
+                self._exclude_regex is not None and self._exclude_regex.match(value) is not None,
+            )
+            self._match_cache[value] = cached_match
+        return cached_match
+
+    def _is_list_item_kept(self, item, is_scalar_included: bool) -> bool:
+        if not isinstance(item, str):
+            # e.g. elbv2 Targets, they're kept with the api parameter
+            return is_scalar_included or self._include_regex is None
+        is_included, is_excluded = self._match(item)
+        return (is_scalar_included or is_included) and not is_excluded
+
+    def matches(self, value) -> bool:
+        """Checks if the value matches any of the include patterns, and none of the exclude patterns.
+        Values other than strings, e.g. `MaxItems` numbers, never match.
+
+        Args:
+            value: Value to match
+
+        Returns:
+            bool: True if the value matches
+        """
+        if not isinstance(value, str):
+            return False
+        is_included, is_excluded = self._match(value)
+        return is_included and not is_excluded
+
+    def filter_api_parameters(self, api_parameters: List[Dict]) -> List[Dict]:
+        """Filters the api parameters, keeping their order and removing the duplicates.
+
+        An api parameter is kept if any of its values matches an include pattern, and none of them
+        matches an exclude pattern. Batched identifiers in list values are filtered one by one.
+        Only the string values are matched, the others like the added `MaxItems` numbers are ignored.
+
+        Args:
+            api_parameters (List[Dict]): Generated api parameters
+
+        Returns:
+            List[Dict]: Matching api parameters
+        """
+        if not self:
+            return api_parameters
+        matched_parameters = []
+        matched_parameter_keys = set()
+        for api_parameter in api_parameters:
+            scalar_matches = [
+                self._match(value)
+                for value in api_parameter.values()
+                if isinstance(value, str)
+            ]
+            if any(is_excluded for _, is_excluded in scalar_matches):
+                continue
+            is_scalar_included = self._include_regex is not None and any(
+                is_included for is_included, _ in scalar_matches
+            )
+            list_values = {
+                key: [item for item in value if self._is_list_item_kept(item, is_scalar_included)]
+                for key, value in api_parameter.items()
+                if isinstance(value, list)
+            }
+            if list_values:
+                if not all(list_values.values()):
+                    # all of the batched identifiers are filtered out
+                    continue
+                api_parameter = {**api_parameter, **list_values}
+            elif not is_scalar_included and self._include_regex is not None:
+                continue
+            api_parameter_key = canonicalize_api_parameter(api_parameter)
+            if api_parameter_key in matched_parameter_keys:
+                continue
+            matched_parameters.append(api_parameter)
+            matched_parameter_keys.add(api_parameter_key)
+        return matched_parameters
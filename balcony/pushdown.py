@@ -0,0 +1,297 @@
+from config import get_logger
+from typing import List, Dict, Tuple, Union, Optional
+from botocore.model import OperationModel
+import jmespath
+
+logger = get_logger(__name__)
+
+# (service_name, operation_name) -> field of the output items -> name of the server-side filter.
+# Only the filters that match exactly the same items as an equality on the field are listed.
+KNOWN_PUSHDOWN_FILTERS = {
+    ("ec2", "DescribeInstances"): {
+        "InstanceId": "instance-id",
+        "InstanceType": "instance-type",
+        "ImageId": "image-id",
+        "KeyName": "key-name",
+        "VpcId": "vpc-id",
+        "SubnetId": "subnet-id",
+        "State.Name": "instance-state-name",
+        "Placement.AvailabilityZone": "availability-zone",
+    },
+    ("ec2", "DescribeVpcs"): {
+        "VpcId": "vpc-id",
+        "CidrBlock": "cidr",
+        "State": "state",
+    },
+    ("ec2", "DescribeSubnets"): {
+        "SubnetId": "subnet-id",
+        "VpcId": "vpc-id",
+        "CidrBlock": "cidr-block",
+        "AvailabilityZone": "availability-zone",
+    },
+    ("ec2", "DescribeSecurityGroups"): {
+        "GroupId": "group-id",
+        "GroupName": "group-name",
+        "VpcId": "vpc-id",
+    },
+    ("ec2", "DescribeNetworkInterfaces"): {
+        "NetworkInterfaceId": "network-interface-id",
+        "VpcId": "vpc-id",
+        "SubnetId": "subnet-id",
+    },
+    ("ec2", "DescribeRouteTables"): {
+        "RouteTableId": "route-table-id",
+        "VpcId": "vpc-id",
+    },
+    ("ec2", "DescribeVolumes"): {
+        "VolumeId": "volume-id",
+        "VolumeType": "volume-type",
+        "State": "status",
+        "AvailabilityZone": "availability-zone",
+    },
+}
+
+# (service_name, operation_name) -> path of the items in the response the filters select, e.g.
+# ec2 DescribeInstances filters select the Instances under the Reservations
+KNOWN_PUSHDOWN_ITEMS_PATHS = {
+    ("ec2", "DescribeInstances"): "Reservations.Instances",
+    ("ec2", "DescribeVpcs"): "Vpcs",
+    ("ec2", "DescribeSubnets"): "Subnets",
+    ("ec2", "DescribeSecurityGroups"): "SecurityGroups",
+    ("ec2", "DescribeNetworkInterfaces"): "NetworkInterfaces",
+    ("ec2", "DescribeRouteTables"): "RouteTables",
+    ("ec2", "DescribeVolumes"): "Volumes",
+}
+
+# nodes a selector can be made of, for its filter expressions to be pushed down
+_PUSHDOWN_SAFE_NODE_TYPES = (
+    "field",
+    "identity",
+    "current",
+    "index",
+    "slice",
+    "flatten",
+    "projection",
+    "filter_projection",
+    "subexpression",
+    "index_expression",
+    "pipe",
+    # filter conditions
+    "comparator",
+    "and_expression",
+    "literal",
+    "not_expression",
+)
+
+
+def _is_pushdown_safe(node) -> bool:
+    if not isinstance(node, dict):
+        # e.g. the integer children of slices
+        return True
+    if node["type"] not in _PUSHDOWN_SAFE_NODE_TYPES:
+        return False
+    return all(_is_pushdown_safe(child) for child in node["children"])
+
+
+def _get_selector_steps(node: Dict) -> List[Tuple]:
+    """Lists the steps of the selector in the order they're applied, e.g. `DescribeVolumes[].Volumes[?State=='in-use']`
+    is `[("field", "DescribeVolumes"), ("list",), ("field", "Volumes"), ("filter", condition)]`.
+    Filter conditions are not walked into."""
+    node_type = node["type"]
+    children = node["children"]
+    if node_type == "field":
+        return [("field", node["value"])]
+    if node_type in ("identity", "current"):
+        return []
+    if node_type == "flatten":
+        return _get_selector_steps(children[0]) + [("list",)]
+    if node_type == "projection":
+        left, right = children
+        # `[]` projections flatten their left side, `[*]` ones iterate it
+        list_step = [] if left["type"] == "flatten" else [("list",)]
+        return _get_selector_steps(left) + list_step + _get_selector_steps(right)
+    if node_type == "filter_projection":
+        left, right, condition = children
+        return _get_selector_steps(left) + [("filter", condition)] + _get_selector_steps(right)
+    if node_type in ("subexpression", "index_expression"):
+        return _get_selector_steps(children[0]) + _get_selector_steps(children[1])
+    if node_type == "pipe":
+        return _get_selector_steps(children[0]) + [("pipe",)] + _get_selector_steps(children[1])
+    # indexes and slices pick a part of the items, so they'd pick other items from the filtered response
+    return [(node_type,)]
+
+
+def _get_field_path(node: Dict) -> Union[str, None]:
+    if node["type"] == "field":
+        return node["value"]
+    if node["type"] == "subexpression":
+        field_paths = [_get_field_path(child) for child in node["children"]]
+        if all(field_paths):
+            return ".".join(field_paths)
+    return None
+
+
+def _collect_equalities(condition: Dict, equalities: List[Tuple[str, str]]) -> None:
+    """Collects the `field == 'literal'` comparisons of a filter expression, joined with `&&`.
+    Other parts of the condition are left to the client-side filtering."""
+    if condition["type"] == "and_expression":
+        for child in condition["children"]:
+            _collect_equalities(child, equalities)
+    elif condition["type"] == "comparator" and condition["value"] == "eq":
+        left, right = condition["children"]
+        if right["type"] != "literal":
+            left, right = right, left
+        field_path = _get_field_path(left)
+        value = right["value"] if right["type"] == "literal" else None
+        if field_path and isinstance(value, (str, int)) and not isinstance(value, bool):
+            equalities.append((field_path, str(value)))
+
+
+def get_selector_equalities(jmespath_selector: str) -> Tuple[Union[str, None], Union[str, None], List[Tuple[str, str]]]:
+    """Finds the operation and the `[?Field == 'value']` filter of a JMESPath selector like
+    `DescribeInstances[*].Reservations[*].Instances[?VpcId=='vpc-123'][]`, and the path of the filtered items.
+
+    Only the first filter is used, if it's applied to the items of every page, like `Operation[].Items[?...]`.
+    Filters of the nested lists, or after an index or a slice are not pushed down, since the server-side filters would
+    select other items. Selectors with functions, multiselects or `||` are not pushed down either.
+
+    Args:
+        jmespath_selector (str): JMESPath selector of the read data
+
+    Returns:
+        Tuple[Union[str, None], Union[str, None], List[Tuple[str, str]]]: Operation name, path of the filtered items
+                                                                          e.g. `Reservations.Instances`,
+                                                                          and (field path, value) equalities
+    """
+    try:
+        parsed = jmespath.compile(jmespath_selector).parsed
+    except jmespath.exceptions.JMESPathError:
+        return None, None, []
+    if not _is_pushdown_safe(parsed):
+        return None, None, []
+
+    steps = _get_selector_steps(parsed)
+    filter_index = next((i for i, step in enumerate(steps) if step[0] == "filter"), None)
+    if filter_index is None:
+        return None, None, []
+
+    # Operation, list, (Field, list)*, Field, filter
+    path_steps = steps[:filter_index]
+    field_steps = path_steps[0::2]
+    list_steps = path_steps[1::2]
+    if (
+        len(path_steps) < 3
+        or len(path_steps) % 2 == 0
+        or any(step[0] != "field" for step in field_steps)
+        or any(step[0] != "list" for step in list_steps)
+    ):
+        return None, None, []
+
+    operation_name = field_steps[0][1]
+    items_path = ".".join(step[1] for step in field_steps[1:])
+    equalities = []
+    _collect_equalities(steps[filter_index][1], equalities)
+    return operation_name, items_path, equalities
+
+
+def translate_selector_to_api_filters(service_name: str, jmespath_selector: str) -> Dict[str, Dict]:
+    """Translates the equality filters of the selector to the server-side `Filters` of the selected operation.
+    The selector is still applied to the read data, so the untranslated parts are filtered on the client-side.
+
+    Args:
+        service_name (str): Name of the AWS service
+        jmespath_selector (str): JMESPath selector of the read data
+
+    Returns:
+        Dict[str, Dict]: operation name to the api parameters to call it with, e.g.
+                         `{"DescribeInstances": {"Filters": [{"Name": "vpc-id", "Values": ["vpc-123"]}]}}`
+    """
+    operation_name, items_path, equalities = get_selector_equalities(jmespath_selector)
+    filter_names = KNOWN_PUSHDOWN_FILTERS.get((service_name, operation_name))
+    if not filter_names or KNOWN_PUSHDOWN_ITEMS_PATHS.get((service_name, operation_name)) != items_path:
+        return {}
+
+    filter_values = {}
+    for field_path, value in equalities:
+        filter_name = filter_names.get(field_path)
+        if filter_name:
+            filter_values.setdefault(filter_name, set()).add(value)
+
+    api_filters = [
+        {"Name": filter_name, "Values": list(values)}
+        for filter_name, values in filter_values.items()
+        # different values of the same field can't all match, leave them to the client-side filtering
+        if len(values) == 1
+    ]
+    if not api_filters:
+        return {}
+    logger.debug(f"Pushing down the filters of the selector to [bold blue]{operation_name}[/]: {api_filters}")
+    return {operation_name: {"Filters": api_filters}}
+
+
+def translate_patterns_to_path_prefixes(patterns: List[str]) -> Union[List[str], None]:
+    """Translates the patterns like `/service-role/*` to iam `PathPrefix`es.
+
+    Args:
+        patterns (List[str]): UNIX style patterns
+
+    Returns:
+        Union[List[str], None]: Path prefixes, or None if any of the patterns is not a path prefix.
+    """
+    path_prefixes = []
+    for pattern in patterns:
+        path_prefix = pattern[:-1]
+        if (
+            not pattern.startswith("/")
+            or not pattern.endswith("*")
+            or any(char in path_prefix for char in "*?[]")
+        ):
+            return None
+        path_prefixes.append(path_prefix)
+    return path_prefixes
+
+
+def push_down_api_parameters(
+    operation_model: OperationModel,
+    api_parameters: List[Dict],
+    match_patterns: Optional[List[str]] = None,
+    api_filters: Optional[Dict] = None,
+) -> Tuple[List[Dict], Union[List[str], None]]:
+    """Adds the server-side filters to the api parameters of an operation, if its input shape allows them.
+
+    Args:
+        operation_model (OperationModel): botocore model of the operation
+        api_parameters (List[Dict]): Generated api parameters
+        match_patterns (Optional[List[str]], optional): UNIX style patterns. Defaults to None.
+        api_filters (Optional[Dict], optional): api parameters translated from the selector. Defaults to None.
+
+    Returns:
+        Tuple[List[Dict], Union[List[str], None]]: api parameters with the filters,
+                                                   and the patterns left to the client-side filtering.
+    """
+    input_shape = operation_model.input_shape
+    input_members = input_shape.members if input_shape else {}
+
+    if api_filters and all(key in input_members for key in api_filters):
+        filtered_api_parameters = []
+        for api_parameter in api_parameters:
+            filtered_api_parameter = dict(api_parameter)
+            for key, value in api_filters.items():
+                if key == "Filters":
+                    value = filtered_api_parameter.get("Filters", []) + value
+                filtered_api_parameter[key] = value
+            filtered_api_parameters.append(filtered_api_parameter)
+        api_parameters = filtered_api_parameters
+
+    if match_patterns and "PathPrefix" in input_members:
+        path_prefixes = translate_patterns_to_path_prefixes(match_patterns)
+        if path_prefixes:
+            logger.debug(f"Pushing down the patterns to [bold blue]{operation_model.name}[/] PathPrefix: {path_prefixes}")
+            api_parameters = [
+                {**api_parameter, "PathPrefix": path_prefix}
+                for api_parameter in api_parameters
+                for path_prefix in path_prefixes
+            ]
+            return api_parameters, None
+
+    return api_parameters, match_patterns
@@ -0,0 +1,265 @@
+from config import get_logger
+from botocore.exceptions import ClientError
+from collections import Counter
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+
+logger = get_logger(__name__)
+
+# concurrency limits of the AdaptiveRateLimiter, unless they're given
+DEFAULT_INITIAL_CONCURRENCY = 16
+DEFAULT_MAX_CONCURRENCY = 64
+
+# error codes AWS APIs use for throttled requests
+THROTTLING_ERROR_CODES = (
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "TransactionInProgressException",
+    "RequestLimitExceeded",
+    "BandwidthLimitExceeded",
+    "LimitExceededException",
+    "RequestThrottled",
+    "SlowDown",
+    "PriorRequestNotComplete",
+    "EC2ThrottledException",
+)
+
+
+def is_throttling_response(response: Dict) -> bool:
+    """Checks if the parsed response of an api call is a throttled one.
+
+    Args:
+        response (Dict): Parsed response, e.g. `ClientError.response`
+
+    Returns:
+        bool: True if the request is throttled
+    """
+    response = response or {}
+    error_code = response.get("Error", {}).get("Code", "")
+    status_code = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return error_code in THROTTLING_ERROR_CODES or status_code == 429
+
+
+def get_retry_after_from_response(response: Dict) -> Union[float, None]:
+    """Finds the `Retry-After` hint of the throttled response in seconds.
+
+    Args:
+        response (Dict): Parsed response, e.g. `ClientError.response`
+
+    Returns:
+        Union[float, None]: Seconds to wait, or None if there's no hint.
+    """
+    response = response or {}
+    headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+    retry_after = headers.get("retry-after")
+    try:
+        return float(retry_after) if retry_after is not None else None
+    except ValueError:
+        # HTTP-date formatted hints are not used by the AWS APIs
+        return None
+
+
+def is_throttling_error(error: ClientError) -> bool:
+    """Checks if the ClientError is raised because the request is throttled.
+
+    Args:
+        error (ClientError): Error raised by the boto3 client
+
+    Returns:
+        bool: True if the request is throttled
+    """
+    return is_throttling_response(getattr(error, "response", None))
+
+
+def get_retry_after(error: ClientError) -> Union[float, None]:
+    """Finds the `Retry-After` hint of the throttled error in seconds.
+
+    Args:
+        error (ClientError): Error raised by the boto3 client
+
+    Returns:
+        Union[float, None]: Seconds to wait, or None if there's no hint.
+    """
+    return get_retry_after_from_response(getattr(error, "response", None))
+
+
+class AdaptiveRateLimiter:
+    """Token bucket rate limiter with additive-increase/multiplicative-decrease(AIMD) rate and concurrency limits.
+
+    Until the first throttled call, every successful call increases the rate and concurrency limits by one.
+    After that, they're increased additively by one per concurrency limit worth of successful calls, and every
+    throttled attempt halves them. `Retry-After` hints of the throttled attempts pause all calls for the given duration.
+
+    Throttled calls are retried by botocore's own retry handler, the limiter only observes its attempts
+    with the `needs-retry` event, so the retries are not stacked on top of each other.
+
+    ```python title="Pacing the calls"
+    rate_limiter = AdaptiveRateLimiter("iam.us-east-1")
+    client.meta.events.register("needs-retry", rate_limiter.on_needs_retry)
+    rate_limiter.acquire()
+    try:
+        response = client.list_roles()
+        rate_limiter.release()
+    except ClientError:
+        rate_limiter.release(succeeded=False)
+    ```
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_rate: Optional[float] = 50.0,
+        min_rate: Optional[float] = 0.5,
+        max_rate: Optional[float] = 500.0,
+        initial_concurrency: Optional[int] = DEFAULT_INITIAL_CONCURRENCY,
+        max_concurrency: Optional[int] = DEFAULT_MAX_CONCURRENCY,
+        decrease_factor: Optional[float] = 0.5,
+    ) -> None:
+        """Initializes the limiter.
+
+        Args:
+            name (str): Name of the limited endpoint, used in the logs.
+            initial_rate (Optional[float], optional): Calls per second at start. Defaults to 50.0.
+            min_rate (Optional[float], optional): Lowest calls per second after throttling. Defaults to 0.5.
+            max_rate (Optional[float], optional): Highest calls per second. Defaults to 500.0.
+            initial_concurrency (Optional[int], optional): Concurrent calls at start. Defaults to 16.
+            max_concurrency (Optional[int], optional): Highest number of concurrent calls. Defaults to 64.
+            decrease_factor (Optional[float], optional): Limits are multiplied with it on throttling. Defaults to 0.5.
+        """
+        self.name = name
+        self.rate = float(initial_rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.concurrency_limit = float(initial_concurrency)
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.stats = Counter()
+        self._tokens = max(1.0, self.rate)
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._slow_start = True
+        self._condition = threading.Condition()
+
+    def _refill_tokens(self, now: float) -> None:
+        # bucket holds at most one second of calls
+        bucket_size = max(1.0, self.rate)
+        self._tokens = min(bucket_size, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self) -> None:
+        """Blocks until a call is allowed by the rate and concurrency limits."""
+        waited = 0.0
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill_tokens(now)
+                if now < self._paused_until:
+                    wait_seconds = self._paused_until - now
+                elif self._in_flight >= max(1, int(self.concurrency_limit)):
+                    # wait for a release
+                    wait_seconds = None
+                elif self._tokens < 1:
+                    wait_seconds = (1 - self._tokens) / self.rate
+                else:
+                    self._tokens -= 1
+                    self._in_flight += 1
+                    self.stats["calls"] += 1
+                    self.stats["waited_seconds"] += waited
+                    return
+                started_waiting = time.monotonic()
+                self._condition.wait(wait_seconds)
+                waited += time.monotonic() - started_waiting
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Decreases the limits after a throttled attempt.
+
+        Args:
+            retry_after (Optional[float], optional): `Retry-After` hint of the throttled attempt in seconds. Defaults to None.
+        """
+        with self._condition:
+            self._slow_start = False
+            self.stats["throttled"] += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self.concurrency_limit = max(1.0, self.concurrency_limit * self.decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            logger.debug(
+                f"[yellow]Throttled[/] on {self.name}, limits decreased to {self.rate:.2f} calls/s and {int(self.concurrency_limit)} concurrent calls."
+            )
+
+    def on_needs_retry(self, response: Optional[Tuple] = None, **kwargs) -> None:
+        """botocore `needs-retry` event handler, records the throttled attempts of the client's calls.
+        It doesn't change the retry decision of botocore.
+
+        Args:
+            response (Optional[Tuple], optional): (http response, parsed response) of the attempt, None if
+                                                  the attempt raised an exception. Defaults to None.
+        """
+        if response is None:
+            return None
+        parsed_response = response[1]
+        if is_throttling_response(parsed_response):
+            self.record_throttle(get_retry_after_from_response(parsed_response))
+        return None
+
+    def release(self, succeeded: Optional[bool] = True) -> None:
+        """Releases the acquired call, successful calls increase the limits.
+
+        Args:
+            succeeded (Optional[bool], optional): If the call succeeded. Defaults to True.
+        """
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            if not succeeded:
+                pass
+            elif self._slow_start:
+                # not throttled yet, grow by one for each successful call
+                self.rate = min(self.max_rate, self.rate + 1.0)
+                self.concurrency_limit = min(self.max_concurrency, self.concurrency_limit + 1.0)
+            else:
+                # additive increase, the rate grows by one per concurrency limit worth of successful calls
+                self.rate = min(self.max_rate, self.rate + 1.0 / self.concurrency_limit)
+                self.concurrency_limit = min(
+                    self.max_concurrency, self.concurrency_limit + 1.0 / self.concurrency_limit
+                )
+            self._condition.notify_all()
+
+
+class RateLimiterRegistry:
+    """Creates and stores an AdaptiveRateLimiter per (service, region) endpoint.
+    A BalconyAWS shares one registry with all of its ServiceNodes, the api calls are not limited without one."""
+
+    def __init__(self, **rate_limiter_kwargs: Dict) -> None:
+        """Initializes the registry.
+
+        Args:
+            **rate_limiter_kwargs: Keyword arguments passed to every created AdaptiveRateLimiter.
+        """
+        self.rate_limiter_kwargs = rate_limiter_kwargs
+        self._rate_limiters: Dict[Tuple[str, str], AdaptiveRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get_rate_limiter(self, service_name: str, region_name: Optional[str] = None) -> AdaptiveRateLimiter:
+        """Gets or creates the rate limiter of the endpoint.
+
+        Args:
+            service_name (str): Name of the AWS Service
+            region_name (Optional[str], optional): Region of the endpoint. Defaults to None.
+
+        Returns:
+            AdaptiveRateLimiter: Rate limiter shared by the calls to the endpoint
+        """
+        key = (service_name, region_name)
+        with self._lock:
+            if key not in self._rate_limiters:
+                self._rate_limiters[key] = AdaptiveRateLimiter(
+                    f"{service_name}.{region_name}", **self.rate_limiter_kwargs
+                )
+            return self._rate_limiters[key]
@@ -1,15 +1,55 @@
 from config import get_logger, get_rich_console
 from errors import Error
-from utils import inform_about_developing_custom_resource_nodes
-import fnmatch  # unix like pattern matching
+from utils import inform_about_developing_custom_resource_nodes, canonicalize_api_parameter
+from scheduler import OperationScheduler
+from single_flight import SingleFlight
+from bulk_readers import find_bulk_reader
+from bucket_regions import S3_NON_BUCKET_OPERATIONS, get_bucket_region_from_response
+from pushdown import push_down_api_parameters
+from pattern_matcher import PatternMatcher
+from botocore_utils import PaginationConfig
+from rate_limiter import is_throttling_error
+import queue
+import jmespath
+import threading
+import time
+from collections import Counter, namedtuple
 from collections.abc import Iterable
-from typing import List, Dict, Tuple, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Optional, Union, Callable, Generator
 from botocore.exceptions import ClientError
 
 
 logger = get_logger(__name__)
 console = get_rich_console()
 
+# read-states of the operations and their api calls
+READ_STATE_COMPLETE = "complete"
+READ_STATE_EMPTY = "empty"
+READ_STATE_FAILED = "failed"
+ReadState = namedtuple("ReadState", ["state", "error", "read_at"])
+
+# which related operations are re-read when an operation is refreshed
+REFRESH_POLICY_ALL = "all"  # the whole chain of relations
+REFRESH_POLICY_TARGET = "target"  # only the given operation
+REFRESH_POLICY_STALE = "stale"  # the given operation and the relations older than `refresh_max_age` seconds
+REFRESH_POLICIES = (REFRESH_POLICY_ALL, REFRESH_POLICY_TARGET, REFRESH_POLICY_STALE)
+
+
+class _PageStreamClosed(Exception):
+    """Stops the api calls of `iter_operation_pages` when its consumer stops iterating."""
+
+
+def api_parameters_match_pattern(
+    api_parameters: List[dict], patterns: Union[List[str], PatternMatcher, None]
+) -> List[dict]:
+    """Filters the generated api parameters with the UNIX style patterns, see `PatternMatcher.filter_api_parameters`."""
+    if not patterns:
+        return api_parameters
+    if not isinstance(patterns, PatternMatcher):
+        patterns = PatternMatcher(patterns)
+    return patterns.filter_api_parameters(api_parameters)
+
 
 class ServiceReader:
     """
@@ -23,75 +63,592 @@ class ServiceReader:
         }
     }
     ```
+
+    With `merge_pages` enabled, pages of a single api call are stored as one response.
+    Lists under the paginators `result_key`s are concatenated.
+
+    With a `response_cache`, fresh responses of the previous runs are used instead of calling the AWS API.
+
+    With `bulk_read` enabled, operations are satisfied by the `BulkReader` of the service if it has one,
+    e.g. iam Roles, Users, Groups and their policies are read from `GetAccountAuthorizationDetails`.
+
+    ServiceReader is thread-safe. Concurrent reads of the same operation, or calls with the same api parameters,
+    are single-flight: the first caller makes the calls and the others wait for its result.
+
+    Every read operation and api call gets a `ReadState`(complete, empty or failed), so they're never repeated
+    in the same run unless `refresh` is set. `get_read_stats` shows how many calls were made and avoided.
     """
 
-    def __init__(self, service_node: "ServiceNode") -> None:
+    def __init__(
+        self,
+        service_node: "ServiceNode",
+        merge_pages: Optional[bool] = False,
+        response_cache: Optional["ResponseCache"] = None,
+        bulk_read: Optional[bool] = False,
+    ) -> None:
         """Initializes the reader with the `service_node`.
 
         Args:
             service_node (ServiceNode): Associated ServiceNode.
+            merge_pages (Optional[bool], optional): Store the pages of an api call as one merged response. Defaults to False.
+            response_cache (Optional[ResponseCache], optional): Persistent response cache. Defaults to None.
+            bulk_read (Optional[bool], optional): Read the operations with the `BulkReader` of the service, if it has one.
+                                                  Defaults to False.
         """
         self.service_node = service_node
+        self.merge_pages = merge_pages
+        self.response_cache = response_cache
+        self.bulk_read = bulk_read
+        # the bulk reader is used once per run, unless it fails or the operations are refreshed
+        self._bulk_read_at = None
+        self._bulk_read_failed = False
+        # an operation of the bulk reader is cleared, e.g. by the scheduler before refreshing
+        self._bulk_refresh_pending = False
         self.response_data = {}
+        # guards `response_data` when operations are called from multiple threads
+        self._response_data_lock = threading.Lock()
+        # (resource_node_name, operation_name) -> ReadState of the operation
+        self.operation_read_states: Dict[Tuple[str, str], ReadState] = {}
+        # (resource_node_name, operation_name) -> canonicalized api parameter -> ReadState of the api call
+        self.api_call_read_states: Dict[Tuple[str, str], Dict[str, ReadState]] = {}
+        # (operation_name, canonicalized api parameter, follow_pagination) -> (ReadState, saved pages) of the api call,
+        # shared by the ResourceNodes that call the same operation
+        self.api_call_memo: Dict[Tuple[str, str, bool], Tuple[ReadState, List[dict]]] = {}
+        self._read_stats = Counter()
+        self._read_stats_lock = threading.Lock()
+        # concurrent reads of the same operation or api call wait for the first one
+        self._operation_flights = SingleFlight()
+        self._api_call_flights = SingleFlight()
+
+    def _increment_read_stat(self, stat_name: str, count: Optional[int] = 1) -> None:
+        with self._read_stats_lock:
+            self._read_stats[stat_name] += count
+
+    def get_read_stats(self) -> Dict[str, int]:
+        """Returns the counters of the reader.
+
+        ```json title="Read stats"
+        {
+            "api_calls": 42,            # calls made to the AWS API, each page counts
+            "response_cache_hits": 0,   # api calls served from the response_cache
+            "avoided_api_calls": 3,     # api calls that were already made in this run
+            "avoided_reads": 7,         # read_operation calls served from their read-state
+            "throttled_calls": 1,       # api calls still throttled after botocore's retries
+            "memoized_api_calls": 2,    # api calls already made by another ResourceNode
+            "duplicate_api_calls": 5,   # duplicate generated api parameters that are not called
+            "derived_api_calls": 9,     # api calls answered from the related operations data
+            "api_call_cpu_us": 81230    # cpu time spent in botocore for the api calls, in microseconds
+        }
+        ```
+
+        Returns:
+            Dict[str, int]: counter name to value mapping
+        """
+        stats = {
+            "api_calls": 0,
+            "response_cache_hits": 0,
+            "avoided_api_calls": 0,
+            "avoided_reads": 0,
+            "throttled_calls": 0,
+            "memoized_api_calls": 0,
+            "duplicate_api_calls": 0,
+            "derived_api_calls": 0,
+            "api_call_cpu_us": 0,
+        }
+        with self._read_stats_lock:
+            stats.update(self._read_stats)
+        return stats
+
+    def get_read_state(
+        self,
+        resource_node_name: str,
+        operation_name: str,
+        api_parameter: Optional[Dict] = None,
+    ) -> Union[ReadState, None]:
+        """Gets the read-state of the operation, or of its api call with `api_parameter`.
+
+        Args:
+            resource_node_name (str): Name of the ResourceNode
+            operation_name (str): Name of the Operation
+            api_parameter (Optional[Dict], optional): api parameters of the call. Defaults to None.
+
+        Returns:
+            Union[ReadState, None]: (state, error) namedtuple, or None if it's not read yet.
+        """
+        key = (resource_node_name, operation_name)
+        if api_parameter is None:
+            return self.operation_read_states.get(key)
+        return self.api_call_read_states.get(key, {}).get(
+            canonicalize_api_parameter(api_parameter)
+        )
+
+    def get_operation_error(
+        self, resource_node_name: str, operation_name: str
+    ) -> Union[Error, None]:
+        """Gets the error of a failed operation. Prefers the error of its failed api calls, as it has the AWS exception.
+
+        Args:
+            resource_node_name (str): Name of the ResourceNode
+            operation_name (str): Name of the Operation
+
+        Returns:
+            Union[Error, None]: Error of the operation, or None if it's not failed.
+        """
+        read_state = self.get_read_state(resource_node_name, operation_name)
+        if not read_state or read_state.state != READ_STATE_FAILED:
+            return None
+        api_call_read_states = self.api_call_read_states.get((resource_node_name, operation_name), {})
+        for api_call_read_state in list(api_call_read_states.values()):
+            if api_call_read_state.state == READ_STATE_FAILED and api_call_read_state.error:
+                return api_call_read_state.error
+        return read_state.error
+
+    def get_operation_age(
+        self, resource_node_name: str, operation_name: str
+    ) -> Union[float, None]:
+        """Finds how many seconds ago the operation was read. Uses the `response_cache` if it's not read in this run.
+
+        Args:
+            resource_node_name (str): Name of the ResourceNode
+            operation_name (str): Name of the Operation
+
+        Returns:
+            Union[float, None]: Age of the operations data in seconds, or None if it's unknown.
+        """
+        read_state = self.get_read_state(resource_node_name, operation_name)
+        if read_state:
+            return time.time() - read_state.read_at
+        if self.response_cache:
+            created_at = self.response_cache.get_created_at(self.get_cache_scope(), operation_name)
+            if created_at is not None:
+                return time.time() - created_at
+        return None
+
+    def should_refresh_relation(
+        self,
+        resource_node_name: str,
+        operation_name: str,
+        refresh: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+    ) -> bool:
+        """Decides if a related operation is re-read while refreshing its dependent operation.
+
+        Args:
+            resource_node_name (str): Name of the related ResourceNode
+            operation_name (str): Name of the related Operation
+            refresh (Optional[bool], optional): If the dependent operation is refreshed. Defaults to False.
+            refresh_policy (Optional[str], optional): One of `REFRESH_POLICIES`. Defaults to `REFRESH_POLICY_ALL`.
+            refresh_max_age (Optional[int], optional): Seconds the related data is fresh for `REFRESH_POLICY_STALE`. Defaults to 0.
+
+        Raises:
+            ValueError: If the refresh_policy is unknown
+
+        Returns:
+            bool: refresh value to read the related operation with
+        """
+        if refresh_policy not in REFRESH_POLICIES:
+            raise ValueError(f"Unknown refresh policy: {refresh_policy}. Use one of: {', '.join(REFRESH_POLICIES)}")
+        if not refresh:
+            return False
+        if refresh_policy == REFRESH_POLICY_TARGET:
+            return False
+        if refresh_policy == REFRESH_POLICY_STALE:
+            operation_age = self.get_operation_age(resource_node_name, operation_name)
+            return operation_age is None or operation_age > refresh_max_age
+        return True
+
+    def _is_response_empty(
+        self, resource_node: "ResourceNode", operation_name: str, response: dict
+    ) -> bool:
+        """Checks if the response page doesn't have any resources. Paginators `result_keys` are used if available,
+        otherwise the top level lists are checked."""
+        pagination_config = resource_node.get_pagination_config(operation_name)
+        if pagination_config and pagination_config.result_keys:
+            results = [
+                jmespath.search(result_key, response)
+                for result_key in pagination_config.result_keys
+            ]
+        else:
+            results = [value for key, value in response.items() if key != "__args__" and isinstance(value, list)]
+            if not results:
+                # not a list operation, e.g. GetRole
+                return False
+        return not any(results)
+
+    def _make_api_call(self, operation_name: str, api_parameter: Dict) -> dict:
+        """Makes a single api call, paced by the ServiceNodes rate limiter if it has one.
+        Throttled calls are retried by botocore's retry handler.
+
+        Args:
+            operation_name (str): Name of the operation
+            api_parameter (Dict): dictionary to call the operation with
+
+        Raises:
+            ClientError: If the call fails, or it's still throttled after botocore's retries.
+
+        Returns:
+            dict: boto API response
+        """
+        client = self.get_client_for_api_call(operation_name, api_parameter)
+        rate_limiter = self.service_node.get_rate_limiter(client.meta.region_name)
+        if rate_limiter:
+            rate_limiter.acquire()
+        succeeded = False
+        # cpu time of the calling thread, waiting for the response is not counted
+        cpu_time_start = time.thread_time()
+        try:
+            self._increment_read_stat("api_calls")
+            response = client._make_api_call(operation_name, api_parameter)
+            succeeded = True
+            return response
+        except ClientError as e:
+            if is_throttling_error(e):
+                self._increment_read_stat("throttled_calls")
+            raise
+        finally:
+            self._increment_read_stat(
+                "api_call_cpu_us", int((time.thread_time() - cpu_time_start) * 1_000_000)
+            )
+            if rate_limiter:
+                rate_limiter.release(succeeded=succeeded)
+
+    def get_client_for_api_call(self, operation_name: str, api_parameter: Dict):
+        """Returns the client to make the api call with. Per-bucket s3 calls are made with the client of the
+        bucket's region, so they're not redirected. Unknown bucket regions are resolved once with `HeadBucket`.
+
+        Args:
+            operation_name (str): Name of the operation
+            api_parameter (Dict): dictionary to call the operation with
+
+        Returns:
+            botocore.client.BaseClient: client of the ServiceNode, or of the bucket's region
+        """
+        bucket_regions = self.service_node.bucket_regions
+        bucket_name = api_parameter.get("Bucket")
+        if (
+            bucket_regions is None
+            or operation_name in S3_NON_BUCKET_OPERATIONS
+            or not isinstance(bucket_name, str)
+        ):
+            return self.service_node.client
+        region_name = bucket_regions.get(bucket_name)
+        if region_name is None:
+            region_name, _ = self._operation_flights.do(
+                ("__bucket_region__", bucket_name), self._resolve_bucket_region, bucket_name
+            )
+        return self.service_node.get_regional_client(region_name)
+
+    def _resolve_bucket_region(self, bucket_name: str) -> str:
+        try:
+            response = self._make_api_call("HeadBucket", {"Bucket": bucket_name})
+        except ClientError as e:
+            response = e.response
+        # if the region can't be found, the client of the ServiceNode is used as before
+        region_name = get_bucket_region_from_response(response) or self.service_node.get_region_name()
+        logger.debug(f"Resolved the region of the bucket [bold]{bucket_name}[/]: {region_name}")
+        self.service_node.bucket_regions.set(bucket_name, region_name)
+        return region_name
+
+    def paginate_operation(
+        self,
+        resource_node: "ResourceNode",
+        operation_name: str,
+        api_parameter: Dict,
+        follow_pagination: Optional[bool] = False,
+    ) -> Generator[dict, None, None]:
+        """Calls the given AWS operation with `api_parameter` dict and yields the response pages as they're fetched.
+        Pagination tokens are followed in a loop, pages are not saved on `self.response_data`.
+
+        Args:
+            resource_node: Operations Resource Node
+            operation_name (str): Name of the operation
+            api_parameter (dict): dictionary to call the operation with
+            follow_pagination (Optional[bool]): If the operations output is truncated follow the pagination tokens.
+
+        Raises:
+            ClientError: If any of the calls fail. Already yielded pages are not affected.
+
+        Yields:
+            dict: Response page, with its `__args__`.
+        """
+        pagination_config = False
+        if follow_pagination:
+            # check if the operation is paginated
+            pagination_config = resource_node.get_pagination_config(operation_name)
+
+        seen_page_tokens = []
+        page_api_parameter = api_parameter
+        while page_api_parameter is not None:
+            logger.debug(
+                f"Calling operation: [bold blue]{operation_name}[/] with api parameters: {page_api_parameter}"
+            )
+            response = self._make_api_call(operation_name, page_api_parameter)
+            # removing ResponseMetadata, it is not needed
+            response.pop("ResponseMetadata", None)
+            response["__args__"] = page_api_parameter
+            page_api_parameter = None
+
+            if pagination_config:
+                # we may find out the operation is paginated, but the queried resource might not be much in quantity
+                # so, response might not have a Pagination token, although the operation is paginated
+                next_page_tokens = pagination_config.get_next_page_tokens(response)
+                if next_page_tokens and next_page_tokens in seen_page_tokens:
+                    logger.debug(
+                        f"[red]Repeated pagination token[/] for [bold blue]{operation_name}[/], stopping the pagination: {next_page_tokens}"
+                    )
+                elif next_page_tokens:
+                    seen_page_tokens.append(next_page_tokens)
+                    page_api_parameter = api_parameter.copy()
+                    for input_token, token_value in next_page_tokens.items():
+                        if token_value is not None:
+                            page_api_parameter[input_token] = token_value
+                        else:
+                            page_api_parameter.pop(input_token, None)
+            yield response
 
     def call_operation(
-        self, resource_node: "ResourceNode", operation_name: str, api_parameter: Dict, follow_pagination : Optional[bool] = False # noqa  
+        self,
+        resource_node: "ResourceNode",
+        operation_name: str,
+        api_parameter: Dict,
+        follow_pagination: Optional[bool] = False,
+        on_page: Optional[Callable[[dict], None]] = None,
+        save: Optional[bool] = True,
     ) -> Union[dict, bool]:
-        """Calls the given AWS operation with `api_parameter` dict.
-        Saves the response data on `self.response_data` and returns it.
+        """Calls the given AWS operation with `api_parameter` dict, see `_call_operation`.
+        If the same call is already in-flight in another thread, waits for it and uses its result.
 
         Args:
             resource_node: Operations Resource Node
             operation_name (str): Name of the operation
             api_parameter (dict): dictionary to call the operation with
             follow_pagination (Optional[bool]): If the operations output is truncated follow the pagination tokens.
+            on_page (Optional[Callable[[dict], None]]): Called with each response page as soon as it's saved.
+            save (Optional[bool]): Save the response pages and the read-state of the call. Defaults to True.
 
         Returns:
             Union[dict, bool]: `False` or response got from AWS API
         """
-        client = self.service_node.client
+        flight_key = (operation_name, canonicalize_api_parameter(api_parameter), bool(follow_pagination), bool(save))
+        result, shared = self._api_call_flights.do(
+            flight_key,
+            self._call_operation,
+            resource_node,
+            operation_name,
+            api_parameter,
+            follow_pagination,
+            on_page,
+            save,
+        )
+        if shared:
+            # made by a concurrent caller, now its read-state or memoized response is used
+            return self._call_operation(
+                resource_node, operation_name, api_parameter, follow_pagination, on_page, save
+            )
+        return result
+
+    def _call_operation(
+        self,
+        resource_node: "ResourceNode",
+        operation_name: str,
+        api_parameter: Dict,
+        follow_pagination: Optional[bool] = False,
+        on_page: Optional[Callable[[dict], None]] = None,
+        save: Optional[bool] = True,
+    ) -> Union[dict, bool]:
+        """Calls the given AWS operation with `api_parameter` dict.
+        Saves each response page on `self.response_data` and returns the first one.
+        If `self.merge_pages` is set, saves and returns the merged pages instead.
+
+        Without `save`, pages are only passed to `on_page`: they're not saved, merged or written to the response cache,
+        and the read-state of the call is not recorded. Already made, memoized or cached calls are still reused.
+
+        Args:
+            resource_node: Operations Resource Node
+            operation_name (str): Name of the operation
+            api_parameter (dict): dictionary to call the operation with
+            follow_pagination (Optional[bool]): If the operations output is truncated follow the pagination tokens.
+            on_page (Optional[Callable[[dict], None]]): Called with each response page as soon as it's saved.
+            save (Optional[bool]): Save the response pages and the read-state of the call. Defaults to True.
 
+        Returns:
+            Union[dict, bool]: `False` or response got from AWS API
+        """
         if not resource_node:
             return False
 
-        try:
+        read_state = self.get_read_state(resource_node.name, operation_name, api_parameter)
+        if read_state:
+            self._increment_read_stat("avoided_api_calls")
             logger.debug(
-                f"Calling operation: [bold blue]{operation_name}[/] with api parameters: {api_parameter}"
+                f"[bold blue]{operation_name}[/] is already called with api parameters: {api_parameter}, read-state: {read_state.state}"
             )
-            response = client._make_api_call(operation_name, api_parameter)
-            # check if the operation is paginated
-            pagination_tokens = (
-                resource_node.get_pagination_token_output_to_parameter_name_mapping(
-                    operation_name
+            if read_state.state == READ_STATE_FAILED:
+                return False
+            called_pages = [
+                page
+                for page in self.search_operation_data(resource_node.name, operation_name) or []
+                if page.get("__args__") == api_parameter
+            ]
+            if on_page:
+                for page in called_pages:
+                    on_page(page)
+            return called_pages[0] if called_pages else False
+
+        api_parameter_key = canonicalize_api_parameter(api_parameter)
+        memo_key = (operation_name, api_parameter_key, bool(follow_pagination))
+        pages = False
+        memoized_call = self.api_call_memo.get(memo_key)
+        if memoized_call:
+            # another ResourceNode made the same call
+            memoized_read_state, pages = memoized_call
+            self._increment_read_stat("memoized_api_calls")
+            logger.debug(
+                f"Using the memoized response of [bold blue]{operation_name}[/] with api parameters: {api_parameter}"
+            )
+            if memoized_read_state.state == READ_STATE_FAILED:
+                with self._response_data_lock:
+                    self.api_call_read_states.setdefault((resource_node.name, operation_name), {})[
+                        api_parameter_key
+                    ] = memoized_read_state
+                return False
+
+        fetched_pages = None
+        if self.response_cache and not pages:
+            pages = self.response_cache.get(
+                self.get_cache_scope(), operation_name, api_parameter, follow_pagination
+            )
+            if pages:
+                self._increment_read_stat("response_cache_hits")
+                logger.debug(
+                    f"Using the cached response of [bold blue]{operation_name}[/] with api parameters: {api_parameter}"
                 )
+            elif save:
+                fetched_pages = []
+        if not pages:
+            pages = self.paginate_operation(
+                resource_node, operation_name, api_parameter, follow_pagination=follow_pagination
             )
-            if follow_pagination and pagination_tokens:
-                # try to find the name of the operation you'd want to fill out
-                # and where to find it from in the response
-                pagination_parameter_name = pagination_tokens.get("parameter_name")
-                pagination_output_key = pagination_tokens.get("output_key")
-                # we may find out the operation is paginated, but the queried resource might not be much in quantity
-                # so, response might not have a Pagination token, although the operation is paginated
-                page_value_in_response = response.get(pagination_output_key, False)
-                if page_value_in_response:
-                    paginated_api_parameters = api_parameter.copy()
-                    paginated_api_parameters[
-                        pagination_parameter_name
-                    ] = page_value_in_response
-                    self.call_operation(
-                        resource_node, operation_name, paginated_api_parameters, follow_pagination=follow_pagination
-                    )
+
+        first_response = False
+        pages_to_merge = []
+        saved_pages = []
+        read_state = ReadState(READ_STATE_EMPTY, None, None)
+        try:
+            bucket_regions = self.service_node.bucket_regions
+            for response in pages:
+                if bucket_regions is not None:
+                    # learn the regions of the buckets from ListBuckets
+                    bucket_regions.add_response(operation_name, response)
+                if read_state.state == READ_STATE_EMPTY and not self._is_response_empty(
+                    resource_node, operation_name, response
+                ):
+                    read_state = ReadState(READ_STATE_COMPLETE, None, None)
+                if fetched_pages is not None:
+                    fetched_pages.append(response)
+                if not save:
+                    pass
+                elif self.merge_pages:
+                    pages_to_merge.append(response)
+                else:
+                    self.add_to_node_data(resource_node.name, operation_name, response)
+                    saved_pages.append(response)
+                if on_page:
+                    on_page(response)
+                if first_response is False:
+                    first_response = response
         except ClientError as e:
             logger.debug(
                 f"[red bold]FAILED: Calling Operation[/]. {operation_name}({api_parameter}). Exception: {str(e)}"
             )
-            return False
+            if is_throttling_error(e):
+                # don't let throttling turn into silently missing data
+                logger.warning(
+                    f"[red bold]Throttled[/]: {self.service_node.name}.{operation_name}({api_parameter}) is still throttled after the retries, its data is incomplete."
+                )
+            first_response = False
+            fetched_pages = None
+            read_state = ReadState(
+                READ_STATE_FAILED,
+                Error(
+                    "client error",
+                    {
+                        "service": self.service_node.name,
+                        "resource_node": resource_node.name,
+                        "operation_name": operation_name,
+                        "api_parameter": api_parameter,
+                        "exception": str(e),
+                    },
+                ),
+                None,
+            )
+
+        if pages_to_merge:
+            # already fetched pages are saved even if a later page fails
+            merged_response = self.merge_operation_pages(
+                resource_node, operation_name, pages_to_merge
+            )
+            self.add_to_node_data(resource_node.name, operation_name, merged_response)
+            saved_pages.append(merged_response)
+            if first_response is not False:
+                first_response = merged_response
+
+        if not save:
+            return first_response
+
+        read_state = read_state._replace(read_at=time.time())
+        with self._response_data_lock:
+            self.api_call_read_states.setdefault((resource_node.name, operation_name), {})[
+                api_parameter_key
+            ] = read_state
+            if read_state.state == READ_STATE_FAILED:
+                self.api_call_memo[memo_key] = (read_state, [])
+            else:
+                self.api_call_memo[memo_key] = (read_state, saved_pages)
+
+        if fetched_pages:
+            # only the complete api calls are cached
+            self.response_cache.set(
+                self.get_cache_scope(), operation_name, api_parameter, follow_pagination, fetched_pages
+            )
+
+        return first_response
+
+    def get_cache_scope(self) -> "CacheScope":
+        """Returns the (account_id, region, service_name) scope of the cached responses.
+        Responses parsed with the non-default `ServiceNode.get_response_format()` are scoped separately.
+
+        Returns:
+            CacheScope: scope of the ServiceNodes responses in the `response_cache`
+        """
+        client = self.service_node.client
+        account_id = self.response_cache.get_account_id(self.service_node.session)
+        service_scope = self.service_node.name
+        response_format = self.service_node.get_response_format()
+        if response_format:
+            # e.g. raw timestamps must not be served to the readers that expect datetime objects
+            service_scope = f"{service_scope}[{response_format}]"
+        return account_id, client.meta.region_name, service_scope
+
+    def merge_operation_pages(
+        self, resource_node: "ResourceNode", operation_name: str, pages: List[dict]
+    ) -> dict:
+        """Merges the response pages of a single api call using the operations pagination config.
+
+        Args:
+            resource_node: Operations Resource Node
+            operation_name (str): Name of the operation
+            pages (List[dict]): Response pages in the order they're fetched
 
-        # removing ResponseMetadata, it is not needed
-        response.pop("ResponseMetadata")
-        response["__args__"] = api_parameter
-        self.add_to_node_data(resource_node.name, operation_name, response)
-        return response
+        Returns:
+            dict: Merged response
+        """
+        pagination_config = resource_node.get_pagination_config(operation_name)
+        if not pagination_config:
+            # not paginated, so there's a single page
+            pagination_config = PaginationConfig(input_tokens=[], output_tokens=[])
+        return pagination_config.merge_pages(pages)
 
     def search_operation_data(
         self, resource_node_name: str, operation_name: str
@@ -129,12 +686,23 @@ class ServiceReader:
     def clear_operations_data(
         self, resource_node_name: str, operation_name: str
     ) -> None:
-        """Refreshes the operations data to empty list.
+        """Refreshes the operations data to empty list. Also removes its responses from the `response_cache`.
 
         Args:
             resource_node_name (str): Name of the ResourceNode
             operation_name (str): Name of the Operation
         """
+        if self.response_cache:
+            self.response_cache.invalidate(self.get_cache_scope(), operation_name)
+        if self.bulk_read:
+            bulk_reader = find_bulk_reader(self.service_node.name)
+            if bulk_reader and (resource_node_name, operation_name) in bulk_reader.operation_keys:
+                self._bulk_refresh_pending = True
+        self.operation_read_states.pop((resource_node_name, operation_name), None)
+        self.api_call_read_states.pop((resource_node_name, operation_name), None)
+        with self._response_data_lock:
+            for memo_key in [key for key in self.api_call_memo if key[0] == operation_name]:
+                self.api_call_memo.pop(memo_key, None)
         resource_node_exists = (
             self.response_data.get(resource_node_name, False) != False  # noqa
         )
@@ -151,17 +719,210 @@ class ServiceReader:
             operation_name (str): Name of the Operation
             response (dict): boto API response dict
         """
-        resource_node_exists = (
-            self.response_data.get(resource_node_name, False) != False # noqa
+        with self._response_data_lock:
+            resource_node_exists = (
+                self.response_data.get(resource_node_name, False) != False # noqa
+            )
+
+            if not resource_node_exists:
+                self.response_data[resource_node_name] = {}
+
+            if operation_name not in self.response_data[resource_node_name]:
+                self.response_data[resource_node_name][operation_name] = [response]
+            else:
+                self.response_data[resource_node_name][operation_name].append(response)
+
+    def deduplicate_api_parameters(self, api_parameters: List[Dict]) -> List[Dict]:
+        """Removes the duplicate api parameters, keeping their order. Removed ones are counted as `duplicate_api_calls`.
+
+        Args:
+            api_parameters (List[Dict]): Generated api parameters
+
+        Returns:
+            List[Dict]: Unique api parameters
+        """
+        unique_api_parameters = []
+        seen_api_parameter_keys = set()
+        for api_parameter in api_parameters:
+            api_parameter_key = canonicalize_api_parameter(api_parameter)
+            if api_parameter_key in seen_api_parameter_keys:
+                continue
+            seen_api_parameter_keys.add(api_parameter_key)
+            unique_api_parameters.append(api_parameter)
+        duplicate_count = len(api_parameters) - len(unique_api_parameters)
+        if duplicate_count:
+            self._increment_read_stat("duplicate_api_calls", duplicate_count)
+        return unique_api_parameters
+
+    def call_operation_for_api_parameters(
+        self,
+        resource_node: "ResourceNode",
+        operation_name: str,
+        api_parameters: List[Dict],
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        on_page: Optional[Callable[[dict], None]] = None,
+        save: Optional[bool] = True,
+    ) -> None:
+        """Calls the operation once for each of the `api_parameters`.
+        If `max_workers` is bigger than 1, calls are made concurrently with a bounded thread pool.
+        Responses are saved on `self.response_data`, their order is not guaranteed when called concurrently.
+
+        Args:
+            resource_node (ResourceNode): Operations Resource Node
+            operation_name (str): Name of the operation
+            api_parameters (List[Dict]): List of api parameter dicts to call the operation with
+            follow_pagination (Optional[bool]): If the operations output is truncated follow the pagination tokens.
+            max_workers (Optional[int]): Maximum number of concurrent calls. Defaults to 1.
+            on_page (Optional[Callable[[dict], None]]): Called with each response page as soon as it's saved.
+            save (Optional[bool]): Save the response pages and the read-states, see `_call_operation`. Defaults to True.
+        """
+        api_parameters = self.deduplicate_api_parameters(api_parameters)
+        if not max_workers or max_workers <= 1 or len(api_parameters) <= 1:
+            for api_parameter in api_parameters:
+                # for each parameter generated, call the actual operation
+                self.call_operation(
+                    resource_node,
+                    operation_name,
+                    api_parameter,
+                    follow_pagination=follow_pagination,
+                    on_page=on_page,
+                    save=save,
+                )
+            return
+
+        logger.debug(
+            f"Calling [bold blue]{operation_name}[/] for {len(api_parameters)} api parameters with {max_workers} workers."
         )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.call_operation, resource_node, operation_name, api_parameter, follow_pagination, on_page, save
+                )
+                for api_parameter in api_parameters
+            ]
+            try:
+                for future in futures:
+                    # call_operation handles the ClientErrors, re-raise anything unexpected
+                    future.result()
+            except BaseException:
+                # don't make the rest of the calls
+                for future in futures:
+                    future.cancel()
+                raise
 
-        if not resource_node_exists:
-            self.response_data[resource_node_name] = {}
+    def filter_api_parameters(
+        self, api_parameters: List[Dict], match_patterns: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """Filters the generated api parameters with the `match_patterns`, if they're given.
 
-        if operation_name not in self.response_data[resource_node_name]:
-            self.response_data[resource_node_name][operation_name] = [response]
-        else:
-            self.response_data[resource_node_name][operation_name].append(response)
+        Args:
+            api_parameters (List[Dict]): Generated api parameters
+            match_patterns (Optional[List[str]]): UNIX style patterns, prefixed with `!` to exclude.
+
+        Returns:
+            List[Dict]: Matching api parameters
+        """
+        if not match_patterns:
+            return api_parameters
+        matched_api_parameters = api_parameters_match_pattern(api_parameters, match_patterns)
+        logger.debug(
+            f"Matching patterns: {match_patterns}. Filtered the generated api parameters [{len(matched_api_parameters)}/{len(api_parameters)}]"
+        )
+        return matched_api_parameters
+
+    def add_server_side_filters(
+        self,
+        resource_node: "ResourceNode",
+        operation_name: str,
+        api_parameters: List[Dict],
+        match_patterns: Optional[List[str]] = None,
+    ) -> Tuple[List[Dict], Union[List[str], None]]:
+        """Pushes the `match_patterns` and the ServiceNodes `api_filters` of the operation down to its native filter
+        parameters, e.g. ec2 `Filters` or iam `PathPrefix`, if its input shape allows them.
+        Only the matching resources are fetched, and saved as the operations data.
+
+        Args:
+            resource_node (ResourceNode): Operations Resource Node
+            operation_name (str): Name of the operation
+            api_parameters (List[Dict]): Generated api parameters
+            match_patterns (Optional[List[str]]): UNIX style patterns to filter the generated api parameters.
+
+        Returns:
+            Tuple[List[Dict], Union[List[str], None]]: api parameters with the filters,
+                                                       and the patterns left to the client-side filtering.
+        """
+        return push_down_api_parameters(
+            resource_node.get_operation_model(operation_name),
+            api_parameters,
+            match_patterns,
+            self.service_node.api_filters.get(operation_name),
+        )
+
+    def save_derived_responses(
+        self,
+        resource_node: "ResourceNode",
+        operation_name: str,
+        related_operations_data: Dict,
+        match_patterns: Optional[List[str]] = None,
+        on_page: Optional[Callable[[dict], None]] = None,
+    ) -> Union[List, Tuple[bool, Error]]:
+        """Saves the responses derived by the `resource_node` from the related operations data, instead of calling AWS.
+        Each derived response gets the read-state of its api call, like a called one. They're counted as `derived_api_calls`.
+
+        Args:
+            resource_node (ResourceNode): Operations Resource Node
+            operation_name (str): Name of the operation
+            related_operations_data (Dict): All related operations data
+            match_patterns (Optional[List[str]]): UNIX style patterns to filter the derived responses by their `__args__`.
+            on_page (Optional[Callable[[dict], None]]): Called with each response as soon as it's saved.
+
+        Returns:
+            Union[List, Tuple[bool, Error]]: Operations data, or (False, Error) if the responses can't be derived.
+        """
+        derived_responses, derive_error = resource_node.derive_operation_responses(
+            operation_name, related_operations_data
+        )
+        if derive_error is not None:
+            logger.debug(
+                f"Failed to derive the responses of [bold blue]{operation_name}[/]: {derive_error}"
+            )
+            inform_about_developing_custom_resource_nodes()
+            return False, derive_error
+
+        if match_patterns:
+            matched_api_parameter_keys = {
+                canonicalize_api_parameter(api_parameter)
+                for api_parameter in api_parameters_match_pattern(
+                    [response["__args__"] for response in derived_responses], match_patterns
+                )
+            }
+            derived_responses = [
+                response
+                for response in derived_responses
+                if canonicalize_api_parameter(response["__args__"]) in matched_api_parameter_keys
+            ]
+
+        saved_count = 0
+        read_at = time.time()
+        for response in derived_responses:
+            api_parameter_key = canonicalize_api_parameter(response["__args__"])
+            with self._response_data_lock:
+                api_call_read_states = self.api_call_read_states.setdefault(
+                    (resource_node.name, operation_name), {}
+                )
+                if api_parameter_key in api_call_read_states:
+                    continue
+                api_call_read_states[api_parameter_key] = ReadState(READ_STATE_COMPLETE, None, read_at)
+            self.add_to_node_data(resource_node.name, operation_name, response)
+            saved_count += 1
+            if on_page:
+                on_page(response)
+        self._increment_read_stat("derived_api_calls", saved_count)
+        logger.debug(
+            f"Derived {saved_count} responses of [bold blue]{operation_name}[/] from its related operations data."
+        )
+        return self.search_operation_data(resource_node.name, operation_name) or []
 
     def read_operation(
         self,
@@ -169,21 +930,239 @@ class ServiceReader:
         operation_name: str,
         match_patterns: Optional[List[str]] = None,
         refresh: Optional[bool] = False,
-        follow_pagination: Optional[bool] = False
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        pipeline: Optional[bool] = False,
+        on_page: Optional[Callable[[dict], None]] = None,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
     ) -> Tuple[Union[List, bool], Union[Error, None]]:
         """Reads the given operation.
         If the operation is called with generated parameters, `match_patterns` can be used to filter the generated parameters.
 
+        With `pipeline` enabled, an operation with a single relation doesn't wait for all pages of the related operation.
+        Each related page is turned into api parameters as soon as it's read, and the calls are dispatched immediately.
+
         Args:
             resource_node_name (str): Name of the Resource Node
             operation_name (str): Name of the Operation
             match_patterns (List[str], optional): UNIX style patterns to filter matching generated parameters. Defaults to None.
             refresh (bool, optional): Get the cached data or force re-reading the operation. Defaults to False.
             follow_pagination (bool, optional): Follow pagination tokens. If not only set True, one page call will be made.
+            max_workers (int, optional): Number of concurrent calls made for the generated api parameters. Defaults to 1.
+            pipeline (bool, optional): Start calling the operation as soon as the first related page arrives. Defaults to False.
+            on_page (Callable[[dict], None], optional): Called with each page of this operation, including the already read ones.
+            refresh_policy (str, optional): Which relations are re-read with `refresh`, one of `REFRESH_POLICIES`.
+                                            Defaults to `REFRESH_POLICY_ALL`.
+            refresh_max_age (int, optional): With `REFRESH_POLICY_STALE`, relations read in the last `refresh_max_age`
+                                             seconds are not re-read. Defaults to 0.
+
+        Returns:
+            Tuple[Union[List, bool], Union[Error, None]]: Operations data, or a (False, Error) tuple if it failed.
+        """
+        flight_key = (
+            resource_node_name,
+            operation_name,
+            tuple(match_patterns or ()),
+            bool(follow_pagination),
+        )
+        read_kwargs = dict(
+            match_patterns=match_patterns,
+            refresh=refresh,
+            follow_pagination=follow_pagination,
+            max_workers=max_workers,
+            pipeline=pipeline,
+            on_page=on_page,
+            refresh_policy=refresh_policy,
+            refresh_max_age=refresh_max_age,
+        )
+        result, shared = self._operation_flights.do(
+            flight_key, self._read_operation_once, resource_node_name, operation_name, **read_kwargs
+        )
+        if shared:
+            # read by a concurrent caller, no need to refresh it again
+            read_kwargs["refresh"] = False
+            return self._read_operation_once(resource_node_name, operation_name, **read_kwargs)
+        return result
+
+    def _read_operation_once(
+        self,
+        resource_node_name: str,
+        operation_name: str,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        pipeline: Optional[bool] = False,
+        on_page: Optional[Callable[[dict], None]] = None,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+    ) -> Tuple[Union[List, bool], Union[Error, None]]:
+        """Returns the operations data if it has a read-state, otherwise reads it and records its read-state."""
+        if self.bulk_read and not match_patterns:
+            # sets the read-state of the operation if it's satisfied by the bulk reader
+            if self.read_in_bulk(resource_node_name, operation_name, refresh=refresh):
+                refresh = False
+        read_state = self.get_read_state(resource_node_name, operation_name)
+        if read_state and refresh == False:  # noqa
+            # read before in this run, even if it had no data or failed
+            self._increment_read_stat("avoided_reads")
+            logger.debug(
+                f"[green]{resource_node_name}[/].[blue]{operation_name}[/] is already read, read-state: {read_state.state}"
+            )
+            if read_state.state == READ_STATE_FAILED:
+                return False, read_state.error
+            already_existing_data = self.search_operation_data(resource_node_name, operation_name) or []
+            if on_page:
+                for page in already_existing_data:
+                    on_page(page)
+            return already_existing_data
+
+        result = self._read_operation(
+            resource_node_name,
+            operation_name,
+            match_patterns=match_patterns,
+            refresh=refresh,
+            follow_pagination=follow_pagination,
+            max_workers=max_workers,
+            pipeline=pipeline,
+            on_page=on_page,
+            refresh_policy=refresh_policy,
+            refresh_max_age=refresh_max_age,
+        )
+        return self.set_operation_read_state(resource_node_name, operation_name, result, match_patterns)
+
+    def read_in_bulk(
+        self, resource_node_name: str, operation_name: str, refresh: Optional[bool] = False
+    ) -> bool:
+        """Reads the operation, and all other operations of its `BulkReader`, with the bulk api calls.
+        Their data is replaced with the bulk readers output, and their read-states are recorded.
+
+        Args:
+            resource_node_name (str): Name of the ResourceNode
+            operation_name (str): Name of the Operation
+            refresh (Optional[bool], optional): Re-make the bulk api calls. Defaults to False.
 
         Returns:
-            Tuple[Union[List, bool], Union[Error, None]]: _description_
+            bool: True if the operation is read by the bulk reader
         """
+        bulk_reader = find_bulk_reader(self.service_node.name)
+        if bulk_reader is None:
+            return False
+        resource_node = self.service_node.get_resource_node_by_name(resource_node_name)
+        if not resource_node or (resource_node.name, operation_name) not in bulk_reader.operation_keys:
+            return False
+        if self._bulk_read_failed and not refresh:
+            return False
+        if self._bulk_read_at is not None and not refresh and not self._bulk_refresh_pending:
+            return True
+        self._operation_flights.do(
+            ("__bulk_read__", self.service_node.name), self._read_in_bulk, bulk_reader, refresh
+        )
+        return self.get_read_state(resource_node.name, operation_name) is not None
+
+    def _read_in_bulk(self, bulk_reader: "BulkReader", refresh: bool) -> bool:
+        refresh = refresh or self._bulk_refresh_pending
+        # a concurrent bulk read may have finished while waiting
+        if self._bulk_read_at is not None and not refresh:
+            return True
+        self._bulk_refresh_pending = False
+        logger.debug(f"[underline][bold]Bulk reading[/] [green]{self.service_node.name}[/] with {type(bulk_reader).__name__}[/]")
+        bulk_data = bulk_reader.read(self, refresh=refresh)
+        if bulk_data is False:
+            self._bulk_read_failed = True
+            return False
+        for resource_node_name, operation_name in bulk_reader.operation_keys:
+            pages = bulk_data.get((resource_node_name, operation_name), [])
+            with self._response_data_lock:
+                self.response_data.setdefault(resource_node_name, {})[operation_name] = pages
+            self.set_operation_read_state(resource_node_name, operation_name, pages)
+        self._bulk_read_at = time.time()
+        self._bulk_read_failed = False
+        return True
+
+    def set_operation_read_state(
+        self,
+        resource_node_name: str,
+        operation_name: str,
+        result: Union[List, bool, Tuple, None],
+        match_patterns: Optional[List[str]] = None,
+    ) -> Union[List, Tuple[bool, Error], None]:
+        """Records the read-state of the operation from the result of reading it.
+        Successful reads filtered with `match_patterns` are partial, so they're not recorded.
+
+        Returns the result in the shape the later reads of the operation get from its read-state,
+        so every read returns the same value: the operations data, or a (False, Error) tuple if it failed.
+
+        Args:
+            resource_node_name (str): Name of the ResourceNode
+            operation_name (str): Name of the Operation
+            result (Union[List, bool, Tuple, None]): Returned value of the read, may be a (value, error) tuple.
+            match_patterns (Optional[List[str]], optional): Patterns the read is filtered with. Defaults to None.
+
+        Returns:
+            Union[List, Tuple[bool, Error], None]: Operations data, (False, Error), or None if the ResourceNode doesn't exist.
+        """
+        key = (resource_node_name, operation_name)
+        if result is None:
+            # resource node doesn't exist
+            return None
+        if isinstance(result, tuple):
+            result, error = result
+            if error is not None:
+                self.operation_read_states[key] = ReadState(READ_STATE_FAILED, error, time.time())
+                return False, error
+        if result is False:
+            error = Error(
+                "failed to read the operation",
+                {
+                    "service": self.service_node.name,
+                    "resource_node": resource_node_name,
+                    "operation_name": operation_name,
+                },
+            )
+            self.operation_read_states[key] = ReadState(READ_STATE_FAILED, error, time.time())
+            return False, error
+        # operations without any api calls have no data, but they're read
+        result = result or []
+        if match_patterns:
+            return result
+        resource_node = self.service_node.get_resource_node_by_name(resource_node_name)
+        is_empty = all(
+            self._is_response_empty(resource_node, operation_name, page)
+            for page in result
+        )
+        self.operation_read_states[key] = ReadState(
+            READ_STATE_EMPTY if is_empty else READ_STATE_COMPLETE, None, time.time()
+        )
+        return result
+
+    def is_operation_read_empty(self, resource_node_name: str, operation_name: str) -> bool:
+        """Checks if the operation is read without any resources, so the operations related to it have no api parameters.
+
+        Args:
+            resource_node_name (str): Name of the ResourceNode
+            operation_name (str): Name of the Operation
+
+        Returns:
+            bool: True if the read-state of the operation is `READ_STATE_EMPTY`
+        """
+        read_state = self.get_read_state(resource_node_name, operation_name)
+        return bool(read_state) and read_state.state == READ_STATE_EMPTY
+
+    def _read_operation(
+        self,
+        resource_node_name: str,
+        operation_name: str,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        pipeline: Optional[bool] = False,
+        on_page: Optional[Callable[[dict], None]] = None,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+    ) -> Tuple[Union[List, bool], Union[Error, None]]:
         # if it has been read called already, return it if refresh is not set
         operation_markup = (
             f"[bold][green]{self.service_node.name}[/].[blue]{operation_name}[/][/]"
@@ -207,6 +1186,9 @@ class ServiceReader:
             logger.debug(
                 f"[green]{resource_node.name}[/].[blue]{operation_name}[/] is already read. Returning already available data."
             )
+            if on_page:
+                for page in already_existing_data:
+                    on_page(page)
             return already_existing_data
 
         if not resource_node:
@@ -228,26 +1210,6 @@ class ServiceReader:
         )
         req_param_markup = f"[bold magenta]{', '.join(required_parameters)}[/]"
 
-        def api_parameters_match_pattern(
-            api_parameters: List[dict], patterns: List[str]
-        ) -> List[dict]:
-            if not patterns:
-                return api_parameters
-            matched_parameters = []
-
-            for api_param in api_parameters:
-                has_api_param_added = False
-                for api_param_value in api_param.values():
-                    for pattern in patterns:
-                        if (
-                            not has_api_param_added
-                            and fnmatch.fnmatch(api_param_value, pattern)
-                            and api_param not in matched_parameters
-                        ):
-                            matched_parameters.append(api_param)
-                            has_api_param_added = True
-            return matched_parameters
-
         if not success_finding_relations:
             logger.debug(f"[red]Error: {relations_error}: {operation_markup}")
             logger.debug(
@@ -277,32 +1239,67 @@ class ServiceReader:
                 logger.debug(
                     f"Successfuly generated api parameters for {operation_markup}, count: {len(generated_api_parameters)}"
                 )
+                # server-side filters replace the patterns they're translated from
+                generated_api_parameters, match_patterns = self.add_server_side_filters(
+                    resource_node, operation_name, generated_api_parameters, match_patterns
+                )
                 # filter generated_api_parameters if a pattern option is provided
-                api_parameters_for_operation = generated_api_parameters
-                if match_patterns:
-                    pattern_matched_api_parameters = api_parameters_match_pattern(
-                        generated_api_parameters, match_patterns
-                    )
-                    logger.debug(
-                        f"Matching patterns: {match_patterns}. Filtered the generated api parameters [{len(pattern_matched_api_parameters)}/{len(generated_api_parameters)}]"
-                    )
-                    api_parameters_for_operation = pattern_matched_api_parameters
-                for api_parameter in api_parameters_for_operation:
-                    # for each parameter generated, call the actual operation
-                    self.call_operation(resource_node, operation_name, api_parameter, follow_pagination=follow_pagination)
+                api_parameters_for_operation = self.filter_api_parameters(
+                    generated_api_parameters, match_patterns
+                )
+                self.call_operation_for_api_parameters(
+                    resource_node,
+                    operation_name,
+                    api_parameters_for_operation,
+                    follow_pagination=follow_pagination,
+                    max_workers=max_workers,
+                    on_page=on_page,
+                )
             # after calling the same operation for the different parameters
             # get all the response data made for this operation_name
             logger.debug(f"[underline][bold]Done Reading[/] {operation_markup}[/]")
-            return self.search_operation_data(resource_node_name, operation_name)
+            return self.search_operation_data(resource_node_name, operation_name) or []
 
         # OPERATION HAVE RELATIONS
+        is_derived = resource_node.is_operation_derived(operation_name)
+        if pipeline and len(relations_of_operation) == 1 and not is_derived:
+            return self._read_operation_pipelined(
+                resource_node,
+                operation_name,
+                relations_of_operation,
+                match_patterns=match_patterns,
+                refresh=refresh,
+                follow_pagination=follow_pagination,
+                max_workers=max_workers,
+                on_page=on_page,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
+            )
+
         all_related_operations_data = {}
 
         # for each relation, fetch the related resource's data.
         for rel in relations_of_operation:
             rel_operation_data = self.read_operation(
-                rel.resource_node_name, rel.operation_name, refresh=refresh, follow_pagination=follow_pagination
+                rel.resource_node_name,
+                rel.operation_name,
+                refresh=self.should_refresh_relation(
+                    rel.resource_node_name, rel.operation_name, refresh, refresh_policy, refresh_max_age
+                ),
+                follow_pagination=follow_pagination,
+                max_workers=max_workers,
+                pipeline=pipeline,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
             )
+            if isinstance(rel_operation_data, tuple):
+                # failed reads return a (value, error) tuple
+                rel_operation_data = rel_operation_data[0]
+            if not rel_operation_data and self.is_operation_read_empty(rel.resource_node_name, rel.operation_name):
+                logger.debug(
+                    f"There are no related resources in [blue]{rel.resource_node_name}.{rel.operation_name}[/] to read {operation_markup}."
+                )
+                return []
             if not rel_operation_data:
                 logger.debug(
                     f"[red]Failed to read related operation[/]: {rel.resource_node_name}.{rel.operation_name}"
@@ -313,6 +1310,12 @@ class ServiceReader:
             # gather all their related operations data, put it under a dict
             all_related_operations_data.update({rel.operation_name: rel_operation_data})
 
+        if is_derived:
+            # the responses are already in the related operations data
+            return self.save_derived_responses(
+                resource_node, operation_name, all_related_operations_data, match_patterns, on_page=on_page
+            )
+
         # send the operations_data to resource_node to create valid_api_parameters
         (
             generated_api_parameters,
@@ -333,24 +1336,23 @@ class ServiceReader:
             )
             inform_about_developing_custom_resource_nodes()
 
-            return False
+            return False, generation_error
         elif isinstance(generated_api_parameters, Iterable):
             logger.debug(
                 f"Successfuly generated api parameters for [bold blue]{operation_name}[/], count: {len(generated_api_parameters)}"
             )
             # filter generated_api_parameters if a pattern option is provided
-            api_parameters_for_operation = generated_api_parameters
-            if match_patterns:
-                pattern_matched_api_parameters = api_parameters_match_pattern(
-                    generated_api_parameters, match_patterns
-                )
-                logger.debug(
-                    f"Matching given patterns: {match_patterns}. Filtered the generated api parameters [{len(pattern_matched_api_parameters)}/{len(generated_api_parameters)}]"
-                )
-                api_parameters_for_operation = pattern_matched_api_parameters
-            for api_parameter in api_parameters_for_operation:
-                # for each parameter generated, call the actual operation
-                self.call_operation(resource_node, operation_name, api_parameter, follow_pagination=follow_pagination)
+            api_parameters_for_operation = self.filter_api_parameters(
+                generated_api_parameters, match_patterns
+            )
+            self.call_operation_for_api_parameters(
+                resource_node,
+                operation_name,
+                api_parameters_for_operation,
+                follow_pagination=follow_pagination,
+                max_workers=max_workers,
+                on_page=on_page,
+            )
         else:
             logger.debug(f"Failed to generate api parameters for {operation_markup}")
 
@@ -358,7 +1360,304 @@ class ServiceReader:
         # get all the response data made for this operation_name
         logger.debug(f"[underline][bold]Done Reading[/] {operation_markup}[/]")
 
-        return self.search_operation_data(resource_node_name, operation_name)
+        return self.search_operation_data(resource_node_name, operation_name) or []
+
+    def _read_operation_pipelined(
+        self,
+        resource_node: "ResourceNode",
+        operation_name: str,
+        relations_of_operation: List["Relation"],
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        on_page: Optional[Callable[[dict], None]] = None,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+    ) -> Union[List, bool]:
+        """Reads the related operation and generates the api parameters for each of its pages as soon as it's read.
+        Generated calls are dispatched to a thread pool immediately, while the related operation is still paginating.
+
+        Args:
+            resource_node (ResourceNode): Operations Resource Node
+            operation_name (str): Name of the operation
+            relations_of_operation (List[Relation]): The single relation of the operation
+            match_patterns (List[str], optional): UNIX style patterns to filter matching generated parameters. Defaults to None.
+            refresh (bool, optional): Force re-reading the related operations. Defaults to False.
+            follow_pagination (bool, optional): Follow pagination tokens. Defaults to False.
+            max_workers (int, optional): Number of concurrent calls made for the generated api parameters. Defaults to 1.
+            on_page (Callable[[dict], None], optional): Called with each page of this operation.
+            refresh_policy (str, optional): Which relations are re-read with `refresh`. Defaults to `REFRESH_POLICY_ALL`.
+            refresh_max_age (int, optional): Seconds the relations are fresh for `REFRESH_POLICY_STALE`. Defaults to 0.
+
+        Returns:
+            Union[List, bool]: Operations data or False
+        """
+        operation_markup = (
+            f"[bold][green]{self.service_node.name}[/].[blue]{operation_name}[/][/]"
+        )
+        rel = relations_of_operation[0]
+        dispatched_api_parameter_keys = set()
+        dispatch_lock = threading.Lock()
+        futures = []
+        # compiled once for all the related pages
+        pattern_matcher = PatternMatcher(match_patterns)
+
+        with ThreadPoolExecutor(max_workers=max_workers if max_workers and max_workers > 1 else 1) as executor:
+
+            def _dispatch_calls_for_related_page(related_page: dict) -> None:
+                # generation might fail for pages without any related resources, skip them
+                (
+                    generated_api_parameters,
+                    generation_error,
+                ) = resource_node.generate_api_parameters_from_operation_data(
+                    operation_name, relations_of_operation, {rel.operation_name: [related_page]}
+                )
+                if generation_error is not None or not isinstance(generated_api_parameters, Iterable):
+                    return
+                api_parameters_for_operation = api_parameters_match_pattern(
+                    generated_api_parameters, pattern_matcher
+                )
+                with dispatch_lock:
+                    for api_parameter in api_parameters_for_operation:
+                        api_parameter_key = canonicalize_api_parameter(api_parameter)
+                        if api_parameter_key in dispatched_api_parameter_keys:
+                            continue
+                        dispatched_api_parameter_keys.add(api_parameter_key)
+                        futures.append(
+                            executor.submit(
+                                self.call_operation,
+                                resource_node,
+                                operation_name,
+                                api_parameter,
+                                follow_pagination,
+                                on_page,
+                            )
+                        )
+
+            logger.debug(f"Pipelining {operation_markup} with its related operation: [blue]{rel.operation_name}[/]")
+            rel_operation_data = self.read_operation(
+                rel.resource_node_name,
+                rel.operation_name,
+                refresh=self.should_refresh_relation(
+                    rel.resource_node_name, rel.operation_name, refresh, refresh_policy, refresh_max_age
+                ),
+                follow_pagination=follow_pagination,
+                max_workers=max_workers,
+                pipeline=True,
+                on_page=_dispatch_calls_for_related_page,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
+            )
+            with dispatch_lock:
+                dispatched_futures = list(futures)
+            for future in dispatched_futures:
+                future.result()
+
+        if isinstance(rel_operation_data, tuple):
+            # failed reads return a (value, error) tuple
+            rel_operation_data = rel_operation_data[0]
+        if not rel_operation_data and self.is_operation_read_empty(rel.resource_node_name, rel.operation_name):
+            logger.debug(
+                f"There are no related resources in [blue]{rel.resource_node_name}.{rel.operation_name}[/] to read {operation_markup}."
+            )
+            return []
+        if not rel_operation_data:
+            logger.debug(
+                f"[red]Failed to read related operation[/]: {rel.resource_node_name}.{rel.operation_name}"
+            )
+            inform_about_developing_custom_resource_nodes()
+            return False
+
+        logger.debug(
+            f"[underline][bold]Done Reading[/] {operation_markup}[/], dispatched {len(dispatched_api_parameter_keys)} calls."
+        )
+        return self.search_operation_data(resource_node.name, operation_name) or []
+
+    def iter_operation_pages(
+        self,
+        resource_node_name: str,
+        operation_name: str,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+    ) -> Generator[dict, None, None]:
+        """Reads the given operation and yields its response pages as they're fetched.
+        Related operations are read and saved as usual, but the pages of this operation are not saved on
+        `self.response_data`, so unbounded inventories can be processed in constant memory.
+
+        Calls are made like `read_operation` makes them: duplicate api parameters are called once, and already made,
+        memoized or cached calls are reused. If the operation is already read, or it's read by the bulk reader,
+        its saved data is yielded instead.
+
+        Args:
+            resource_node_name (str): Name of the Resource Node
+            operation_name (str): Name of the Operation
+            match_patterns (List[str], optional): UNIX style patterns to filter matching generated parameters. Defaults to None.
+            refresh (bool, optional): Force re-reading the operation and its related operations. Defaults to False.
+            follow_pagination (bool, optional): Follow pagination tokens. If not only set True, one page call will be made.
+            max_workers (int, optional): Number of concurrent calls. Pages of the concurrent calls are yielded in the
+                                         order they arrive. Defaults to 1.
+            refresh_policy (str, optional): Which relations are re-read with `refresh`. Defaults to `REFRESH_POLICY_ALL`.
+            refresh_max_age (int, optional): Seconds the relations are fresh for `REFRESH_POLICY_STALE`. Defaults to 0.
+
+        Yields:
+            dict: Response page, with its `__args__`.
+        """
+        operation_markup = (
+            f"[bold][green]{self.service_node.name}[/].[blue]{operation_name}[/][/]"
+        )
+        resource_node = self.service_node.get_resource_node_by_name(resource_node_name)
+        if not resource_node:
+            logger.debug(
+                f"Failed to find the Resource Node while reading the {operation_markup}."
+            )
+            return
+
+        if self.bulk_read and not match_patterns:
+            if self.read_in_bulk(resource_node_name, operation_name, refresh=refresh):
+                refresh = False
+        read_state = self.get_read_state(resource_node_name, operation_name)
+        if read_state and refresh == False:  # noqa
+            self._increment_read_stat("avoided_reads")
+            if read_state.state != READ_STATE_FAILED:
+                yield from self.search_operation_data(resource_node_name, operation_name) or []
+            return
+
+        relations_of_operation, relations_error = resource_node.get_operations_relations(operation_name)
+        if relations_error is not None:
+            logger.debug(f"[red]Error: {relations_error}: {operation_markup}")
+            inform_about_developing_custom_resource_nodes()
+            return
+
+        all_related_operations_data = {}
+        has_required_parameters = relations_of_operation != True  # noqa
+        if not has_required_parameters:
+            # True means no required parameters, so no relations
+            relations_of_operation = []
+        for rel in relations_of_operation:
+            rel_operation_data = self.read_operation(
+                rel.resource_node_name,
+                rel.operation_name,
+                refresh=self.should_refresh_relation(
+                    rel.resource_node_name, rel.operation_name, refresh, refresh_policy, refresh_max_age
+                ),
+                follow_pagination=follow_pagination,
+                max_workers=max_workers,
+                refresh_policy=refresh_policy,
+                refresh_max_age=refresh_max_age,
+            )
+            if isinstance(rel_operation_data, tuple):
+                # failed reads return a (value, error) tuple
+                rel_operation_data = rel_operation_data[0]
+            if not rel_operation_data:
+                logger.debug(
+                    f"[red]Failed to read related operation[/]: {rel.resource_node_name}.{rel.operation_name}"
+                )
+                inform_about_developing_custom_resource_nodes()
+                return
+            all_related_operations_data.update({rel.operation_name: rel_operation_data})
+
+        if resource_node.is_operation_derived(operation_name):
+            derived_responses, derive_error = resource_node.derive_operation_responses(
+                operation_name, all_related_operations_data
+            )
+            if derive_error is not None:
+                logger.debug(f"Failed to derive the responses of {operation_markup}: {derive_error}")
+                return
+            matched_api_parameter_keys = {
+                canonicalize_api_parameter(api_parameter)
+                for api_parameter in api_parameters_match_pattern(
+                    [response["__args__"] for response in derived_responses], match_patterns
+                )
+            }
+            for response in derived_responses:
+                if canonicalize_api_parameter(response["__args__"]) in matched_api_parameter_keys:
+                    yield response
+            return
+
+        (
+            generated_api_parameters,
+            generation_error,
+        ) = resource_node.generate_api_parameters_from_operation_data(
+            operation_name, relations_of_operation, all_related_operations_data
+        )
+        if generation_error is not None or not isinstance(generated_api_parameters, Iterable):
+            logger.debug(
+                f"Failed to generate api parameters for {operation_markup}: {generation_error}"
+            )
+            inform_about_developing_custom_resource_nodes()
+            return
+
+        if not has_required_parameters:
+            generated_api_parameters, match_patterns = self.add_server_side_filters(
+                resource_node, operation_name, generated_api_parameters, match_patterns
+            )
+        api_parameters_for_operation = self.filter_api_parameters(generated_api_parameters, match_patterns)
+        yield from self._iter_pages_of_api_calls(
+            resource_node, operation_name, api_parameters_for_operation, follow_pagination, max_workers
+        )
+
+    def _iter_pages_of_api_calls(
+        self,
+        resource_node: "ResourceNode",
+        operation_name: str,
+        api_parameters: List[Dict],
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+    ) -> Generator[dict, None, None]:
+        """Makes the calls with `call_operation_for_api_parameters` in a thread without saving them,
+        and yields their pages. At most a few pages per worker are waiting to be consumed."""
+        page_queue = queue.Queue(maxsize=2 * max(max_workers or 1, 1))
+        stream_closed = threading.Event()
+        calls_done = object()
+        calls_exception = []
+
+        def _put(item) -> None:
+            while not stream_closed.is_set():
+                try:
+                    page_queue.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+            raise _PageStreamClosed()
+
+        def _make_calls() -> None:
+            try:
+                self.call_operation_for_api_parameters(
+                    resource_node,
+                    operation_name,
+                    api_parameters,
+                    follow_pagination=follow_pagination,
+                    max_workers=max_workers,
+                    on_page=_put,
+                    save=False,
+                )
+            except _PageStreamClosed:
+                return
+            except Exception as e:  # noqa
+                calls_exception.append(e)
+            try:
+                _put(calls_done)
+            except _PageStreamClosed:
+                pass
+
+        calls_thread = threading.Thread(target=_make_calls, daemon=True)
+        calls_thread.start()
+        try:
+            while True:
+                page = page_queue.get()
+                if page is calls_done:
+                    break
+                yield page
+        finally:
+            stream_closed.set()
+            calls_thread.join()
+        if calls_exception:
+            raise calls_exception[0]
 
     def read_resource_node(
         self,
@@ -366,14 +1665,24 @@ class ServiceReader:
         match_patterns: Optional[List[str]] = None,
         refresh: Optional[bool] = False,
         follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        pipeline: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
     ) -> Union[Dict, bool]:
-        """Reads all available operations in the given a resource node
+        """Reads all available operations in the given a resource node.
+        Operations are read by their dependency graph, independent operations are read concurrently.
 
         Args:
             resource_node_name (str): _description_
             match_patterns (List[str], optional): UNIX style patterns to filter the generated parameters. Defaults to None.
             refresh (Optional[bool], optional): Use the cached data or always make new calls. Defaults to False.
             follow_pagination (Optional[bool], optional): Follow pagination if the output is truncated.. Defaults to False.
+            max_workers (Optional[int], optional): Number of concurrent operations and calls made for
+                                                    the generated api parameters. Defaults to 1.
+            pipeline (Optional[bool], optional): Dispatch the dependent calls as soon as the related pages arrive. Defaults to False.
+            refresh_policy (Optional[str], optional): Which relations are re-read with `refresh`. Defaults to `REFRESH_POLICY_ALL`.
+            refresh_max_age (Optional[int], optional): Seconds the relations are fresh for `REFRESH_POLICY_STALE`. Defaults to 0.
 
         Returns:
             Union[Dict, bool]: Data read if successful, or False.
@@ -383,8 +1692,59 @@ class ServiceReader:
         if not resource_node:
             return False
 
-        for operation_name in resource_node.operation_names:
-            self.read_operation(
-                resource_node_name, operation_name, match_patterns, refresh=refresh, follow_pagination=follow_pagination
-            )
+        scheduler = OperationScheduler(self, max_workers=max_workers)
+        scheduler.add_resource_node(resource_node.name)
+        scheduler.run(
+            match_patterns=match_patterns,
+            refresh=refresh,
+            follow_pagination=follow_pagination,
+            pipeline=pipeline,
+            refresh_policy=refresh_policy,
+            refresh_max_age=refresh_max_age,
+        )
         return self.search_resource_node_data(resource_node.name)
+
+    def read_service(
+        self,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        max_workers: Optional[int] = 1,
+        pipeline: Optional[bool] = False,
+        refresh_policy: Optional[str] = REFRESH_POLICY_ALL,
+        refresh_max_age: Optional[int] = 0,
+    ) -> Tuple[Dict, Dict[str, Error]]:
+        """Reads all operations of every ResourceNode in the ServiceNode using their dependency graph.
+
+        Args:
+            match_patterns (List[str], optional): UNIX style patterns to filter the generated parameters. Defaults to None.
+            refresh (Optional[bool], optional): Use the cached data or always make new calls. Defaults to False.
+            follow_pagination (Optional[bool], optional): Follow pagination if the output is truncated.. Defaults to False.
+            max_workers (Optional[int], optional): Number of concurrent operations and calls made for
+                                                    the generated api parameters. Defaults to 1.
+            pipeline (Optional[bool], optional): Dispatch the dependent calls as soon as the related pages arrive. Defaults to False.
+            refresh_policy (Optional[str], optional): Which relations are re-read with `refresh`. Defaults to `REFRESH_POLICY_ALL`.
+            refresh_max_age (Optional[int], optional): Seconds the relations are fresh for `REFRESH_POLICY_STALE`. Defaults to 0.
+
+        Returns:
+            Tuple[Dict, Dict[str, Error]]: All read data of the ServiceNode and `ResourceNode.Operation` to Error mapping
+        """
+        scheduler = OperationScheduler(self, max_workers=max_workers)
+        scheduler.add_service()
+        scheduler.run(
+            match_patterns=match_patterns,
+            refresh=refresh,
+            follow_pagination=follow_pagination,
+            pipeline=pipeline,
+            refresh_policy=refresh_policy,
+            refresh_max_age=refresh_max_age,
+        )
+        errors = {
+            f"{resource_node_name}.{operation_name}": error
+            for (resource_node_name, operation_name), error in scheduler.errors.items()
+        }
+        for resource_node_name, operation_name in scheduler.dependencies.keys():
+            operation_error = self.get_operation_error(resource_node_name, operation_name)
+            if operation_error is not None:
+                errors.setdefault(f"{resource_node_name}.{operation_name}", operation_error)
+        return self.response_data, errors
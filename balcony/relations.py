@@ -8,6 +8,7 @@ from utils import icompare_two_camel_case_words
 from typing import List, Dict, Union
 import json
 import os
+import threading
 from dataclasses import dataclass
 
 
@@ -91,6 +92,8 @@ class RelationMap:
     def __init__(self, service_node):
         self.service_node = service_node
         self._relations_map: Dict = None
+        # relations are generated and saved to file only once when used from multiple threads
+        self._lock = threading.Lock()
 
 
     def serialize_relations_map(self, relations_map: Dict) -> Dict:
@@ -138,19 +141,20 @@ class RelationMap:
         Returns:
             Dict: `RelationMap` dictionary. parameter_name->[relations,] mapping.
         """
-        if self._relations_map is not None and not refresh:
+        with self._lock:
+            if self._relations_map is not None and not refresh:
+                return self._relations_map
+
+            loaded_relations_map = self.load_relations_from_file()
+            if loaded_relations_map and not refresh:
+                self._relations_map = self.deserialize_relation_map(loaded_relations_map)
+                return self._relations_map
+
+            generated_relations = self.generate_relation_map()
+            self._relations_map = generated_relations
+            self.save_relations_map_to_file(self.serialize_relations_map(self._relations_map))
             return self._relations_map
 
-        loaded_relations_map = self.load_relations_from_file()
-        if loaded_relations_map and not refresh:
-            self._relations_map = self.deserialize_relation_map(loaded_relations_map)
-            return self._relations_map
-
-        generated_relations = self.generate_relation_map()
-        self._relations_map = generated_relations
-        self.save_relations_map_to_file(self.serialize_relations_map(self._relations_map))
-        return self._relations_map
-
     def get_parameters_generated_relations(
         self, parameter_name: str, exclude_operation_name: str
     ) -> List[Dict]:
@@ -0,0 +1,248 @@
+from config import get_logger, BALCONY_RESPONSE_CACHE_PATH, DEFAULT_RESPONSE_CACHE_TTL
+from utils import canonicalize_api_parameter
+import base64
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Tuple, Optional, Union
+
+logger = get_logger(__name__)
+
+# (account_id, region, service_name)
+CacheScope = Tuple[str, str, str]
+
+
+def _encode_value(value):
+    """json.dumps `default` hook that tags the non-JSON types boto3 returns."""
+    if isinstance(value, datetime.datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"{type(value).__name__} can not be cached")
+
+
+def _decode_value(obj: Dict):
+    """json.loads `object_hook` that restores the tagged types."""
+    if len(obj) == 1:
+        if "__datetime__" in obj:
+            return datetime.datetime.fromisoformat(obj["__datetime__"])
+        if "__date__" in obj:
+            return datetime.date.fromisoformat(obj["__date__"])
+        if "__bytes__" in obj:
+            return base64.b64decode(obj["__bytes__"])
+    return obj
+
+
+class ResponseCache:
+    """Persistent cache of the AWS API responses, stored in a SQLite database under `BALCONY_CONFIG_DIR`.
+
+    Responses are cached per api call, keyed by the (account id, region, service) scope, the operation name,
+    the canonicalized api parameters and whether the pagination is followed.
+    Entries older than `ttl` seconds are ignored.
+
+    ```python title="Reusing the responses across BalconyAWS objects"
+    baws = BalconyAWS(response_cache=ResponseCache(ttl=600))
+    roles = baws.read_resource_node('iam', 'Role', follow_pagination=True)
+    ```
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = BALCONY_RESPONSE_CACHE_PATH,
+        ttl: Optional[int] = DEFAULT_RESPONSE_CACHE_TTL,
+    ) -> None:
+        """Initializes the cache. The database is created on first use.
+
+        Args:
+            db_path (Optional[str], optional): Path of the SQLite database. Defaults to `BALCONY_RESPONSE_CACHE_PATH`.
+            ttl (Optional[int], optional): Seconds a cached response is considered fresh. Defaults to `DEFAULT_RESPONSE_CACHE_TTL`.
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = None
+        self._connection_pid = None
+        # boto3 session -> account id
+        self._account_ids = {}
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # connections can't be shared with the forked processes
+        if self._connection is None or self._connection_pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.db_path, timeout=30, check_same_thread=False
+            )
+            self._connection_pid = os.getpid()
+            self._connection.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                    account_id TEXT,
+                    region TEXT,
+                    service TEXT,
+                    operation_name TEXT,
+                    api_parameter TEXT,
+                    follow_pagination INTEGER,
+                    created_at REAL,
+                    pages TEXT,
+                    PRIMARY KEY (account_id, region, service, operation_name, api_parameter, follow_pagination)
+                )"""
+            )
+            self._connection.commit()
+        return self._connection
+
+    def get_account_id(self, boto3_session) -> str:
+        """Finds the account id of the boto3 session with `sts:GetCallerIdentity`, called once per session.
+
+        Args:
+            boto3_session (boto3.session.Session): Session of the cached responses
+
+        Returns:
+            str: AWS account id
+        """
+        if boto3_session not in self._account_ids:
+            identity = boto3_session.client("sts").get_caller_identity()
+            self._account_ids[boto3_session] = identity["Account"]
+        return self._account_ids[boto3_session]
+
+    def _key(
+        self,
+        scope: CacheScope,
+        operation_name: str,
+        api_parameter: Dict,
+        follow_pagination: bool,
+    ) -> Tuple:
+        return (
+            *scope,
+            operation_name,
+            canonicalize_api_parameter(api_parameter),
+            int(bool(follow_pagination)),
+        )
+
+    def get(
+        self,
+        scope: CacheScope,
+        operation_name: str,
+        api_parameter: Dict,
+        follow_pagination: bool,
+    ) -> Union[List[dict], bool]:
+        """Gets the fresh cached response pages of an api call.
+
+        Args:
+            scope (CacheScope): (account_id, region, service_name)
+            operation_name (str): Name of the operation
+            api_parameter (Dict): api parameters the operation is called with
+            follow_pagination (bool): If the pagination tokens are followed
+
+        Returns:
+            Union[List[dict], bool]: Response pages or False if there's no fresh entry.
+        """
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    """SELECT created_at, pages FROM responses
+                    WHERE account_id=? AND region=? AND service=? AND operation_name=?
+                    AND api_parameter=? AND follow_pagination=?""",
+                    self._key(scope, operation_name, api_parameter, follow_pagination),
+                )
+                .fetchone()
+            )
+        if not row:
+            return False
+        created_at, pages = row
+        if time.time() - created_at > self.ttl:
+            return False
+        return json.loads(pages, object_hook=_decode_value)
+
+    def set(
+        self,
+        scope: CacheScope,
+        operation_name: str,
+        api_parameter: Dict,
+        follow_pagination: bool,
+        pages: List[dict],
+    ) -> bool:
+        """Saves the response pages of an api call.
+
+        Args:
+            scope (CacheScope): (account_id, region, service_name)
+            operation_name (str): Name of the operation
+            api_parameter (Dict): api parameters the operation is called with
+            follow_pagination (bool): If the pagination tokens are followed
+            pages (List[dict]): Response pages
+
+        Returns:
+            bool: False if the pages can't be serialized, e.g. streaming bodies.
+        """
+        try:
+            serialized_pages = json.dumps(pages, default=_encode_value)
+        except TypeError as e:
+            logger.debug(f"Not caching the response of [bold blue]{operation_name}[/]: {str(e)}")
+            return False
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    *self._key(scope, operation_name, api_parameter, follow_pagination),
+                    time.time(),
+                    serialized_pages,
+                ),
+            )
+            connection.commit()
+        return True
+
+    def get_created_at(self, scope: CacheScope, operation_name: str) -> Union[float, None]:
+        """Finds when the oldest fresh cached response of the operation was saved. Expired entries are ignored.
+
+        Args:
+            scope (CacheScope): (account_id, region, service_name)
+            operation_name (str): Name of the operation
+
+        Returns:
+            Union[float, None]: UNIX timestamp, or None if the operation has no fresh cached responses.
+        """
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    """SELECT MIN(created_at) FROM responses
+                    WHERE account_id=? AND region=? AND service=? AND operation_name=?
+                    AND created_at>=?""",
+                    (*scope, operation_name, time.time() - self.ttl),
+                )
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    def invalidate(self, scope: CacheScope, operation_name: Optional[str] = None) -> None:
+        """Deletes the cached responses of the scope, or only the given operations responses.
+
+        Args:
+            scope (CacheScope): (account_id, region, service_name)
+            operation_name (Optional[str], optional): Name of the operation. Defaults to None.
+        """
+        query = "DELETE FROM responses WHERE account_id=? AND region=? AND service=?"
+        parameters = tuple(scope)
+        if operation_name:
+            query += " AND operation_name=?"
+            parameters += (operation_name,)
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute(query, parameters)
+            connection.commit()
+
+    def clear(self) -> int:
+        """Deletes all cached responses.
+
+        Returns:
+            int: Number of deleted entries
+        """
+        with self._lock:
+            connection = self._get_connection()
+            deleted_count = connection.execute("DELETE FROM responses").rowcount
+            connection.commit()
+        return deleted_count
@@ -0,0 +1,172 @@
+from config import get_logger, set_log_level_at_runtime
+from response_cache import ResponseCache
+from rate_limiter import RateLimiterRegistry
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, List, Dict
+import multiprocessing
+import boto3
+import os
+
+logger = get_logger(__name__)
+
+# key of the errors in the scanned data of a service
+SCAN_ERRORS_KEY = "__errors__"
+
+# BalconyAWS of the current scan process, created by `_init_scan_process`
+_process_balcony_aws = None
+
+
+def get_session_config(boto3_session: boto3.session.Session) -> Dict:
+    """Creates the kwargs to re-create the boto3 session in another process.
+    Credentials are frozen, so assumed role credentials are passed as they are.
+
+    Args:
+        boto3_session (boto3.session.Session): boto3 session to re-create
+
+    Returns:
+        Dict: kwargs of `boto3.session.Session`
+    """
+    session_config = {"region_name": boto3_session.region_name}
+    credentials = boto3_session.get_credentials()
+    if credentials is not None:
+        frozen_credentials = credentials.get_frozen_credentials()
+        session_config.update(
+            {
+                "aws_access_key_id": frozen_credentials.access_key,
+                "aws_secret_access_key": frozen_credentials.secret_key,
+                "aws_session_token": frozen_credentials.token,
+            }
+        )
+    return session_config
+
+
+def _init_scan_process(
+    session_config: Dict,
+    merge_pages: bool,
+    bulk_read: bool,
+    lean_client: bool,
+    raw_timestamps: bool,
+    base64_blobs: bool,
+    response_cache_config: Optional[Dict],
+    rate_limiter_config: Optional[Dict],
+    log_level: int,
+) -> None:
+    """Creates the BalconyAWS of the scan process, it's reused for all services scanned in the process."""
+    global _process_balcony_aws
+    # imported here, custom ResourceNodes must be registered in the spawned process as well
+    import custom_nodes  # noqa: F401
+    from aws import BalconyAWS
+
+    set_log_level_at_runtime(log_level)
+    response_cache = None
+    if response_cache_config is not None:
+        response_cache = ResponseCache(**response_cache_config)
+    rate_limiters = None
+    if rate_limiter_config is not None:
+        rate_limiters = RateLimiterRegistry(**rate_limiter_config)
+    _process_balcony_aws = BalconyAWS(
+        boto3.session.Session(**session_config),
+        merge_pages=merge_pages,
+        response_cache=response_cache,
+        rate_limiters=rate_limiters,
+        bulk_read=bulk_read,
+        lean_client=lean_client,
+        raw_timestamps=raw_timestamps,
+        base64_blobs=base64_blobs,
+    )
+
+
+def scan_service(service_name: str, read_kwargs: Dict, balcony_aws: "BalconyAWS" = None) -> Dict:
+    """Reads all ResourceNodes of the service. Errors are added to the data by `ResourceNode.Operation` under `SCAN_ERRORS_KEY`.
+
+    Args:
+        service_name (str): Name of the AWS Service
+        read_kwargs (Dict): kwargs of `ServiceReader.read_service`
+        balcony_aws (BalconyAWS, optional): BalconyAWS to read with. Defaults to the one of the scan process.
+
+    Returns:
+        Dict: Read data of the service
+    """
+    balcony_aws = balcony_aws or _process_balcony_aws
+    try:
+        service_reader = balcony_aws.get_service_reader(service_name)
+        data, errors = service_reader.read_service(**read_kwargs)
+    except Exception as e:
+        logger.debug(f"[red]Failed to scan[/] [green]{service_name}[/]: {e}")
+        return {SCAN_ERRORS_KEY: {service_name: {"message": str(e), "context": None}}}
+
+    scanned_data = dict(data)
+    if errors:
+        scanned_data[SCAN_ERRORS_KEY] = {key: error.json() for key, error in errors.items()}
+    return scanned_data
+
+
+def scan_services(
+    balcony_aws: "BalconyAWS",
+    service_names: List[str],
+    max_processes: Optional[int] = None,
+    **read_kwargs,
+) -> Dict[str, Dict]:
+    """Scans the services on a process pool, each process reads its services with `read_kwargs["max_workers"]` threads.
+
+    Args:
+        balcony_aws (BalconyAWS): BalconyAWS to get the session and the configuration from
+        service_names (List[str]): Names of the AWS Services
+        max_processes (Optional[int], optional): Number of processes. Defaults to the number of CPUs.
+        **read_kwargs: kwargs of `ServiceReader.read_service`
+
+    Returns:
+        Dict[str, Dict]: service name to read data mapping
+    """
+    if max_processes is None:
+        max_processes = os.cpu_count() or 1
+    max_processes = min(max_processes, len(service_names))
+    if max_processes <= 1:
+        return {
+            service_name: scan_service(service_name, read_kwargs, balcony_aws)
+            for service_name in service_names
+        }
+
+    response_cache_config = None
+    if balcony_aws.response_cache is not None:
+        response_cache_config = {
+            "db_path": balcony_aws.response_cache.db_path,
+            "ttl": balcony_aws.response_cache.ttl,
+        }
+    rate_limiter_config = None
+    if balcony_aws.rate_limiters is not None:
+        rate_limiter_config = balcony_aws.rate_limiters.rate_limiter_kwargs
+    scanned_data = {}
+    # botocore sessions and the locks of the readers are not fork-safe
+    with ProcessPoolExecutor(
+        max_workers=max_processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_scan_process,
+        initargs=(
+            get_session_config(balcony_aws.boto3_session),
+            balcony_aws.merge_pages,
+            balcony_aws.bulk_read,
+            balcony_aws.lean_client,
+            balcony_aws.raw_timestamps,
+            balcony_aws.base64_blobs,
+            response_cache_config,
+            rate_limiter_config,
+            logger.getEffectiveLevel(),
+        ),
+    ) as executor:
+        futures = {
+            executor.submit(scan_service, service_name, read_kwargs): service_name
+            for service_name in service_names
+        }
+        for future in as_completed(futures):
+            service_name = futures[future]
+            try:
+                scanned_data[service_name] = future.result()
+            except Exception as e:
+                # e.g. the process is killed
+                scanned_data[service_name] = {
+                    SCAN_ERRORS_KEY: {service_name: {"message": str(e), "context": None}}
+                }
+            logger.debug(f"Scanned [green]{service_name}[/] ({len(scanned_data)}/{len(service_names)})")
+    return {service_name: scanned_data[service_name] for service_name in service_names}
@@ -0,0 +1,317 @@
+from config import get_logger
+from errors import Error
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import List, Dict, Tuple, Optional, Union
+
+logger = get_logger(__name__)
+
+# (resource_node_name, operation_name)
+OperationKey = Tuple[str, str]
+
+
+class OperationScheduler:
+    """Reads a set of operations by their dependency graph instead of plain recursion.
+
+    The graph is built from the `ResourceNode.get_operations_relations` of each operation.
+    Related operations(parents) are added to the graph as well, so shared parents are
+    read only once. Every operation that has all of its parents read is called concurrently,
+    so the wall-clock time is bounded by the longest chain of relations rather than the
+    sum of all calls.
+
+    ```python title="Reading all operations of iam Role and RolePolicy"
+    scheduler = OperationScheduler(service_reader, max_workers=8)
+    scheduler.add_resource_node("Role")
+    scheduler.add_resource_node("RolePolicy")
+    results = scheduler.run(follow_pagination=True)
+    ```
+    """
+
+    def __init__(self, service_reader: "ServiceReader", max_workers: Optional[int] = 1) -> None:
+        """Initializes the scheduler for the given ServiceReader.
+
+        Args:
+            service_reader (ServiceReader): ServiceReader to read the operations with.
+            max_workers (Optional[int], optional): Number of operations read concurrently. Defaults to 1.
+        """
+        self.service_reader = service_reader
+        self.service_node = service_reader.service_node
+        self.max_workers = max_workers if max_workers and max_workers > 1 else 1
+        # operations explicitly asked to be read
+        self.targets: List[OperationKey] = []
+        # operation -> operations it depends on
+        self.dependencies: Dict[OperationKey, List[OperationKey]] = {}
+        # operation -> operations depending on it
+        self.dependents: Dict[OperationKey, List[OperationKey]] = {}
+        # operation -> error raised while building the graph or reading it
+        self.errors: Dict[OperationKey, Error] = {}
+
+    def add_operation(self, resource_node_name: str, operation_name: str) -> Union[OperationKey, bool]:
+        """Adds the operation and all of its related operations to the graph.
+
+        Args:
+            resource_node_name (str): Name of the ResourceNode
+            operation_name (str): Name of the Operation
+
+        Returns:
+            Union[OperationKey, bool]: (resource_node_name, operation_name) key of the operation or False
+        """
+        key = self._add_to_graph(resource_node_name, operation_name)
+        if key and key not in self.targets:
+            self.targets.append(key)
+        return key
+
+    def add_resource_node(self, resource_node_name: str) -> List[OperationKey]:
+        """Adds all operations of the ResourceNode to the graph.
+
+        Args:
+            resource_node_name (str): Name of the ResourceNode
+
+        Returns:
+            List[OperationKey]: Keys of the added operations
+        """
+        resource_node = self.service_node.get_resource_node_by_name(resource_node_name)
+        if not resource_node:
+            return []
+        added_keys = []
+        for operation_name in resource_node.operation_names:
+            key = self.add_operation(resource_node.name, operation_name)
+            if key:
+                added_keys.append(key)
+        return added_keys
+
+    def add_service(self) -> List[OperationKey]:
+        """Adds every operation of every ResourceNode in the ServiceNode to the graph.
+
+        Returns:
+            List[OperationKey]: Keys of the added operations
+        """
+        added_keys = []
+        for resource_node in self.service_node.get_resource_nodes():
+            added_keys.extend(self.add_resource_node(resource_node.name))
+        return added_keys
+
+    def _add_to_graph(self, resource_node_name: str, operation_name: str) -> Union[OperationKey, bool]:
+        resource_node = self.service_node.get_resource_node_by_name(resource_node_name)
+        if not resource_node:
+            logger.debug(
+                f"Scheduler: Failed to find the Resource Node [green]{resource_node_name}[/] for [blue]{operation_name}[/]."
+            )
+            return False
+
+        key = (resource_node.name, operation_name)
+        if key in self.dependencies:
+            # already in the graph with its relations
+            return key
+
+        self.dependencies[key] = []
+        self.dependents.setdefault(key, [])
+
+        relations, relations_error = resource_node.get_operations_relations(operation_name)
+        if relations_error is not None:
+            # read_operation will fail the same way, no need to add the relations
+            self.errors[key] = relations_error
+            return key
+        if relations is True:
+            # no required parameters, so no relations
+            return key
+
+        for rel in relations:
+            related_key = self._add_to_graph(rel.resource_node_name, rel.operation_name)
+            if not related_key or related_key == key or related_key in self.dependencies[key]:
+                continue
+            self.dependencies[key].append(related_key)
+            self.dependents.setdefault(related_key, []).append(key)
+        return key
+
+    def find_cyclic_operations(self) -> List[OperationKey]:
+        """Finds the operations that are part of, or depend on, a cycle of relations.
+
+        Returns:
+            List[OperationKey]: Operations that can't be ordered. Empty list if the graph is a DAG.
+        """
+        in_degrees = {key: len(deps) for key, deps in self.dependencies.items()}
+        ready = [key for key, degree in in_degrees.items() if degree == 0]
+        while ready:
+            key = ready.pop()
+            for dependent_key in self.dependents.get(key, []):
+                in_degrees[dependent_key] -= 1
+                if in_degrees[dependent_key] == 0:
+                    ready.append(dependent_key)
+        return [key for key, degree in in_degrees.items() if degree > 0]
+
+    def _find_target_dependencies(self) -> Dict[OperationKey, List[OperationKey]]:
+        """Finds the closest targets each target depends on, looking through the non-target operations.
+        Used in pipeline mode, where the non-target relations are read within their dependents.
+
+        Returns:
+            Dict[OperationKey, List[OperationKey]]: target operation -> target operations it depends on
+        """
+        target_dependencies = {}
+        for target_key in self.targets:
+            found_targets = []
+            visited = set()
+            to_visit = list(self.dependencies.get(target_key, []))
+            while to_visit:
+                key = to_visit.pop()
+                if key in visited:
+                    continue
+                visited.add(key)
+                if key in self.targets:
+                    found_targets.append(key)
+                else:
+                    to_visit.extend(self.dependencies.get(key, []))
+            target_dependencies[target_key] = found_targets
+        return target_dependencies
+
+    def _read_operation(
+        self,
+        key: OperationKey,
+        match_patterns: Optional[List[str]],
+        follow_pagination: bool,
+        pipeline: bool,
+    ) -> Union[List, bool]:
+        resource_node_name, operation_name = key
+        if key not in self.targets:
+            # patterns are only applied to the requested operations, not their relations
+            match_patterns = None
+        try:
+            result = self.service_reader.read_operation(
+                resource_node_name,
+                operation_name,
+                match_patterns,
+                refresh=False,
+                follow_pagination=follow_pagination,
+                max_workers=self.max_workers,
+                pipeline=pipeline,
+            )
+        except Exception as e:
+            # e.g. connection errors, only the operation and its dependents fail
+            logger.debug(
+                f"Scheduler: [red]Failed to read[/] [green]{resource_node_name}[/].[blue]{operation_name}[/]: {e}"
+            )
+            self.errors[key] = Error(
+                "failed to read the operation",
+                {
+                    "service": self.service_node.name,
+                    "resource_node": resource_node_name,
+                    "operation_name": operation_name,
+                    "exception": str(e),
+                },
+            )
+            return False
+        # read_operation may return a (value, error) tuple on failures
+        if isinstance(result, tuple):
+            result, error = result
+            if error is not None:
+                self.errors[key] = error
+        return result
+
+    def run(
+        self,
+        match_patterns: Optional[List[str]] = None,
+        refresh: Optional[bool] = False,
+        follow_pagination: Optional[bool] = False,
+        pipeline: Optional[bool] = False,
+        refresh_policy: Optional[str] = "all",
+        refresh_max_age: Optional[int] = 0,
+    ) -> Dict[OperationKey, Union[List, bool]]:
+        """Reads all operations in the graph. Operations whose relations are read are called concurrently.
+        If a related operation fails or returns no data, its dependents are skipped.
+
+        In `pipeline` mode only the added operations are scheduled, their other relations are
+        pipelined by `ServiceReader.read_operation` while they're being read.
+
+        Args:
+            match_patterns (Optional[List[str]], optional): UNIX style patterns to filter the generated parameters
+                                                            of the added operations. Defaults to None.
+            refresh (Optional[bool], optional): Clear the already read data of the operations in the graph. Defaults to False.
+            follow_pagination (Optional[bool], optional): Follow pagination tokens. Defaults to False.
+            pipeline (Optional[bool], optional): Pipeline the relations that are not added. Defaults to False.
+            refresh_policy (Optional[str], optional): Which relations of the added operations are cleared with `refresh`,
+                                                      see `ServiceReader.should_refresh_relation`. Defaults to "all".
+            refresh_max_age (Optional[int], optional): Seconds the relations are fresh for the "stale" policy. Defaults to 0.
+
+        Returns:
+            Dict[OperationKey, Union[List, bool]]: (resource_node_name, operation_name) to read data mapping.
+        """
+        results = {}
+        cyclic_operations = self.find_cyclic_operations()
+        for key in cyclic_operations:
+            logger.debug(f"Scheduler: [red]Cyclic relations found[/] for [green]{key[0]}[/].[blue]{key[1]}[/]")
+            self.errors[key] = Error(
+                "cyclic relations",
+                {
+                    "service": self.service_node.name,
+                    "resource_node": key[0],
+                    "operation_name": key[1],
+                },
+            )
+            results[key] = False
+
+        if refresh:
+            # clear beforehand, so the shared parents are read only once
+            operations_to_clear = [
+                key
+                for key in self.dependencies.keys()
+                if key in self.targets
+                or self.service_reader.should_refresh_relation(
+                    key[0], key[1], refresh, refresh_policy, refresh_max_age
+                )
+            ]
+            for resource_node_name, operation_name in operations_to_clear:
+                self.service_reader.clear_operations_data(resource_node_name, operation_name)
+
+        dependencies = self.dependencies
+        if pipeline:
+            dependencies = self._find_target_dependencies()
+        dependents = {}
+        for key, deps in dependencies.items():
+            for dependency_key in deps:
+                dependents.setdefault(dependency_key, []).append(key)
+
+        remaining_dependencies = {
+            key: len(deps) for key, deps in dependencies.items() if key not in results
+        }
+        ready = [key for key, degree in remaining_dependencies.items() if degree == 0]
+        logger.debug(
+            f"Scheduler: Reading {len(remaining_dependencies)} operations of [green]{self.service_node.name}[/] with {self.max_workers} workers."
+        )
+
+        def _skip_dependents(failed_key: OperationKey) -> None:
+            for dependent_key in dependents.get(failed_key, []):
+                if dependent_key in results:
+                    continue
+                logger.debug(
+                    f"Scheduler: Skipping [green]{dependent_key[0]}[/].[blue]{dependent_key[1]}[/], "
+                    f"its related operation {failed_key[0]}.{failed_key[1]} has no data."
+                )
+                results[dependent_key] = False
+                _skip_dependents(dependent_key)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {}
+
+            def _submit_ready_operations():
+                while ready:
+                    key = ready.pop(0)
+                    if key in results:
+                        continue
+                    future = executor.submit(self._read_operation, key, match_patterns, follow_pagination, pipeline)
+                    pending[future] = key
+
+            _submit_ready_operations()
+            while pending:
+                done_futures, _ = wait(list(pending.keys()), return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    key = pending.pop(future)
+                    results[key] = future.result()
+                    if not results[key]:
+                        _skip_dependents(key)
+                        continue
+                    for dependent_key in dependents.get(key, []):
+                        remaining_dependencies[dependent_key] -= 1
+                        if remaining_dependencies[dependent_key] == 0:
+                            ready.append(dependent_key)
+                _submit_ready_operations()
+
+        return results
@@ -0,0 +1,68 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.thread_id = threading.get_ident()
+        self.result = None
+        self.exception = None
+
+
+class SingleFlight:
+    """Coordinates concurrent calls of the same key, so only one of them does the work.
+
+    The first caller of a key runs the function, the concurrent callers of the same key wait for it and
+    share its result or exception. A key is forgotten as soon as its call is finished, so later calls run again.
+
+    ```python title="Reading an operation once for concurrent callers"
+    flights = SingleFlight()
+    result, shared = flights.do(("Role", "ListRoles"), read_list_roles)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Tuple[Any, bool]:
+        """Runs `func(*args, **kwargs)` for the key, or waits for the in-flight call of the same key.
+        Calls of the same key from the thread that is running it are not coordinated, so recursion can't deadlock.
+
+        Args:
+            key (Hashable): Key of the call
+            func (Callable): Function to run
+
+        Raises:
+            Exception: Exception raised by the function, re-raised in the waiting callers as well.
+
+        Returns:
+            Tuple[Any, bool]: (result, shared) tuple, `shared` is True if the result is of another callers call.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = _Flight()
+                self._flights[key] = flight
+
+        if not is_leader:
+            if flight.thread_id == threading.get_ident():
+                # re-entered from the running call
+                return func(*args, **kwargs), False
+            flight.done.wait()
+            if flight.exception is not None:
+                raise flight.exception
+            return flight.result, True
+
+        try:
+            flight.result = func(*args, **kwargs)
+        except BaseException as e:
+            flight.exception = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return flight.result, False
@@ -1,8 +1,10 @@
 from collections import Counter
 from re import finditer, compile, match
 import textwrap
-from typing import List
+from typing import List, Dict
 import inflect
+import json
+import jmespath
 import os
 import boto3
 from config import get_logger, YAML_IGNORE_PREFIX
@@ -19,6 +21,18 @@ _camel_case_regex_compiled = compile(
 _terraform_aws_resource_type_pattern_compiled = compile(r"^aws_[a-zA-Z0-9_-]+$")
 
 
+def canonicalize_api_parameter(api_parameter: Dict) -> str:
+    """Creates a stable string key for an api parameter dict, regardless of its key order.
+
+    Args:
+        api_parameter (Dict): API parameters to call an operation with
+
+    Returns:
+        str: Canonical JSON string of the api parameter
+    """
+    return json.dumps(api_parameter, sort_keys=True, default=str)
+
+
 def jmespath_search(jmespath_expression, data):
     return jmespath.search(
         jmespath_expression,
@@ -153,6 +167,19 @@ def get_all_available_services(session: boto3.session.Session) -> List[str]:
     return session.get_available_services()
 
 
+def get_enabled_regions(session: boto3.session.Session, service_name: str) -> List[str]:
+    """Gets the regions the service is available in and enabled for the account.
+    Falls back to all available regions of the service if the enabled regions can't be read."""
+    available_regions = session.get_available_regions(service_name)
+    try:
+        described_regions = session.client("ec2").describe_regions()["Regions"]
+    except Exception as e:
+        logger.debug(f"Failed to describe the enabled regions: {e}")
+        return available_regions
+    enabled_regions = [region["RegionName"] for region in described_regions]
+    return [region for region in available_regions if region in enabled_regions]
+
+
 def compare_nouns(word1: str, word2: str) -> bool:
     """Singular/plural insensitive word comparison"""
     return inflect_engine.compare_nouns(word1, word2)
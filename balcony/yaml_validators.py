@@ -28,6 +28,15 @@ class YamlComplementApiParameterAction(BaseModel):
         return v
 
 
+class YamlDeriveOperation(BaseModel):
+    """Defines how the responses of an operation are derived from its related operations data, instead of calling AWS.
+    Each item found with the `selector` jmespath becomes a response: `output` jmespath is searched on the item,
+    and its `__args__` are rendered from the `api_parameters` jinja2 templates with the `item` variable."""
+    selector: str
+    output: str
+    api_parameters: Dict[str, str]
+
+
 class YamlResourceNodeOperation(BaseModel):
     """Defines the customizations for a specific operation in a Resource Node."""
     operation_name: str
@@ -37,6 +46,7 @@ class YamlResourceNodeOperation(BaseModel):
     override_api_parameters: Optional[List[Dict[str, Any]]]
     pagination_token_mapping: Optional[Dict[str, str]]
     required_parameters: Optional[List[str]]
+    derive: Optional[YamlDeriveOperation]
 
 
 class YamlServiceResourceNode(BaseModel):
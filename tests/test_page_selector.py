@@ -0,0 +1,59 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "balcony"))
+
+from page_selector import PageSelector  # noqa: E402
+
+PAGES = [
+    {
+        "Reservations": [
+            {"Instances": [{"InstanceId": "a", "State": {"Name": "running"}}]},
+            {"Instances": [{"InstanceId": "b", "State": {"Name": "stopped"}}]},
+        ],
+        "__args__": {"MaxResults": 1000},
+    },
+    {
+        "Reservations": [{"Instances": [{"InstanceId": "c", "State": {"Name": "running"}}]}],
+        "__args__": {"MaxResults": 1000, "NextToken": "1"},
+    },
+]
+
+
+def _assert_same_as_whole_result(page_selector, read_data, empty_read_data):
+    assert page_selector.is_incremental
+    assert page_selector.search_pages(iter(PAGES)) == page_selector.search(read_data)
+    assert page_selector.search_pages(iter([])) == page_selector.search(empty_read_data)
+
+
+def test_selected_operation_pages():
+    # `read_operation` returns the list of the operation's pages
+    for selector in [
+        "[].Reservations[].Instances[].InstanceId",
+        "[*].Reservations[*].Instances[*].InstanceId",
+        "[].Reservations[].Instances[?State.Name == 'running'].InstanceId[]",
+        "[?__args__.NextToken].Reservations[]",
+    ]:
+        page_selector = PageSelector(selector, operation_name="DescribeInstances")
+        _assert_same_as_whole_result(page_selector, PAGES, [])
+    assert page_selector.search_pages(iter(PAGES)) == [{"Instances": [{"InstanceId": "c", "State": {"Name": "running"}}]}]
+
+
+def test_resource_node_pages():
+    # `read_resource_node` returns the pages by their operation names
+    read_data = {"DescribeInstances": PAGES}
+    for selector in [
+        "DescribeInstances[].Reservations[].Instances[].InstanceId",
+        "DescribeInstances[].Reservations[] | [].Instances[].InstanceId",
+        "DescribeInstances[].Reservations[].Instances[?State.Name == 'running'].InstanceId[]",
+    ]:
+        page_selector = PageSelector(selector)
+        assert page_selector.operation_name == "DescribeInstances"
+        _assert_same_as_whole_result(page_selector, read_data, {"DescribeInstances": []})
+
+
+def test_not_incremental_selectors():
+    assert not PageSelector("[0].Reservations", operation_name="DescribeInstances").is_incremental
+    assert not PageSelector("DescribeInstances[].Reservations[]", operation_name="DescribeInstances").is_incremental
+    assert not PageSelector("[].Reservations[]").is_incremental
+    assert not PageSelector("length(DescribeInstances)").is_incremental